@@ -0,0 +1,50 @@
+import gzip
+from typing import IO, Any, Literal, Optional, Tuple, cast
+
+from dlt import version
+from dlt.common.exceptions import MissingDependencyException
+
+
+TCompressionCodec = Literal["gzip", "zstd", "lz4"]
+"""Codecs used to compress intermediary files. `gzip` is supported by all destinations"""
+
+CODEC_MAGIC_NUMBERS: Tuple[Tuple[TCompressionCodec, bytes], ...] = (
+    ("gzip", b"\x1f\x8b"),
+    ("zstd", b"\x28\xb5\x2f\xfd"),
+    ("lz4", b"\x04\x22\x4d\x18"),
+)
+
+
+def open_compressed(path: str, mode: str, codec: TCompressionCodec = "gzip", level: int = None, **kwargs: Any) -> IO[Any]:
+    """Opens file at `path` with compression `codec`. `level` is codec specific, codec default is used if not set"""
+    if codec == "gzip":
+        if level is not None:
+            kwargs["compresslevel"] = level
+        return cast(IO[Any], gzip.open(path, mode, **kwargs))
+    if codec == "zstd":
+        try:
+            import zstandard
+        except ModuleNotFoundError:
+            raise MissingDependencyException("zstd compression", [f"{version.DLT_PKG_NAME}[zstd]"])
+        if level is not None and "r" not in mode:
+            kwargs["cctx"] = zstandard.ZstdCompressor(level=level)
+        return cast(IO[Any], zstandard.open(path, mode, **kwargs))
+    if codec == "lz4":
+        try:
+            import lz4.frame
+        except ModuleNotFoundError:
+            raise MissingDependencyException("lz4 compression", [f"{version.DLT_PKG_NAME}[lz4]"])
+        if level is not None:
+            kwargs["compression_level"] = level
+        return cast(IO[Any], lz4.frame.open(path, mode, **kwargs))
+    raise ValueError(codec)
+
+
+def detect_compression_codec(path: str) -> Optional[TCompressionCodec]:
+    """Detects compression codec of a file under `path` from its magic number, returns None if file is not compressed"""
+    with open(path, "rb") as f:
+        header = f.read(4)
+    for codec, magic in CODEC_MAGIC_NUMBERS:
+        if header.startswith(magic):
+            return codec
+    return None
@@ -1,3 +1,3 @@
 from dlt.common.data_writers.writers import DataWriter, TLoaderFileFormat
-from dlt.common.data_writers.buffered import BufferedDataWriter
+from dlt.common.data_writers.buffered import BufferedDataWriter, WriterMemoryBudget, BackgroundWriterThread
 from dlt.common.data_writers.escape import escape_redshift_literal, escape_redshift_identifier, escape_bigquery_identifier
\ No newline at end of file
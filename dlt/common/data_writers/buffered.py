@@ -1,7 +1,11 @@
-import gzip
-from functools import reduce
-from typing import List, IO, Any, Optional, Type, TypeVar, Generic
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial, reduce
+from typing import Callable, Dict, List, IO, Any, Optional, Tuple, Type, TypeVar, Generic
 
+from dlt.common.compression import TCompressionCodec, open_compressed
 from dlt.common.utils import uniq_id
 from dlt.common.typing import TDataItem, TDataItems
 from dlt.common.data_writers import TLoaderFileFormat
@@ -16,6 +20,124 @@ from dlt.common.destination import DestinationCapabilitiesContext
 TWriter = TypeVar("TWriter", bound=DataWriter)
 
 
+def estimate_item_size(item: Any, sample_size: int = 8) -> int:
+    """Estimates memory taken by a data item. Uses `nbytes` of arrow tables and record batches and walks nested python containers
+    without recursion. Only `sample_size` elements of longer lists are measured and their size is extrapolated to the whole list.
+    """
+    if hasattr(item, "nbytes"):
+        return int(item.nbytes)
+    size = 0.0
+    stack: List[Tuple[Any, float]] = [(item, 1.0)]
+    while stack:
+        value, weight = stack.pop()
+        size += sys.getsizeof(value) * weight
+        if isinstance(value, dict):
+            stack.extend((v, weight) for v in value.values())
+        elif isinstance(value, (list, tuple)) and value:
+            sample = value[::max(1, len(value) // sample_size)][:sample_size]
+            stack.extend((v, weight * len(value) / len(sample)) for v in sample)
+    return int(size)
+
+
+class WriterMemoryBudget:
+    """Memory budget shared by all buffered writers of a data item storage.
+
+    When sum of bytes buffered in all writers exceeds `max_buffered_bytes`, the writers with the largest buffers are flushed
+    until half of the budget is free. When more than `max_open_files` writers hold an open file, the file of the least
+    recently used writer is rotated (closed and committed) so the number of open handles is bounded.
+    """
+
+    @configspec
+    class WriterMemoryBudgetConfiguration(BaseConfiguration):
+        max_buffered_bytes: Optional[int] = None
+        """Max bytes buffered in all writers of a storage, estimated from in-memory size of the items"""
+        max_open_files: Optional[int] = None
+        """Max number of files kept open by all writers of a storage"""
+
+        __section__ = known_sections.DATA_WRITER
+
+
+    @with_config(spec=WriterMemoryBudgetConfiguration)
+    def __init__(self, *, max_buffered_bytes: int = None, max_open_files: int = None) -> None:
+        self.max_buffered_bytes = max_buffered_bytes
+        self.max_open_files = max_open_files
+        self.buffered_bytes = 0
+        self._buffering: Dict[int, "BufferedDataWriter[Any]"] = {}
+        self._open_files: "OrderedDict[int, BufferedDataWriter[Any]]" = OrderedDict()
+
+    def on_buffered(self, writer: "BufferedDataWriter[Any]", size: int) -> None:
+        """Called by `writer` that added `size` bytes to its buffer, flushes the largest buffers if budget is exceeded"""
+        self.buffered_bytes += size
+        self._buffering[id(writer)] = writer
+        if self.buffered_bytes > self.max_buffered_bytes:
+            low_watermark = self.max_buffered_bytes // 2
+            for largest in sorted(self._buffering.values(), key=lambda w: w._buffered_items_bytes, reverse=True):
+                if self.buffered_bytes <= low_watermark:
+                    break
+                largest._flush_items()
+
+    def on_flushed(self, writer: "BufferedDataWriter[Any]", size: int) -> None:
+        self.buffered_bytes -= size
+        self._buffering.pop(id(writer), None)
+
+    def on_file_used(self, writer: "BufferedDataWriter[Any]") -> None:
+        """Marks file of the `writer` as most recently used, rotates least recently used files above the open files limit"""
+        writer_id = id(writer)
+        if writer_id in self._open_files:
+            self._open_files.move_to_end(writer_id)
+            return
+        self._open_files[writer_id] = writer
+        while self.max_open_files and len(self._open_files) > self.max_open_files:
+            _, lru_writer = self._open_files.popitem(last=False)
+            # close the file holding the lock of the writer file state, buffered items will be written to a new file
+            lru_writer._locked_file_op(lru_writer._close_file)
+
+    def on_file_closed(self, writer: "BufferedDataWriter[Any]") -> None:
+        self._open_files.pop(id(writer), None)
+
+
+class BackgroundWriterThread:
+    """Writes buffers of all writers of a data item storage on a single background thread.
+
+    Writers with `background_flush` enabled hand off full buffers and the thread serializes, compresses and rotates the files,
+    so those overlap with producing the data. At most `max_pending_flushes` buffers wait for the thread, writers block when
+    handing off more.
+    """
+
+    @configspec
+    class BackgroundWriterThreadConfiguration(BaseConfiguration):
+        max_pending_flushes: int = 4
+        """Max number of buffers waiting to be written by the background thread"""
+
+        __section__ = known_sections.DATA_WRITER
+
+
+    @with_config(spec=BackgroundWriterThreadConfiguration)
+    def __init__(self, *, max_pending_flushes: int = 4) -> None:
+        self.max_pending_flushes = max_pending_flushes
+        self._slots = threading.BoundedSemaphore(max_pending_flushes)
+        self._executor: ThreadPoolExecutor = None
+
+    def submit(self, f: Callable[..., None], *args: Any) -> "Future[None]":
+        """Submits `f` to be executed on the background thread, blocks if max pending flushes is reached"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dlt_writer")
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(f, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def shutdown(self) -> None:
+        """Waits for all pending flushes and stops the thread. The thread is started again on next submit"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
 class BufferedDataWriter(Generic[TWriter]):
 
     @configspec
@@ -24,6 +146,12 @@ class BufferedDataWriter(Generic[TWriter]):
         file_max_items: Optional[int] = None
         file_max_bytes: Optional[int] = None
         disable_compression: bool = False
+        compression_codec: TCompressionCodec = "gzip"
+        """Codec used to compress files. Files in load packages produced by normalize are always gzip compressed"""
+        compression_level: Optional[int] = None
+        """Codec specific compression level, codec default is used if not set"""
+        background_flush: bool = False
+        """Write buffers on a background thread shared by all writers of a storage"""
         _caps: Optional[DestinationCapabilitiesContext] = None
 
         __section__ = known_sections.DATA_WRITER
@@ -39,7 +167,12 @@ class BufferedDataWriter(Generic[TWriter]):
         file_max_items: int = None,
         file_max_bytes: int = None,
         disable_compression: bool = False,
-        _caps: DestinationCapabilitiesContext = None
+        compression_codec: TCompressionCodec = "gzip",
+        compression_level: int = None,
+        background_flush: bool = False,
+        _caps: DestinationCapabilitiesContext = None,
+        memory_budget: WriterMemoryBudget = None,
+        writer_thread: Callable[[], BackgroundWriterThread] = None
     ):
         self.file_format = file_format
         self._file_format_spec = DataWriter.data_format_from_file_format(self.file_format)
@@ -53,26 +186,42 @@ class BufferedDataWriter(Generic[TWriter]):
         self.buffer_max_items = min(buffer_max_items, file_max_items or buffer_max_items)
         self.file_max_bytes = file_max_bytes
         self.file_max_items = file_max_items
-        # the open function is either gzip.open or open
-        self.open = gzip.open if self._file_format_spec.supports_compression and not disable_compression else open
+        # the open function either compresses with configured codec or is a regular open
+        self.open: Callable[..., IO[Any]]
+        if self._file_format_spec.supports_compression and not disable_compression:
+            self.open = partial(open_compressed, codec=compression_codec, level=compression_level)
+        else:
+            self.open = open
 
         self._current_columns: TTableSchemaColumns = None
         self._file_name: str = None
         self._buffered_items: List[TDataItem] = []
         self._buffered_items_count: int = 0
+        # bytes are estimated only when the writer participates in the memory budget
+        self._memory_budget = memory_budget if memory_budget and memory_budget.max_buffered_bytes else None
+        self._open_files_budget = memory_budget if memory_budget and memory_budget.max_open_files else None
+        self._buffered_items_bytes: int = 0
+        # files are written on the thread returned by `writer_thread` if enabled, pending flushes are checked for errors
+        self._writer_thread = writer_thread() if background_flush and writer_thread else None
+        self._pending_flushes: List["Future[None]"] = []
+        # file and writer state below is changed only holding the lock, by the background thread if enabled
+        self._file_lock = threading.RLock()
         self._writer: TWriter = None
+        self._writer_columns: TTableSchemaColumns = None
         self._file: IO[Any] = None
         self._closed = False
         try:
-            self._rotate_file()
+            self._next_file_name()
         except TypeError:
             raise InvalidFileNameTemplateException(file_name_template)
 
     def write_data_item(self, item: TDataItems, columns: TTableSchemaColumns) -> None:
         self._ensure_open()
+        self._check_pending_flushes()
         # rotate file if columns changed and writer does not allow for that
         # as the only allowed change is to add new column (no updates/deletes), we detect the change by comparing lengths
-        if self._writer and not self._writer.data_format().supports_schema_changes and len(columns) != len(self._current_columns):
+        # background thread does that itself when writing items as it owns the file state
+        if not self._writer_thread and self._writer and not self._file_format_spec.supports_schema_changes and len(columns) != len(self._current_columns):
             assert len(columns) > len(self._current_columns)
             self._rotate_file()
         # until the first chunk is written we can change the columns schema freely
@@ -96,14 +245,13 @@ class BufferedDataWriter(Generic[TWriter]):
         # flush if max buffer exceeded
         if self._buffered_items_count >= self.buffer_max_items:
             self._flush_items()
-        # rotate the file if max_bytes exceeded
-        if self._file:
-            # rotate on max file size
-            if self.file_max_bytes and self._file.tell() >= self.file_max_bytes:
-                self._rotate_file()
-            # rotate on max items
-            elif self.file_max_items and self._writer.items_count >= self.file_max_items:
-                self._rotate_file()
+        elif self._memory_budget:
+            size = estimate_item_size(item)
+            self._buffered_items_bytes += size
+            self._memory_budget.on_buffered(self, size)
+        # background thread checks the file limits after each flush
+        if not self._writer_thread:
+            self._run_file_op(self._rotate_on_file_limits)
 
     def write_empty_file(self, columns: TTableSchemaColumns) -> None:
         if columns is not None:
@@ -113,6 +261,8 @@ class BufferedDataWriter(Generic[TWriter]):
     def close(self) -> None:
         self._ensure_open()
         self._flush_and_close_file()
+        # wait until the background thread writes all the files
+        self._check_pending_flushes(wait=True)
         self._closed = True
 
     @property
@@ -127,29 +277,83 @@ class BufferedDataWriter(Generic[TWriter]):
 
     def _rotate_file(self) -> None:
         self._flush_and_close_file()
+
+    def _next_file_name(self) -> None:
         self._file_name = self.file_name_template % uniq_id(5) + "." + self._file_format_spec.file_extension
 
     def _flush_items(self, allow_empty_file: bool = False) -> None:
         if self._buffered_items_count > 0 or allow_empty_file:
-            # we only open a writer when there are any items in the buffer and first flush is requested
-            if not self._writer:
-                # create new writer and write header
-                if self._file_format_spec.is_binary_format:
-                    self._file = self.open(self._file_name, "wb") # type: ignore
-                else:
-                    self._file = self.open(self._file_name, "wt", encoding="utf-8") # type: ignore
-                self._writer = DataWriter.from_file_format(self.file_format, self._file, caps=self._caps)  # type: ignore[assignment]
-                self._writer.write_header(self._current_columns)
-            # write buffer
-            if self._buffered_items:
-                self._writer.write_data(self._buffered_items)
-            # reset buffer and counter
-            self._buffered_items.clear()
+            # hand off the buffer and start a new one
+            items = self._buffered_items
+            self._buffered_items = []
             self._buffered_items_count = 0
+            if self._memory_budget:
+                self._memory_budget.on_flushed(self, self._buffered_items_bytes)
+                self._buffered_items_bytes = 0
+            self._run_file_op(self._write_items, items, self._current_columns, allow_empty_file, self._writer_thread is not None)
 
     def _flush_and_close_file(self) -> None:
         # if any buffered items exist, flush them
         self._flush_items()
+        self._run_file_op(self._close_file)
+
+    def _run_file_op(self, f: Callable[..., None], *args: Any) -> None:
+        """Runs file operation `f` on the background thread if enabled or in the calling thread"""
+        if self._writer_thread:
+            self._pending_flushes.append(self._writer_thread.submit(self._locked_file_op, f, *args))
+        else:
+            self._locked_file_op(f, *args)
+
+    def _locked_file_op(self, f: Callable[..., None], *args: Any) -> None:
+        """Runs file operation `f` holding the lock of the file state. Memory budget also closes files of other writers this way"""
+        with self._file_lock:
+            f(*args)
+
+    def _check_pending_flushes(self, wait: bool = False) -> None:
+        """Raises exceptions of completed background flushes, waits for all of them if `wait` is set"""
+        pending: List["Future[None]"] = []
+        for future in self._pending_flushes:
+            if wait or future.done():
+                future.result()
+            else:
+                pending.append(future)
+        self._pending_flushes = pending
+
+    def _write_items(
+        self, items: List[TDataItem], columns: TTableSchemaColumns, allow_empty_file: bool, rotate_on_file_limits: bool
+    ) -> None:
+        # a background flush may write items with changed columns to a file with old header, rotate in that case
+        if self._writer and not self._file_format_spec.supports_schema_changes and columns is not None \
+                and self._writer_columns is not None and len(columns) != len(self._writer_columns):
+            self._close_file()
+        # we only open a writer when there are any items in the buffer and first flush is requested
+        if not self._writer:
+            # create new writer and write header
+            if self._file_format_spec.is_binary_format:
+                self._file = self.open(self._file_name, "wb")
+            else:
+                self._file = self.open(self._file_name, "wt", encoding="utf-8")
+            self._writer = DataWriter.from_file_format(self.file_format, self._file, caps=self._caps)  # type: ignore[assignment]
+            self._writer.write_header(columns)
+            self._writer_columns = columns
+        if self._open_files_budget:
+            self._open_files_budget.on_file_used(self)
+        # write buffer
+        if items:
+            self._writer.write_data(items)
+        if rotate_on_file_limits:
+            self._rotate_on_file_limits()
+
+    def _rotate_on_file_limits(self) -> None:
+        if self._file:
+            # rotate on max file size
+            if self.file_max_bytes and self._file.tell() >= self.file_max_bytes:
+                self._close_file()
+            # rotate on max items
+            elif self.file_max_items and self._writer.items_count >= self.file_max_items:
+                self._close_file()
+
+    def _close_file(self) -> None:
         # if writer exists then close it
         if self._writer:
             # write the footer of a file
@@ -158,7 +362,11 @@ class BufferedDataWriter(Generic[TWriter]):
             # add file written to the list so we can commit all the files later
             self.closed_files.append(self._file_name)
             self._writer = None
+            self._writer_columns = None
             self._file = None
+            self._next_file_name()
+            if self._open_files_budget:
+                self._open_files_budget.on_file_closed(self)
 
     def _ensure_open(self) -> None:
         if self._closed:
@@ -0,0 +1,130 @@
+import pickle
+from datetime import date, datetime, time, timedelta, timezone, tzinfo  # noqa: I251
+from enum import Enum
+from types import BuiltinFunctionType, FunctionType
+from operator import methodcaller
+from typing import IO, Any, Callable, Dict, Iterator, List
+from uuid import UUID
+from hexbytes import HexBytes
+
+from dlt.common.json import custom_pua_encode
+from dlt.common.arithmetics import Decimal
+from dlt.common.wei import Wei
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _reduce_datetime(obj: datetime) -> Any:
+    offset = obj.utcoffset()
+    return datetime, (obj.year, obj.month, obj.day, obj.hour, obj.minute, obj.second, obj.microsecond, None if offset is None else timezone(offset))
+
+
+def _reduce_time(obj: time) -> Any:
+    offset = obj.utcoffset()
+    return time, (obj.hour, obj.minute, obj.second, obj.microsecond, None if offset is None else timezone(offset))
+
+
+def _resolve_reducer(obj_type: type) -> Callable[[Any], Any]:
+    """Returns a reducer for instances of `obj_type`, raises KeyError for types that are pickled as globals"""
+    if issubclass(obj_type, type) or obj_type in (FunctionType, BuiltinFunctionType):
+        raise KeyError(obj_type)
+    # standard library types that unpickle without parsing keep their own reduce
+    if obj_type in (datetime, date, time, timedelta, timezone) or issubclass(obj_type, tzinfo):
+        return methodcaller("__reduce_ex__", pickle.HIGHEST_PROTOCOL)
+    # date and time subclasses (ie. pendulum) are stored as standard library types
+    if issubclass(obj_type, datetime):
+        return _reduce_datetime
+    if issubclass(obj_type, date):
+        return lambda obj: (date, (obj.year, obj.month, obj.day))
+    if issubclass(obj_type, time):
+        return _reduce_time
+    if issubclass(obj_type, timedelta):
+        return lambda obj: (timedelta, (obj.days, obj.seconds, obj.microseconds))
+    # dict and list subclasses (ie. OrderedDict, defaultdict) are stored as plain dicts and lists
+    if issubclass(obj_type, dict):
+        return lambda obj: (dict, (list(obj.items()),))
+    if issubclass(obj_type, list):
+        return lambda obj: (list, (list(obj),))
+    # decimals, wei, uuids and (hex)bytes keep their types, other subclasses are stored as base types
+    if issubclass(obj_type, Wei):
+        return lambda obj: (Wei, (str(obj),))
+    if issubclass(obj_type, HexBytes):
+        return lambda obj: (HexBytes, (bytes(obj),))
+    if issubclass(obj_type, Decimal):
+        return lambda obj: (Decimal, (str(obj),))
+    if issubclass(obj_type, UUID):
+        return lambda obj: (UUID, (str(obj),))
+    if issubclass(obj_type, bytes):
+        return lambda obj: (bytes, (bytes(obj),))
+    if not issubclass(obj_type, Enum):
+        if issubclass(obj_type, str):
+            return lambda obj: (_identity, (str.__str__(obj),))
+        if issubclass(obj_type, int):
+            return lambda obj: (_identity, (int.__int__(obj),))
+        if issubclass(obj_type, float):
+            return lambda obj: (_identity, (float.__float__(obj),))
+    # namedtuples, dataclasses, pydantic models and enums are converted into dicts and values, set subclasses are rejected
+    return lambda obj: (_identity, (custom_pua_encode(obj),))
+
+
+class _TypedItemsDispatchTable(Dict[type, Callable[[Any], Any]]):
+    """Dispatch table that resolves the reducer of a type on first use. The pickler consults it only for types it does not
+       pickle natively so plain dicts, lists, strings and numbers are not looked up at all.
+    """
+
+    def __missing__(self, obj_type: type) -> Callable[[Any], Any]:
+        reducer = self[obj_type] = _resolve_reducer(obj_type)
+        return reducer
+
+
+class TypedItemsPickler(pickle.Pickler):
+    """Pickles data items keeping the python types that `puae-jsonl` encodes with PUA markers.
+
+       Date and time subclasses (ie. pendulum) are stored as standard library types which unpickle without parsing.
+       All other objects are converted like in the json encoder so the normalizer sees the same values as with `puae-jsonl`.
+       Conversions are selected by type in `dispatch_table` so there are no per object python calls for native types. Tuples,
+       sets and frozensets are pickled natively, the normalizer handles tuples as lists and rejects sets.
+    """
+
+    dispatch_table = _TypedItemsDispatchTable()
+
+    def __init__(self, f: IO[Any]) -> None:
+        super().__init__(f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+class TypedItemsUnpickler(pickle.Unpickler):
+    """Unpickles data items written by `TypedItemsPickler`. Only the types that the pickler emits may be loaded so
+       a pickle frame from outside of `dlt` cannot execute code when loaded.
+    """
+
+    ALLOWED_GLOBALS = {
+        ("builtins", "dict"), ("builtins", "list"),
+        ("builtins", "bytes"), ("builtins", "bytearray"),
+        ("datetime", "datetime"), ("datetime", "date"), ("datetime", "time"), ("datetime", "timedelta"), ("datetime", "timezone"),
+        ("decimal", "Decimal"), ("uuid", "UUID"), ("dlt.common.wei", "Wei"), ("hexbytes.main", "HexBytes"),
+        (__name__, "_identity"),
+    }
+
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) not in self.ALLOWED_GLOBALS:
+            raise pickle.UnpicklingError(f"Global {module}.{name} is not allowed in typed items pickle")
+        return super().find_class(module, name)
+
+
+def dump_typed_items(items: List[Any], f: IO[Any]) -> None:
+    """Writes `items` as a single pickle frame"""
+    TypedItemsPickler(f).dump(items)
+
+
+def load_typed_items(f: IO[Any]) -> Iterator[List[Any]]:
+    """Reads lists of items from consecutive pickle frames written with `dump_typed_items`. Frames referencing types
+       that `TypedItemsPickler` does not emit raise `pickle.UnpicklingError`
+    """
+    while True:
+        try:
+            # each frame has its own memo so a new unpickler is needed
+            yield TypedItemsUnpickler(f).load()
+        except EOFError:
+            return
@@ -1,10 +1,13 @@
 import abc
+import shutil
 from dataclasses import dataclass
 from typing import IO, TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Type, Union
 
 from dlt.common import json
+from dlt.common.compression import TCompressionCodec, detect_compression_codec, open_compressed
 from dlt.common.configuration import configspec, known_sections, with_config
 from dlt.common.configuration.specs import BaseConfiguration
+from dlt.common.data_writers.typed_pickle import dump_typed_items
 from dlt.common.destination import DestinationCapabilitiesContext, TLoaderFileFormat
 from dlt.common.schema.typing import TTableSchemaColumns
 from dlt.common.typing import StrAny
@@ -48,6 +51,14 @@ class DataWriter(abc.ABC):
     def data_format(cls) -> TFileFormatSpec:
         pass
 
+    @classmethod
+    def combine_files(cls, file_paths: Sequence[str], combined_path: str) -> bool:
+        """Combines files in `file_paths` written by this writer into a single file at `combined_path`.
+
+        Returns False and writes nothing if the file format or the files (ie. with different headers) cannot be combined
+        """
+        return False
+
     @classmethod
     def from_file_format(cls, file_format: TLoaderFileFormat, f: IO[Any], caps: DestinationCapabilitiesContext = None) -> "DataWriter":
         return cls.class_factory(file_format)(f, caps)
@@ -72,6 +83,8 @@ class DataWriter(abc.ABC):
             return ParquetDataWriter  # type: ignore
         elif file_format == "arrow":
             return ArrowWriter # type: ignore
+        elif file_format == "pickle":
+            return TypedPickleWriter
         else:
             raise ValueError(file_format)
 
@@ -83,13 +96,26 @@ class JsonlWriter(DataWriter):
 
     def write_data(self, rows: Sequence[Any]) -> None:
         super().write_data(rows)
-        for row in rows:
-            json.dump(row, self._f)
-            self._f.write(b"\n")
+        if rows:
+            # serialize all rows into a single block so just one write goes to the (compressed) file
+            self._f.write(b"\n".join(map(json.dumpb, rows)) + b"\n")
 
     def write_footer(self) -> None:
         pass
 
+    @classmethod
+    def combine_files(cls, file_paths: Sequence[str], combined_path: str) -> bool:
+        codecs = {detect_compression_codec(path) for path in file_paths}
+        if len(codecs) > 1:
+            return False
+        codec = codecs.pop()
+        # rows are newline terminated so decompressed files can be just concatenated
+        with _open_job_file(combined_path, "wb", codec) as combined_f:
+            for path in file_paths:
+                with _open_job_file(path, "rb", codec) as f:
+                    shutil.copyfileobj(f, combined_f)
+        return True
+
     @classmethod
     def data_format(cls) -> TFileFormatSpec:
         return TFileFormatSpec(
@@ -122,6 +148,30 @@ class JsonlListPUAEncodeWriter(JsonlWriter):
         )
 
 
+class TypedPickleWriter(DataWriter):
+
+    def write_header(self, columns_schema: TTableSchemaColumns) -> None:
+        pass
+
+    def write_data(self, rows: Sequence[Any]) -> None:
+        super().write_data(rows)
+        # write all rows as one pickle frame, python types are preserved so reader does not need to decode them
+        dump_typed_items(list(rows), self._f)
+
+    def write_footer(self) -> None:
+        pass
+
+    @classmethod
+    def data_format(cls) -> TFileFormatSpec:
+        return TFileFormatSpec(
+            "pickle",
+            file_extension="pickle",
+            is_binary_format=True,
+            supports_schema_changes=True,
+            supports_compression=True,
+        )
+
+
 class InsertValuesWriter(DataWriter):
 
     def __init__(self, f: IO[Any], caps: DestinationCapabilitiesContext = None) -> None:
@@ -142,32 +192,59 @@ class InsertValuesWriter(DataWriter):
 
     def write_data(self, rows: Sequence[Any]) -> None:
         super().write_data(rows)
-
-        def write_row(row: StrAny) -> None:
-            output = ["NULL"] * len(self._headers_lookup)
-            for n,v  in row.items():
-                output[self._headers_lookup[n]] = self._caps.escape_literal(v)
-            self._f.write("(")
-            self._f.write(",".join(output))
-            self._f.write(")")
-
+        if not rows:
+            return
+        headers_lookup = self._headers_lookup
+        escape_literal = self._caps.escape_literal
+        null_row = ["NULL"] * len(headers_lookup)
+
+        def row_values(row: StrAny) -> str:
+            output = null_row.copy()
+            for n, v in row.items():
+                output[headers_lookup[n]] = escape_literal(v)
+            return "(" + ",".join(output) + ")"
+
+        # build the whole chunk and write it at once, last row is without separator so we can write footer eventually
+        values = ",\n".join(map(row_values, rows))
         # if next chunk add separator
         if self._chunks_written > 0:
-            self._f.write(",\n")
-
-        # write rows
-        for row in rows[:-1]:
-            write_row(row)
-            self._f.write(",\n")
-
-        # write last row without separator so we can write footer eventually
-        write_row(rows[-1])
+            values = ",\n" + values
+        self._f.write(values)
         self._chunks_written += 1
 
     def write_footer(self) -> None:
         if self._chunks_written > 0:
             self._f.write(";")
 
+    @classmethod
+    def combine_files(cls, file_paths: Sequence[str], combined_path: str) -> bool:
+        codecs = {detect_compression_codec(path) for path in file_paths}
+        if len(codecs) > 1:
+            return False
+        codec = codecs.pop()
+        header: str = None
+        chunks: List[str] = []
+        for path in file_paths:
+            # do not translate newlines, escaped literals may contain them
+            with _open_job_file(path, "rt", codec, encoding="utf-8", newline="") as f:
+                content = f.read()
+            values_end = content.index("VALUES\n") + len("VALUES\n")
+            # files with different columns cannot be combined
+            if header is None:
+                header = content[:values_end]
+            elif header != content[:values_end]:
+                return False
+            # files without rows do not have a footer
+            chunk = content[values_end:]
+            if chunk:
+                chunks.append(chunk[:-1] if chunk.endswith(";") else chunk)
+        with _open_job_file(combined_path, "wt", codec, encoding="utf-8", newline="") as combined_f:
+            combined_f.write(header)
+            if chunks:
+                combined_f.write(",\n".join(chunks))
+                combined_f.write(";")
+        return True
+
     @classmethod
     def data_format(cls) -> TFileFormatSpec:
         return TFileFormatSpec(
@@ -187,6 +264,14 @@ class ParquetDataWriterConfiguration(BaseConfiguration):
     data_page_size: int = 1024 * 1024
     timestamp_precision: str = "us"
     timestamp_timezone: str = "UTC"
+    row_group_size: Optional[int] = None
+    """Rows are accumulated and written in row groups of that size. If not set each flushed buffer is written as a row group"""
+    compression: str = "snappy"
+    """Compression codec of column chunks: none, snappy, gzip, brotli, lz4 or zstd"""
+    use_dictionary: bool = True
+    """Dictionary encode columns"""
+    write_statistics: bool = True
+    """Write min/max statistics of column chunks"""
 
     __section__: str = known_sections.DATA_WRITER
 
@@ -200,7 +285,11 @@ class ParquetDataWriter(DataWriter):
                  flavor: str = "spark",
                  version: str = "2.4",
                  data_page_size: int = 1024 * 1024,
-                 timestamp_timezone: str = "UTC"
+                 timestamp_timezone: str = "UTC",
+                 row_group_size: int = None,
+                 compression: str = "snappy",
+                 use_dictionary: bool = True,
+                 write_statistics: bool = True
                  ) -> None:
         super().__init__(f, caps)
         from dlt.common.libs.pyarrow import pyarrow
@@ -212,6 +301,13 @@ class ParquetDataWriter(DataWriter):
         self.parquet_version = version
         self.parquet_data_page_size = data_page_size
         self.timestamp_timezone = timestamp_timezone
+        self.parquet_row_group_size = row_group_size
+        self.parquet_compression = compression
+        self.parquet_use_dictionary = use_dictionary
+        self.parquet_write_statistics = write_statistics
+        # tables waiting to be written as a single row group
+        self._row_group: List[pyarrow.Table] = []
+        self._row_group_rows = 0
 
     def write_header(self, columns_schema: TTableSchemaColumns) -> None:
         from dlt.common.libs.pyarrow import pyarrow, get_py_arrow_datatype
@@ -226,27 +322,117 @@ class ParquetDataWriter(DataWriter):
         )
         # find row items that are of the complex type (could be abstracted out for use in other writers?)
         self.complex_indices = [i for i, field in columns_schema.items() if field["data_type"] == "complex"]
-        self.writer = pyarrow.parquet.ParquetWriter(self._f, self.schema, flavor=self.parquet_flavor, version=self.parquet_version, data_page_size=self.parquet_data_page_size)
+        self.writer = self._create_writer(self.schema)
+
+    def _create_writer(self, schema: Any) -> Any:
+        from dlt.common.libs.pyarrow import pyarrow
 
+        return pyarrow.parquet.ParquetWriter(
+            self._f,
+            schema,
+            flavor=self.parquet_flavor,
+            version=self.parquet_version,
+            data_page_size=self.parquet_data_page_size,
+            compression=self.parquet_compression,
+            use_dictionary=self.parquet_use_dictionary,
+            write_statistics=self.parquet_write_statistics
+        )
 
     def write_data(self, rows: Sequence[Any]) -> None:
+        from dlt.common.libs.pyarrow import pyarrow
+
+        # rows may be interleaved with arrow tables produced by columnar normalizers, keep the original order
+        pending_rows: List[Any] = []
+        for row in rows:
+            if isinstance(row, (pyarrow.Table, pyarrow.RecordBatch)):
+                self._write_rows(pending_rows)
+                pending_rows = []
+                self._write_table(self._align_table(row))
+                self.items_count += row.num_rows
+            else:
+                pending_rows.append(row)
+        self._write_rows(pending_rows)
+
+    def _write_rows(self, rows: List[Any]) -> None:
+        if not rows:
+            return
         super().write_data(rows)
+        from dlt.common.libs.pyarrow import pyarrow, json_string_array
+
+        # build columns directly from rows, complex types are serialized to json column by column
+        arrays = []
+        for field in self.schema:
+            name = field.name
+            values = [row.get(name) for row in rows]
+            if name in self.complex_indices:
+                # None values are serialized, only missing values are nulls
+                arrays.append(json_string_array(values, [name in row for row in rows]).cast(field.type))
+            else:
+                arrays.append(pyarrow.array(values, type=field.type))
+        self._write_table(pyarrow.Table.from_arrays(arrays, schema=self.schema))
+
+    def _write_table(self, table: Any) -> None:
+        """Writes `table` or accumulates tables until a row group of `row_group_size` rows can be written"""
+        if not self.parquet_row_group_size:
+            self.writer.write_table(table)
+            return
+        self._row_group.append(table)
+        self._row_group_rows += table.num_rows
+        if self._row_group_rows >= self.parquet_row_group_size:
+            self._flush_row_group(full_only=True)
+
+    def _flush_row_group(self, full_only: bool = False) -> None:
+        """Writes accumulated tables. If `full_only` is set only full row groups are written and remaining rows are kept"""
         from dlt.common.libs.pyarrow import pyarrow
 
-        # replace complex types with json
-        for key in self.complex_indices:
-            for row in rows:
-                if key in row:
-                    row[key] = json.dumps(row[key])
+        if not self._row_group:
+            return
+        table = pyarrow.concat_tables(self._row_group)
+        self._row_group = []
+        self._row_group_rows = 0
+        if full_only:
+            full_rows = table.num_rows - table.num_rows % self.parquet_row_group_size
+            if full_rows < table.num_rows:
+                self._row_group = [table.slice(full_rows)]
+                self._row_group_rows = table.num_rows - full_rows
+            table = table.slice(0, full_rows)
+        self.writer.write_table(table, row_group_size=self.parquet_row_group_size)
+
+    def _align_table(self, item: Any) -> Any:
+        """Casts arrow table or record batch to the file schema, columns not present in `item` are filled with nulls"""
+        from dlt.common.libs.pyarrow import pyarrow
 
-        table = pyarrow.Table.from_pylist(rows, schema=self.schema)
-        # Write
-        self.writer.write_table(table)
+        arrays = []
+        for field in self.schema:
+            idx = item.schema.get_field_index(field.name)
+            if idx < 0:
+                arrays.append(pyarrow.nulls(item.num_rows, type=field.type))
+            else:
+                column = item.column(idx)
+                arrays.append(column if column.type == field.type else column.cast(field.type))
+        return pyarrow.Table.from_arrays(arrays, schema=self.schema)
 
     def write_footer(self) -> None:
+        self._flush_row_group()
         self.writer.close()
         self.writer = None
 
+    @classmethod
+    def combine_files(cls, file_paths: Sequence[str], combined_path: str) -> bool:
+        from dlt.common.libs.pyarrow import pyarrow
+
+        # files rotated on schema change cannot be combined
+        schema = pyarrow.parquet.read_schema(file_paths[0])
+        if any(not pyarrow.parquet.read_schema(path).equals(schema) for path in file_paths[1:]):
+            return False
+        # write with the same configured options (ie. flavor and timestamp types) as the original files
+        with open(combined_path, "wb") as f:
+            combined = cls(f)
+            combined.writer = combined._create_writer(schema)
+            for path in file_paths:
+                combined._write_table(pyarrow.parquet.read_table(path))
+            combined.write_footer()
+        return True
 
     @classmethod
     def data_format(cls) -> TFileFormatSpec:
@@ -264,14 +450,12 @@ class ArrowWriter(ParquetDataWriter):
         if not rows:
             return
         first = rows[0]
-        self.writer = self.writer or pyarrow.parquet.ParquetWriter(
-            self._f, first.schema, flavor=self.parquet_flavor, version=self.parquet_version, data_page_size=self.parquet_data_page_size
-        )
+        self.writer = self.writer or self._create_writer(first.schema)
         for row in rows:
             if isinstance(row, pyarrow.Table):
-                self.writer.write_table(row)
+                self._write_table(row)
             elif isinstance(row, pyarrow.RecordBatch):
-                self.writer.write_batch(row)
+                self._write_table(pyarrow.Table.from_batches([row]))
             else:
                 raise ValueError(f"Unsupported type {type(row)}")
             # count rows that got written
@@ -287,3 +471,9 @@ class ArrowWriter(ParquetDataWriter):
             requires_destination_capabilities=False,
             supports_compression=False,
         )
+
+
+def _open_job_file(path: str, mode: str, codec: Optional[TCompressionCodec], **kwargs: Any) -> IO[Any]:
+    if codec:
+        return open_compressed(path, mode, codec, **kwargs)
+    return open(path, mode, **kwargs)
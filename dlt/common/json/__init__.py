@@ -89,6 +89,7 @@ def custom_encode(obj: Any) -> str:
 
 
 # use PUA range to encode additional types
+PUA_START = 0xF026
 _DECIMAL = '\uF026'
 _DATETIME = '\uF027'
 _DATE = '\uF028'
@@ -156,7 +157,7 @@ def custom_pua_encode(obj: Any) -> str:
 
 def custom_pua_decode(obj: Any) -> Any:
     if isinstance(obj, str) and len(obj) > 1:
-        c = ord(obj[0]) - 0xF026
+        c = ord(obj[0]) - PUA_START
         # decode only the PUA space defined in DECODERS
         if c >=0 and c <= PUA_CHARACTER_MAX:
             return DECODERS[c](obj[1:])
@@ -174,7 +175,7 @@ def custom_pua_decode_nested(obj: Any) -> Any:
 def custom_pua_remove(obj: Any) -> Any:
     """Removes the PUA data type marker and leaves the correctly serialized type representation. Unmarked values are returned as-is."""
     if isinstance(obj, str) and len(obj) > 1:
-        c = ord(obj[0]) - 0xF026
+        c = ord(obj[0]) - PUA_START
         # decode only the PUA space defined in DECODERS
         if c >=0 and c <= PUA_CHARACTER_MAX:
             return obj[1:]
@@ -1,4 +1,4 @@
-from typing import Any, Tuple, Optional, Union
+from typing import Any, Sequence, Tuple, Optional, Union
 from dlt import version
 from dlt.common.exceptions import MissingDependencyException
 from dlt.common.schema.typing import TTableSchemaColumns
@@ -7,10 +7,12 @@ from dlt.common.destination.capabilities import DestinationCapabilitiesContext
 from dlt.common.schema.typing import TColumnType
 from dlt.common.data_types import TDataType
 from dlt.common.typing import TFileOrPath
+from dlt.common.json import json
 
 try:
     import pyarrow
     import pyarrow.parquet
+    import pyarrow.compute
 except ModuleNotFoundError:
     raise MissingDependencyException("DLT parquet Helpers", [f"{version.DLT_PKG_NAME}[parquet]"], "DLT Helpers for for parquet.")
 
@@ -90,7 +92,7 @@ def get_pyarrow_int(precision: Optional[int]) -> Any:
     return pyarrow.int64()
 
 
-def _get_column_type_from_py_arrow(dtype: pyarrow.DataType) -> TColumnType:
+def get_column_type_from_py_arrow(dtype: pyarrow.DataType) -> TColumnType:
     """Returns (data_type, precision, scale) tuple from pyarrow.DataType
     """
     if pyarrow.types.is_string(dtype) or pyarrow.types.is_large_string(dtype):
@@ -153,7 +155,7 @@ def py_arrow_to_table_schema_columns(schema: pyarrow.Schema) -> TTableSchemaColu
         result[field.name] = {
             "name": field.name,
             "nullable": field.nullable,
-            **_get_column_type_from_py_arrow(field.type),
+            **get_column_type_from_py_arrow(field.type),
         }
     return result
 
@@ -173,3 +175,113 @@ def get_row_count(parquet_file: TFileOrPath) -> int:
 
 def is_arrow_item(item: Any) -> bool:
     return isinstance(item, (pyarrow.Table, pyarrow.RecordBatch))
+
+
+def json_string_array(values: Sequence[Any], valid: Sequence[bool] = None) -> pyarrow.Array:
+    """Serializes `values` into an arrow array of json strings with nulls at positions not set in `valid`.
+
+    Values are encoded with a single pass of `json.dumpb` over the column and the encoded bytes become the data buffer
+    of the array as they are, without decoding into python strings that arrow encodes again.
+
+    Args:
+        values (Sequence[Any]): values of a complex column
+        valid (Sequence[bool], optional): flags of values that are not null, by default all values that are not None
+
+    Returns:
+        pyarrow.Array: array of json strings with the same length as `values`
+    """
+    import numpy as np
+
+    encoded = list(map(json.dumpb, values))
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+    if offsets[-1] < 2**31:
+        arrow_type, offsets = pyarrow.string(), offsets.astype(np.int32)
+    else:
+        arrow_type = pyarrow.large_string()
+    # encoded null values stay in the data buffer under the null slots
+    if valid is None:
+        valid = [v is not None for v in values]
+    validity = pyarrow.array(valid, type=pyarrow.bool_())
+    return pyarrow.Array.from_buffers(
+        arrow_type,
+        len(encoded),
+        [validity.buffers()[1], pyarrow.py_buffer(offsets), pyarrow.py_buffer(b"".join(encoded))],
+    )
+
+
+def _mix64(np: Any, x: Any) -> Any:
+    """Splitmix64 step applied to an array of uint64"""
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def _hash_binary_column(np: Any, column: pyarrow.Array) -> Any:
+    """Hashes each value of a string or binary `column` by summing mixed (position, byte) pairs over the data buffer"""
+    is_large = pyarrow.types.is_large_string(column.type) or pyarrow.types.is_large_binary(column.type)
+    _, offsets_buf, data_buf = column.buffers()
+    offsets = np.frombuffer(offsets_buf, dtype=np.int64 if is_large else np.int32, count=len(column) + 1, offset=column.offset * (8 if is_large else 4))
+    lengths = np.diff(offsets).astype(np.uint64)
+    sums = np.zeros(len(column), dtype=np.uint64)
+    if offsets[-1] > offsets[0]:
+        data = np.frombuffer(data_buf, dtype=np.uint8)[offsets[0]:offsets[-1]].astype(np.uint64)
+        starts = (offsets[:-1] - offsets[0]).astype(np.int64)
+        non_empty = lengths > 0
+        # position of each byte within its value
+        positions = np.arange(len(data), dtype=np.uint64) - np.repeat(starts, lengths.astype(np.int64)).astype(np.uint64)
+        sums[non_empty] = np.add.reduceat(_mix64(np, data | (positions << np.uint64(8))), starts[non_empty])
+    return _mix64(np, sums ^ _mix64(np, lengths))
+
+
+def _hash_column(np: Any, column: pyarrow.Array) -> Any:
+    """Returns uint64 hash of each value in `column`, nulls get the same hash"""
+    if pyarrow.types.is_dictionary(column.type):
+        column = column.dictionary_decode()
+    if pyarrow.types.is_boolean(column.type):
+        column = pyarrow.compute.cast(column, pyarrow.uint8())
+    elif pyarrow.types.is_decimal(column.type):
+        column = pyarrow.compute.cast(column, pyarrow.string())
+    column_type = column.type
+    if pyarrow.types.is_null(column_type):
+        return np.zeros(len(column), dtype=np.uint64)
+    if pyarrow.types.is_string(column_type) or pyarrow.types.is_binary(column_type) or \
+            pyarrow.types.is_large_string(column_type) or pyarrow.types.is_large_binary(column_type):
+        hashes = _hash_binary_column(np, column)
+    elif (pyarrow.types.is_integer(column_type) or pyarrow.types.is_floating(column_type) or pyarrow.types.is_temporal(column_type)) \
+            and column_type.bit_width in (8, 16, 32, 64):
+        # fixed width values are hashed over their bits
+        byte_width = column_type.bit_width // 8
+        values = np.frombuffer(column.buffers()[1], dtype=f"<u{byte_width}", count=len(column), offset=column.offset * byte_width)
+        hashes = _mix64(np, values.astype(np.uint64))
+    else:
+        # nested and other types without a flat buffer are serialized one by one
+        hashes = _hash_binary_column(np, json_string_array(column.to_pylist()))
+    if column.null_count:
+        hashes = np.where(column.is_valid().to_numpy(zero_copy_only=False), hashes, np.uint64(0xD6E8FEB86659FD93))
+    return hashes
+
+
+def hash_rows(item: Union[pyarrow.Table, pyarrow.RecordBatch], columns: Sequence[str]) -> pyarrow.Array:
+    """Computes a 64 bit hash of each row of `item` over `columns`.
+
+    Columns are hashed one at a time with numpy over their arrow buffers and combined in the order of their names, so the
+    hash does not depend on the column order in `item`. Nested types are serialized to json to be hashed.
+
+    Args:
+        item (Union[pyarrow.Table, pyarrow.RecordBatch]): table or record batch to hash
+        columns (Sequence[str]): names of the columns to hash
+
+    Returns:
+        pyarrow.Array: uint64 array with a hash of each row
+    """
+    import numpy as np
+
+    hashes = np.zeros(item.num_rows, dtype=np.uint64)
+    for name in sorted(columns):
+        column = item[name]
+        if isinstance(column, pyarrow.ChunkedArray):
+            column = column.combine_chunks()
+        hashes = _mix64(np, _mix64(np, hashes) ^ _hash_column(np, column))
+    return pyarrow.array(hashes, type=pyarrow.uint64())
@@ -1,4 +1,5 @@
-from typing import Dict, List, Mapping, Optional, Sequence, Tuple, cast, TypedDict, Any
+from collections import OrderedDict
+from typing import ClassVar, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple, cast, TypedDict, Any
 from dlt.common.data_types.typing import TDataType
 from dlt.common.normalizers.exceptions import InvalidJsonNormalizer
 from dlt.common.normalizers.typing import TJSONNormalizer
@@ -41,11 +42,31 @@ class RelationalNormalizerConfig(TypedDict, total=False):
     propagation: Optional[RelationalNormalizerConfigPropagation]
 
 
+class TFlattenKeyPlan(NamedTuple):
+    """Compiled decisions for a single source key at a given nesting path of a table"""
+    norm_k: str
+    """normalized key"""
+    child_name: str
+    """normalized column name (nesting path included)"""
+    is_complex: Optional[bool]
+    """dict and list values are kept as complex values, None if not yet checked"""
+    list_path: Tuple[str, ...]
+    """path of the child table for list values"""
+    nested: "OrderedDict[str, TFlattenKeyPlan]"
+    """plans for the keys of nested dict value"""
+
+
 class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
+    MAX_FLATTEN_PLANS: ClassVar[int] = 1000
+    """Max number of source keys per table and nesting level for which flatten plans are kept, least recently used plans are evicted"""
+
     normalizer_config: RelationalNormalizerConfig
     propagation_config: RelationalNormalizerConfigPropagation
     max_nesting: int
     _skip_primary_key: Dict[str, bool]
+    _flatten_plans: Dict[Tuple[str, int], "OrderedDict[str, TFlattenKeyPlan]"]
+    """(table name, recursion level) -> source key -> plan, see `_flatten`"""
+    _flatten_plans_settings_version: int
 
     def __init__(self, schema: Schema) -> None:
         self.schema = schema
@@ -56,6 +77,8 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         self.propagation_config = self.normalizer_config.get("propagation", None)
         self.max_nesting = self.normalizer_config.get("max_nesting", 1000)
         self._skip_primary_key = {}
+        self._flatten_plans = {}
+        self._flatten_plans_settings_version = self.schema._settings_version
         # self.known_types: Dict[str, TDataType] = {}
         # self.primary_keys = Dict[str, ]
 
@@ -92,35 +115,54 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         out_rec_row: DictStrAny = {}
         out_rec_list: Dict[Tuple[str, ...], Sequence[Any]] = {}
         schema_naming = self.schema.naming
+        # settings were recompiled so preferred types may have changed
+        if self._flatten_plans_settings_version != self.schema._settings_version:
+            self._flatten_plans.clear()
+            self._flatten_plans_settings_version = self.schema._settings_version
+
+        def compile_key_plan(k: str, __r_lvl: int, path: Tuple[str, ...]) -> TFlattenKeyPlan:
+            if k.strip():
+                norm_k = schema_naming.normalize_identifier(k)
+                list_k = schema_naming.normalize_table_identifier(k)
+            else:
+                # for empty keys in the data use _
+                norm_k = list_k = EMPTY_KEY_IDENTIFIER
+            child_name = norm_k if path == () else schema_naming.shorten_fragments(*path, norm_k)
+            return TFlattenKeyPlan(norm_k, child_name, None, path + (list_k,), OrderedDict())
 
-        def norm_row_dicts(dict_row: StrAny, __r_lvl: int, path: Tuple[str, ...] = ()) -> None:
+        def norm_row_dicts(dict_row: StrAny, __r_lvl: int, plans: "OrderedDict[str, TFlattenKeyPlan]", path: Tuple[str, ...] = ()) -> None:
             for k, v in dict_row.items():
-                if k.strip():
-                    norm_k = schema_naming.normalize_identifier(k)
+                plan = plans.get(k)
+                if plan is None:
+                    # rows with arbitrary keys (ie. ids used as keys) would grow the plans without bounds
+                    if len(plans) >= self.MAX_FLATTEN_PLANS:
+                        plans.popitem(last=False)
+                    plan = plans[k] = compile_key_plan(k, __r_lvl, path)
                 else:
-                    # for empty keys in the data use _
-                    norm_k = EMPTY_KEY_IDENTIFIER
-                # if norm_k != k:
-                #     print(f"{k} -> {norm_k}")
-                child_name = norm_k if path == () else schema_naming.shorten_fragments(*path, norm_k)
-                # for lists and dicts we must check if type is possibly complex
-                if isinstance(v, (dict, list)):
-                    if not self._is_complex_type(table, child_name, __r_lvl):
+                    plans.move_to_end(k)
+                # for lists and dicts we must check if type is possibly complex, tuples are lists in items that did not pass through json
+                if isinstance(v, (dict, list, tuple)):
+                    if plan.is_complex is None:
+                        plan = plans[k] = plan._replace(is_complex=self._is_complex_type(table, plan.child_name, __r_lvl))
+                    if not plan.is_complex:
                         # TODO: if schema contains table {table}__{child_name} then convert v into single element list
                         if isinstance(v, dict):
                             # flatten the dict more
-                            norm_row_dicts(v, __r_lvl + 1, path + (norm_k,))
+                            norm_row_dicts(v, __r_lvl + 1, plan.nested, path + (plan.norm_k,))
                         else:
                             # pass the list to out_rec_list
-                            out_rec_list[path + (schema_naming.normalize_table_identifier(k),)] = v
+                            out_rec_list[plan.list_path] = v
                         continue
                     else:
                         # pass the complex value to out_rec_row
                         pass
 
-                out_rec_row[child_name] = v
+                out_rec_row[plan.child_name] = v
 
-        norm_row_dicts(dict_row, _r_lvl)
+        table_plans = self._flatten_plans.get((table, _r_lvl))
+        if table_plans is None:
+            table_plans = self._flatten_plans[(table, _r_lvl)] = OrderedDict()
+        norm_row_dicts(dict_row, _r_lvl, table_plans)
         return cast(TDataItemRow, out_rec_row), out_rec_list
 
     @staticmethod
@@ -191,7 +233,7 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
             # yield child table row
             if isinstance(v, dict):
                 yield from self._normalize_row(v, extend, ident_path, parent_path, parent_row_id, idx, _r_lvl)
-            elif isinstance(v, list):
+            elif isinstance(v, (list, tuple)):
                 # to normalize lists of lists, we must create a tracking intermediary table by creating a mock row
                 yield from  self._normalize_row({"list": v}, extend, ident_path, parent_path, parent_row_id, idx, _r_lvl + 1)
             else:
@@ -262,6 +304,9 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
             self.extend_table(table_name)
 
     def extend_table(self, table_name: str) -> None:
+        # columns of the table changed so complex types must be checked again
+        for plans_key in [k for k in self._flatten_plans if k[0] == table_name]:
+            del self._flatten_plans[plans_key]
         # if the table has a merge w_d, add propagation info to normalizer
         table = self.schema.tables.get(table_name)
         if not table.get("parent") and table["write_disposition"] == "merge":
@@ -1,6 +1,6 @@
 import yaml
 from copy import copy, deepcopy
-from typing import ClassVar, Dict, List, Mapping, Optional, Sequence, Tuple, Any, cast
+from typing import ClassVar, Dict, List, Mapping, Optional, Sequence, Tuple, Type, Any, cast
 from dlt.common import json
 
 from dlt.common.utils import extend_list_deduplicated
@@ -17,8 +17,16 @@ from dlt.common.schema.exceptions import (CannotCoerceColumnException, CannotCoe
 from dlt.common.validation import validate_dict
 
 
+# (column name, column data type, python value data type, pass value without coercion)
+TCoerceRowPlan = List[Tuple[str, TDataType, TDataType, bool]]
+# (column names, python value types) of a row
+TRowShape = Tuple[Tuple[str, ...], Tuple[Type[Any], ...]]
+
+
 class Schema:
     ENGINE_VERSION: ClassVar[int] = SCHEMA_ENGINE_VERSION
+    MAX_COERCE_ROW_PLANS: ClassVar[int] = 1000
+    """Max number of row shapes per table for which coercion plans are kept"""
 
     naming: NamingConvention
     """Naming convention used by the schema to normalize identifiers"""
@@ -52,6 +60,10 @@ class Schema:
     _compiled_includes: Dict[str, Sequence[REPattern]]
     # type detections
     _type_detections: Sequence[TTypeDetections]
+    # coercion plans for row shapes per table that were coerced without schema changes
+    _coerce_row_plans: Dict[str, Dict[TRowShape, TCoerceRowPlan]]
+    # incremented each time settings are compiled, lets normalizers invalidate data derived from settings
+    _settings_version: int
 
     # normalizers config
     _normalizers_config: TNormalizersConfig
@@ -162,6 +174,14 @@ class Schema:
 
            Returns tuple with row with coerced values and a partial table containing just the newly added columns or None if no changes were detected
         """
+        # rows with the same shape that were already coerced without schema changes use a precomputed plan
+        row_shape: TRowShape = (tuple(row.keys()), tuple(map(type, row.values())))
+        table_plans = self._coerce_row_plans.get(table_name)
+        if table_plans is not None and (plan := table_plans.get(row_shape)) is not None:
+            coerced_row = self._coerce_row_with_plan(plan, row)
+            if coerced_row is not None:
+                return coerced_row, None
+
         # get existing or create a new table
         updated_table_partial: TPartialTableSchema = None
         table = self._schema_tables.get(table_name)
@@ -170,6 +190,7 @@ class Schema:
         table_columns = table["columns"]
 
         new_row: DictStrAny = {}
+        has_variants = False
         for col_name, v in row.items():
             # skip None values, we should infer the types later
             if v is None:
@@ -178,6 +199,7 @@ class Schema:
             else:
                 new_col_name, new_col_def, new_v = self._coerce_non_null_value(table_columns, table_name, col_name, v)
                 new_row[new_col_name] = new_v
+                has_variants = has_variants or new_col_name != col_name
                 if new_col_def:
                     if not updated_table_partial:
                         # create partial table with only the new columns
@@ -185,8 +207,46 @@ class Schema:
                         updated_table_partial["columns"] = {}
                     updated_table_partial["columns"][new_col_name] = new_col_def
 
+        # variants depend on values so only shapes fully matching existing columns get a plan
+        if not updated_table_partial and not has_variants:
+            if table_plans is None:
+                table_plans = self._coerce_row_plans[table_name] = {}
+            elif len(table_plans) >= self.MAX_COERCE_ROW_PLANS:
+                table_plans.clear()
+            table_plans[row_shape] = self._compile_coerce_row_plan(table_columns, row)
+
         return new_row, updated_table_partial
 
+    @staticmethod
+    def _compile_coerce_row_plan(table_columns: TTableSchemaColumns, row: StrAny) -> TCoerceRowPlan:
+        plan: TCoerceRowPlan = []
+        for col_name, v in row.items():
+            # None values are dropped
+            if v is None:
+                continue
+            col_type = table_columns[col_name]["data_type"]
+            py_type = py_type_to_sc_type(type(v))
+            # complex values, enums and variants are always coerced
+            passthrough = col_type == py_type and col_type != "complex" and not hasattr(v, "value") and not callable(v)
+            plan.append((col_name, col_type, py_type, passthrough))
+        return plan
+
+    @staticmethod
+    def _coerce_row_with_plan(plan: TCoerceRowPlan, row: StrAny) -> Optional[DictStrAny]:
+        """Coerces `row` with a `plan`. Returns None if any of the values cannot be coerced without creating a variant column"""
+        new_row: DictStrAny = {}
+        for col_name, col_type, py_type, passthrough in plan:
+            v = row[col_name]
+            if not passthrough:
+                try:
+                    v = coerce_value(col_type, py_type, v)
+                except (ValueError, SyntaxError):
+                    return None
+                if callable(v):
+                    return None
+            new_row[col_name] = v
+        return new_row
+
     def update_table(self, partial_table: TPartialTableSchema) -> TPartialTableSchema:
         """Update table in this schema"""
         table_name = partial_table["name"]
@@ -206,6 +266,7 @@ class Schema:
             # merge tables performing additional checks
             partial_table = utils.merge_tables(table, partial_table)
 
+        self._coerce_row_plans.pop(table_name, None)
         self.data_item_normalizer.extend_table(table_name)
         return partial_table
 
@@ -507,6 +568,8 @@ class Schema:
     def _configure_normalizers(self, normalizers: TNormalizersConfig) -> None:
         # import desired modules
         self._normalizers_config, naming_module, item_normalizer_class = import_normalizers(normalizers)
+        # table names may change
+        self._coerce_row_plans.clear()
         # print(f"{self.name}: {type(self.naming)} {type(naming_module)}")
         if self.naming and type(self.naming) is not type(naming_module):
             self.naming = naming_module
@@ -539,6 +602,8 @@ class Schema:
         self._compiled_excludes: Dict[str, Sequence[REPattern]] = {}
         self._compiled_includes: Dict[str, Sequence[REPattern]] = {}
         self._type_detections: Sequence[TTypeDetections] = None
+        self._coerce_row_plans = {}
+        self._settings_version = 0
 
         self._normalizers_config = None
         self.naming = None
@@ -579,6 +644,9 @@ class Schema:
         self._schema_name = name
 
     def _compile_settings(self) -> None:
+        # coercion plans may depend on settings and tables
+        self._coerce_row_plans.clear()
+        self._settings_version += 1
         # if self._settings:
         for pattern, dt in self._settings.get("preferred_types", {}).items():
             # add tuples to be searched in coercions
@@ -2,7 +2,7 @@ from .file_storage import FileStorage  # noqa: F401
 from .versioned_storage import VersionedStorage  # noqa: F401
 from .schema_storage import SchemaStorage  # noqa: F401
 from .live_schema_storage import LiveSchemaStorage  # noqa: F401
-from .normalize_storage import NormalizeStorage  # noqa: F401
+from .normalize_storage import NormalizeStorage, TExtractedItemsRange  # noqa: F401
 from .load_storage import LoadStorage  # noqa: F401
 from .data_item_storage import DataItemStorage  # noqa: F401
 from .configuration import LoadStorageConfiguration, NormalizeStorageConfiguration, SchemaStorageConfiguration, TSchemaFileFormat, FilesystemConfiguration  # noqa: F401
@@ -1,16 +1,26 @@
-from typing import Dict, Any, List, Generic
+from typing import Dict, Any, List, Generic, Optional
 from abc import ABC, abstractmethod
 
 from dlt.common import logger
 from dlt.common.schema import TTableSchemaColumns
 from dlt.common.typing import TDataItems
-from dlt.common.data_writers import TLoaderFileFormat, BufferedDataWriter, DataWriter
+from dlt.common.compression import TCompressionCodec
+from dlt.common.data_writers import TLoaderFileFormat, BufferedDataWriter, DataWriter, WriterMemoryBudget, BackgroundWriterThread
 
 
 class DataItemStorage(ABC):
+    WRITER_COMPRESSION_CODEC: Optional[TCompressionCodec] = None
+    """Compression codec used by all writers of the storage regardless of configuration, configured codec is used if not set"""
+    file_max_bytes: Optional[int] = None
+    """Max bytes in files of all writers of the storage, configured limit is used if not set"""
+
     def __init__(self, load_file_type: TLoaderFileFormat, *args: Any) -> None:
         self.loader_file_format = load_file_type
         self.buffered_writers: Dict[str, BufferedDataWriter[DataWriter]] = {}
+        # buffered bytes and open files are limited across all writers of the storage
+        self.memory_budget = WriterMemoryBudget()
+        # thread that writes the files of all writers of the storage, created by the first writer with background flush
+        self.writer_thread: BackgroundWriterThread = None
         super().__init__(*args)
 
     def get_writer(self, load_id: str, schema_name: str, table_name: str) -> BufferedDataWriter[DataWriter]:
@@ -20,7 +30,14 @@ class DataItemStorage(ABC):
         if not writer:
             # assign a writer for each table
             path = self._get_data_item_path_template(load_id, schema_name, table_name)
-            writer = BufferedDataWriter(self.loader_file_format, path)
+            kwargs: Dict[str, Any] = {}
+            if self.WRITER_COMPRESSION_CODEC:
+                kwargs["compression_codec"] = self.WRITER_COMPRESSION_CODEC
+            if self.file_max_bytes:
+                kwargs["file_max_bytes"] = self.file_max_bytes
+            writer = BufferedDataWriter(
+                self.loader_file_format, path, memory_budget=self.memory_budget, writer_thread=self._get_writer_thread, **kwargs
+            )
             self.buffered_writers[writer_id] = writer
         return writer
 
@@ -39,6 +56,8 @@ class DataItemStorage(ABC):
             if name.startswith(extract_id):
                 logger.debug(f"Closing writer for {name} with file {writer._file} and actual name {writer._file_name}")
                 writer.close()
+        if self.writer_thread:
+            self.writer_thread.shutdown()
 
     def closed_files(self) -> List[str]:
         files: List[str] = []
@@ -47,6 +66,11 @@ class DataItemStorage(ABC):
 
         return files
 
+    def _get_writer_thread(self) -> BackgroundWriterThread:
+        if self.writer_thread is None:
+            self.writer_thread = BackgroundWriterThread()
+        return self.writer_thread
+
     @abstractmethod
     def _get_data_item_path_template(self, load_id: str, schema_name: str, table_name: str) -> str:
         # note: use %s for file id to create required template format
@@ -1,4 +1,3 @@
-import gzip
 import os
 import re
 import stat
@@ -9,6 +8,7 @@ import pathvalidate
 from typing import IO, Any, Optional, List, cast, overload
 from dlt.common.typing import AnyFun
 
+from dlt.common.compression import TCompressionCodec, detect_compression_codec, open_compressed
 from dlt.common.utils import encoding_for_mode, uniq_id
 
 
@@ -297,28 +297,25 @@ class FileStorage:
 
     @staticmethod
     def open_zipsafe_ro(path: str, mode: str = "r", **kwargs: Any) -> IO[Any]:
-        """Opens a file using gzip.open if it is a gzip file, otherwise uses open."""
+        """Opens a file with the compression codec (gzip, zstd or lz4) detected from the file header, otherwise uses open."""
         assert "r" in mode, "FileStorage.open_zipsafe_ro only supports read modes"
         encoding = kwargs.pop("encoding", encoding_for_mode(mode))
-        origmode = str(mode)
-        try:
-            if encoding is not None and mode == "r":
-                mode += "t"  # gzip requires text mode explicitly to use encoding
-            f = gzip.open(path, mode, encoding=encoding, **kwargs)
-            # Force gzip to read the first few bytes and check the magic number
-            f.read(2), f.seek(0)
-            return cast(IO[Any], f)
-        except (gzip.BadGzipFile, OSError):
-            return open(path, origmode, encoding=encoding, **kwargs)
+        codec = FileStorage.compression_codec(path)
+        if codec is None:
+            return open(path, mode, encoding=encoding, **kwargs)
+        if encoding is not None and mode == "r":
+            mode += "t"  # compressed files require text mode explicitly to use encoding
+        return open_compressed(path, mode, codec, encoding=encoding, **kwargs)
 
+    @staticmethod
+    def compression_codec(path: str) -> Optional[TCompressionCodec]:
+        """Returns compression codec of a file under path by reading a header, None if file is not compressed"""
+        try:
+            return detect_compression_codec(path)
+        except OSError:
+            return None
 
     @staticmethod
     def is_gzipped(path: str) -> bool:
         """Checks if file under path is gzipped by reading a header"""
-        try:
-            with gzip.open(path, "rt", encoding="utf-8") as f:
-                # Force gzip to read the first few bytes and check the magic number
-                f.read(2)
-                return True
-        except (gzip.BadGzipFile, OSError):
-            return False
+        return FileStorage.compression_codec(path) == "gzip"
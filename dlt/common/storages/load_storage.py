@@ -6,7 +6,8 @@ import humanize
 from os.path import join
 from pathlib import Path
 from pendulum.datetime import DateTime
-from typing import Dict, Iterable, List, NamedTuple, Literal, Optional, Sequence, Set, get_args, cast
+from threading import Lock
+from typing import Callable, Dict, Iterable, List, NamedTuple, Literal, Optional, Sequence, Set, Tuple, get_args, cast
 
 from dlt.common import json, pendulum
 from dlt.common.configuration import known_sections
@@ -22,7 +23,7 @@ from dlt.common.storages.configuration import LoadStorageConfiguration
 from dlt.common.storages.versioned_storage import VersionedStorage
 from dlt.common.storages.data_item_storage import DataItemStorage
 from dlt.common.storages.exceptions import JobWithUnsupportedWriterException, LoadPackageNotFound
-from dlt.common.utils import flatten_list_or_items
+from dlt.common.utils import flatten_list_or_items, uniq_id
 
 
 # folders to manage load jobs in a single load package
@@ -140,6 +141,8 @@ class LoadStorage(DataItemStorage, VersionedStorage):
     PACKAGE_COMPLETED_FILE_NAME = "package_completed.json"  # completed package marker file, currently only to store data with os.stat
 
     ALL_SUPPORTED_FILE_FORMATS = ALL_SUPPORTED_FILE_FORMATS
+    # files in load packages are sent to destinations which accept only gzip compression
+    WRITER_COMPRESSION_CODEC = "gzip"
 
     @with_config(spec=LoadStorageConfiguration, sections=(known_sections.LOAD,))
     def __init__(
@@ -155,6 +158,11 @@ class LoadStorage(DataItemStorage, VersionedStorage):
             raise TerminalValueError(preferred_file_format)
         self.supported_file_formats = supported_file_formats
         self.config = config
+        self._jobs_index: Dict[str, Dict[str, Dict[str, TJobState]]] = {}
+        """Load id -> table name -> job file name -> job state for packages being loaded, see `list_job_states_for_table`"""
+        self._new_jobs_index: Dict[str, Dict[str, None]] = {}
+        """Load id -> file names of new jobs in order in which they were added, see `list_new_jobs_from_index`"""
+        self._jobs_index_lock = Lock()
         super().__init__(
             preferred_file_format,
             LoadStorage.STORAGE_VERSION,
@@ -210,7 +218,47 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         with self.storage.open_file(join(load_id, LoadStorage.SCHEMA_UPDATES_FILE_NAME), mode="wb") as f:
             json.dump(schema_update, f)
 
+    def combine_temp_job_files(self, load_id: str, max_file_bytes: int, file_formats: Sequence[TLoaderFileFormat]) -> int:
+        """Combines new job files of the same table and format in temporary load package `load_id` into files of up to `max_file_bytes`.
+           Only files in `file_formats` are combined, the formats must have a writer that is able to combine files.
+
+        Returns the number of job files that were removed by combining
+        """
+        jobs_folder = join(load_id, LoadStorage.NEW_JOBS_FOLDER)
+        tables_files: Dict[Tuple[str, TLoaderFileFormat], List[Tuple[str, int]]] = {}
+        for file_name in self.storage.list_folder_files(jobs_folder, to_root=False):
+            job_info = self.parse_job_file_name(file_name)
+            if job_info.file_format not in file_formats:
+                continue
+            file_path = self.storage.make_full_path(join(jobs_folder, file_name))
+            file_size = os.path.getsize(file_path)
+            if file_size < max_file_bytes:
+                tables_files.setdefault((job_info.table_name, job_info.file_format), []).append((file_path, file_size))
+
+        removed_count = 0
+        for (table_name, file_format), files in tables_files.items():
+            # pack files in groups up to max_file_bytes
+            groups: List[List[str]] = [[]]
+            group_size = 0
+            for file_path, file_size in sorted(files):
+                if groups[-1] and group_size + file_size > max_file_bytes:
+                    groups.append([])
+                    group_size = 0
+                groups[-1].append(file_path)
+                group_size += file_size
+            for group in groups:
+                if len(group) < 2:
+                    continue
+                combined_name = ParsedLoadJobFileName(table_name, uniq_id(), 0, file_format).job_id()
+                combined_path = self.storage.make_full_path(join(jobs_folder, combined_name))
+                if DataWriter.class_factory(file_format).combine_files(group, combined_path):
+                    for file_path in group:
+                        os.remove(file_path)
+                    removed_count += len(group) - 1
+        return removed_count
+
     def commit_temp_load_package(self, load_id: str) -> None:
+        self._drop_jobs_index(load_id)
         self.storage.rename_tree(load_id, self.get_package_path(load_id))
 
     def list_packages(self) -> Sequence[str]:
@@ -238,7 +286,40 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         return self.storage.list_folder_files(self._get_job_folder_path(load_id, LoadStorage.FAILED_JOBS_FOLDER))
 
     def list_jobs_for_table(self, load_id: str, table_name: str) -> Sequence[LoadJobInfo]:
-        return [job for job in self.list_all_jobs(load_id) if job.job_file_info.table_name == table_name]
+        return [
+            self._read_job_file_info(state, self._get_job_file_path(load_id, state, job_file_info.job_id()))
+            for state, job_file_info in self.list_job_states_for_table(load_id, table_name)
+        ]
+
+    def list_job_states_for_table(self, load_id: str, table_name: str) -> Sequence[Tuple[TJobState, ParsedLoadJobFileName]]:
+        """Lists states of all jobs for `table_name` in package `load_id` without accessing the package folders.
+
+           Job states are indexed in memory on first call and then kept up to date by the job methods of this storage
+           instance ie. `start_job` or `complete_job`. Changes done to the package by other storage instances are not visible.
+        """
+        with self._jobs_index_lock:
+            table_jobs = self._ensure_jobs_index(load_id).get(table_name, {})
+            return [(state, ParsedLoadJobFileName.parse(file_name)) for file_name, state in table_jobs.items()]
+
+    def list_new_jobs_from_index(self, load_id: str, max_jobs: int, skip: Callable[[str], bool] = None) -> Sequence[str]:
+        """Lists up to `max_jobs` new jobs in package `load_id` for which `skip` is not True, in order in which they became new jobs.
+
+           Uses the same in memory index as `list_job_states_for_table` so the `new_jobs` folder is not listed on each call.
+        """
+        with self._jobs_index_lock:
+            self._ensure_jobs_index(load_id)
+            new_jobs: List[str] = []
+            for file_name in self._new_jobs_index[load_id]:
+                if len(new_jobs) == max_jobs:
+                    break
+                if skip and skip(file_name):
+                    continue
+                new_jobs.append(file_name)
+        # make sure all jobs have supported writers
+        wrong_job = next((j for j in new_jobs if LoadStorage.parse_job_file_name(j).file_format not in self.supported_file_formats), None)
+        if wrong_job is not None:
+            raise JobWithUnsupportedWriterException(load_id, self.supported_file_formats, wrong_job)
+        return [self._get_job_file_path(load_id, LoadStorage.NEW_JOBS_FOLDER, file_name) for file_name in new_jobs]
 
     def list_all_jobs(self, load_id: str) -> Sequence[LoadJobInfo]:
         info = self.get_load_package_info(load_id)
@@ -276,7 +357,8 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         applied_schema_update_file = join(package_path, LoadStorage.APPLIED_SCHEMA_UPDATES_FILE_NAME)
         if self.storage.has_file(applied_schema_update_file):
             applied_update = json.loads(self.storage.load(applied_schema_update_file))
-        schema = self._load_schema(join(package_path, LoadStorage.SCHEMA_FILE_NAME))
+        # only schema name is needed, do not fully parse the schema
+        schema_name: str = json.loads(self.storage.load(join(package_path, LoadStorage.SCHEMA_FILE_NAME)))["name"]
         # read jobs with all statuses
         all_jobs: Dict[TJobState, List[LoadJobInfo]] = {}
         for state in WORKING_FOLDERS:
@@ -288,7 +370,7 @@ class LoadStorage(DataItemStorage, VersionedStorage):
                         jobs.append(self._read_job_file_info(state, file, package_created_at))
             all_jobs[state] = jobs
 
-        return LoadPackageInfo(load_id, self.storage.make_full_path(package_path), package_state, schema.name, applied_update, package_created_at, all_jobs)
+        return LoadPackageInfo(load_id, self.storage.make_full_path(package_path), package_state, schema_name, applied_update, package_created_at, all_jobs)
 
     def begin_schema_update(self, load_id: str) -> Optional[TSchemaTables]:
         package_path = self.get_package_path(load_id)
@@ -314,6 +396,7 @@ class LoadStorage(DataItemStorage, VersionedStorage):
     def add_new_job(self, load_id: str, job_file_path: str, job_state: TJobState = "new_jobs") -> None:
         """Adds new job by moving the `job_file_path` into `new_jobs` of package `load_id`"""
         self.storage.atomic_import(job_file_path, self._get_job_folder_path(load_id, job_state))
+        self._update_jobs_index(load_id, None, FileStorage.get_file_name_from_file_path(job_file_path), job_state)
 
     def atomic_import(self, external_file_path: str, to_folder: str) -> str:
         """Copies or links a file at `external_file_path` into the `to_folder` effectively importing file into storage"""
@@ -357,6 +440,7 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         # move to completed
         completed_path = self.get_completed_package_path(load_id)
         self.storage.rename_tree(load_path, completed_path)
+        self._drop_jobs_index(load_id)
 
     def delete_completed_package(self, load_id: str) -> None:
         package_path = self.get_completed_package_path(load_id)
@@ -366,6 +450,9 @@ class LoadStorage(DataItemStorage, VersionedStorage):
 
     def wipe_normalized_packages(self) -> None:
         self.storage.delete_folder(self.NORMALIZED_FOLDER, recursively=True)
+        with self._jobs_index_lock:
+            self._jobs_index.clear()
+            self._new_jobs_index.clear()
 
     def get_package_path(self, load_id: str) -> str:
         return join(LoadStorage.NORMALIZED_FOLDER, load_id)
@@ -392,8 +479,50 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         dest_path = join(load_path, dest_folder, new_file_name or file_name)
         self.storage.atomic_rename(join(load_path, source_folder, file_name), dest_path)
         # print(f"{join(load_path, source_folder, file_name)} -> {dest_path}")
+        self._update_jobs_index(load_id, file_name, new_file_name or file_name, dest_folder)
         return self.storage.make_full_path(dest_path)
 
+    def _build_jobs_index(self, load_id: str) -> Dict[str, Dict[str, TJobState]]:
+        index: Dict[str, Dict[str, TJobState]] = {}
+        package_path = self.get_package_path(load_id)
+        if not self.storage.has_folder(package_path):
+            raise LoadPackageNotFound(load_id)
+        for state in WORKING_FOLDERS:
+            with contextlib.suppress(FileNotFoundError):
+                for file in self.storage.list_folder_files(join(package_path, state), to_root=False):
+                    if not file.endswith(".exception"):
+                        index.setdefault(self.parse_job_file_name(file).table_name, {})[file] = state
+        return index
+
+    def _ensure_jobs_index(self, load_id: str) -> Dict[str, Dict[str, TJobState]]:
+        """Builds jobs index of package `load_id` if not yet present. Must be called with the index lock held"""
+        if load_id not in self._jobs_index:
+            index = self._build_jobs_index(load_id)
+            self._jobs_index[load_id] = index
+            self._new_jobs_index[load_id] = {
+                file_name: None for table_jobs in index.values() for file_name, state in table_jobs.items() if state == LoadStorage.NEW_JOBS_FOLDER
+            }
+        return self._jobs_index[load_id]
+
+    def _update_jobs_index(self, load_id: str, file_name: Optional[str], new_file_name: str, state: TJobState) -> None:
+        """Moves `file_name` (None for new jobs) to `new_file_name` in `state` if package `load_id` is indexed"""
+        with self._jobs_index_lock:
+            if load_id not in self._jobs_index:
+                return
+            index = self._jobs_index[load_id]
+            new_jobs = self._new_jobs_index[load_id]
+            if file_name:
+                index.get(self.parse_job_file_name(file_name).table_name, {}).pop(file_name, None)
+                new_jobs.pop(file_name, None)
+            index.setdefault(self.parse_job_file_name(new_file_name).table_name, {})[new_file_name] = state
+            if state == LoadStorage.NEW_JOBS_FOLDER:
+                new_jobs[new_file_name] = None
+
+    def _drop_jobs_index(self, load_id: str) -> None:
+        with self._jobs_index_lock:
+            self._jobs_index.pop(load_id, None)
+            self._new_jobs_index.pop(load_id, None)
+
     def _get_job_folder_path(self, load_id: str, folder: TJobState) -> str:
         return join(self.get_package_path(load_id), folder)
 
@@ -1,4 +1,5 @@
-from typing import ClassVar, Sequence, NamedTuple, Union
+import os
+from typing import ClassVar, List, Optional, Sequence, NamedTuple, Union
 from itertools import groupby
 from pathlib import Path
 
@@ -17,6 +18,14 @@ class TParsedNormalizeFileName(NamedTuple):
     file_format: TLoaderFileFormat
 
 
+class TExtractedItemsRange(NamedTuple):
+    """Newline aligned byte range of extracted items file that may be normalized independently"""
+    file_name: str
+    start: int
+    end: Optional[int]  # None reads until the end of file
+    size: int  # bytes on disk, used to balance the work
+
+
 class NormalizeStorage(VersionedStorage):
 
     STORAGE_VERSION: ClassVar[str] = "1.0.0"
@@ -57,6 +66,29 @@ class NormalizeStorage(VersionedStorage):
             raise TerminalValueError(f"File format {ext} not supported. Filename: {file_name}")
         return TParsedNormalizeFileName(*parts)  # type: ignore[arg-type]
 
+    def split_extracted_file(self, file_name: str, max_range_bytes: int) -> List[TExtractedItemsRange]:
+        """Splits jsonl file `file_name` into newline aligned byte ranges of about `max_range_bytes`. Each line holds an independent list of items.
+
+           Compressed, parquet and pickle files, or all files if `max_range_bytes` is 0, are returned as a single range. Extract must
+           rotate such files (`extract_file_max_bytes`) so large resources produce many files.
+        """
+        file_path = self.storage.make_full_path(file_name)
+        file_size = os.path.getsize(file_path)
+        if not max_range_bytes or file_size <= max_range_bytes or \
+                NormalizeStorage.parse_normalize_file_name(file_name).file_format != "jsonl" or FileStorage.compression_codec(file_path) is not None:
+            return [TExtractedItemsRange(file_name, 0, None, file_size)]
+        ranges: List[TExtractedItemsRange] = []
+        with open(file_path, "rb") as f:
+            start = 0
+            while start < file_size:
+                # move to the last byte of the range and complete the line
+                f.seek(start + max_range_bytes - 1)
+                f.readline()
+                end = min(f.tell(), file_size)
+                ranges.append(TExtractedItemsRange(file_name, start, end, end - start))
+                start = end
+        return ranges
+
     def delete_extracted_files(self, files: Sequence[str]) -> None:
         for file_name in files:
             self.storage.delete(file_name)
@@ -1,8 +1,8 @@
 import os
+import re
 from pathlib import Path
-from typing import ClassVar, Dict, Optional, Sequence, Tuple, List, cast, Type, Any
+from typing import ClassVar, Dict, Iterable, Iterator, Optional, Sequence, Tuple, List, cast, Type, Any
 import google.cloud.bigquery as bigquery  # noqa: I250
-from google.cloud import exceptions as gcp_exceptions
 from google.api_core import exceptions as api_core_exceptions
 
 from dlt.common import json, logger
@@ -13,9 +13,10 @@ from dlt.common.storages.file_storage import FileStorage
 from dlt.common.schema import TColumnSchema, Schema, TTableSchemaColumns
 from dlt.common.schema.typing import TTableSchema, TColumnType, TTableFormat
 from dlt.common.schema.exceptions import UnknownTableException
+from dlt.common.utils import chunks
 
-from dlt.destinations.job_client_impl import SqlJobClientWithStaging
-from dlt.destinations.exceptions import DestinationSchemaWillNotUpdate, DestinationTransientException, LoadJobNotExistsException, LoadJobTerminalException
+from dlt.destinations.job_client_impl import INFO_SCHEMA_TABLES_CHUNK, SqlJobClientWithStaging
+from dlt.destinations.exceptions import DatabaseUndefinedRelation, DestinationSchemaWillNotUpdate, DestinationTransientException, LoadJobNotExistsException, LoadJobTerminalException
 
 from dlt.destinations.bigquery import capabilities
 from dlt.destinations.bigquery.configuration import BigQueryClientConfiguration
@@ -60,6 +61,10 @@ class BigQueryTypeMapper(TypeMapper):
         "BIGNUMERIC": "decimal",
         "JSON": "complex",
         "TIME": "time",
+        # standard sql names used by INFORMATION_SCHEMA
+        "FLOAT64": "double",
+        "BOOL": "bool",
+        "INT64": "bigint",
     }
 
     def from_db_type(self, db_type: str, precision: Optional[int], scale: Optional[int]) -> TColumnType:
@@ -250,31 +255,47 @@ class BigQueryClient(SqlJobClientWithStaging, SupportsStagingDestination):
         name = self.capabilities.escape_identifier(c["name"])
         return f"{name} {self.type_mapper.to_db_type(c, table_format)} {self._gen_not_null(c.get('nullable', True))}"
 
-    def get_storage_table(self, table_name: str) -> Tuple[bool, TTableSchemaColumns]:
-        schema_table: TTableSchemaColumns = {}
+    def get_storage_tables(self, table_names: Iterable[str]) -> Iterator[Tuple[str, TTableSchemaColumns]]:
+        """Gets columns of many tables with a single query to dataset INFORMATION_SCHEMA instead of getting each table via the api"""
+        table_names = list(table_names)
+        storage_tables: Dict[str, TTableSchemaColumns] = {table_name: {} for table_name in table_names}
+        info_schema_columns = f"{self.sql_client.fully_qualified_dataset_name()}.INFORMATION_SCHEMA.COLUMNS"
         try:
-            table = self.sql_client.native_connection.get_table(
-                self.sql_client.make_qualified_table_name(table_name, escape=False),
-                retry=self.sql_client._default_retry,
-                timeout=self.config.http_timeout
-            )
-            partition_field = table.time_partitioning.field if table.time_partitioning else None
-            for c in table.schema:
-                schema_c: TColumnSchema = {
-                    "name": c.name,
-                    "nullable": c.is_nullable,
-                    "unique": False,
-                    "sort": False,
-                    "primary_key": False,
-                    "foreign_key": False,
-                    "cluster": c.name in (table.clustering_fields or []),
-                    "partition": c.name == partition_field,
-                    **self._from_db_type(c.field_type, c.precision, c.scale)
-                }
-                schema_table[c.name] = schema_c
-            return True, schema_table
-        except gcp_exceptions.NotFound:
-            return False, schema_table
+            for table_names_chunk in chunks(list(storage_tables), INFO_SCHEMA_TABLES_CHUNK):
+                query = f"""
+SELECT table_name, column_name, data_type, is_nullable, is_partitioning_column, clustering_ordinal_position
+    FROM {info_schema_columns}
+WHERE is_system_defined = 'NO' AND table_name IN ({','.join(['%s'] * len(table_names_chunk))}) ORDER BY table_name, ordinal_position;"""
+                for c in self.sql_client.execute_sql(query, *table_names_chunk):
+                    schema_c: TColumnSchema = {
+                        "name": c[1],
+                        "nullable": c[3] == "YES",
+                        "unique": False,
+                        "sort": False,
+                        "primary_key": False,
+                        "foreign_key": False,
+                        "cluster": c[5] is not None,
+                        "partition": c[4] == "YES",
+                        **self._from_info_schema_type(c[2])
+                    }
+                    storage_tables[c[0]][c[1]] = schema_c
+        except DatabaseUndefinedRelation:
+            # dataset does not exist so none of the tables exist
+            pass
+        for table_name in table_names:
+            yield table_name, storage_tables[table_name]
+
+    def _from_info_schema_type(self, bq_t: str) -> TColumnType:
+        """Splits parametrized type from INFORMATION_SCHEMA ie. NUMERIC(10, 2) into type name, precision and scale"""
+        precision: int = None
+        scale: int = None
+        if match := re.match(r"^(\w+)\((\d+)(?:,\s*(\d+))?\)$", bq_t):
+            bq_t = match.group(1)
+            # length of STRING and BYTES is not reported as precision by the api
+            if bq_t in ("NUMERIC", "BIGNUMERIC"):
+                precision = int(match.group(2))
+                scale = int(match.group(3)) if match.group(3) else 0
+        return self._from_db_type(bq_t, precision, scale)
 
     def _create_load_job(self, table: TTableSchema, file_path: str) -> bigquery.LoadJob:
         # append to table for merge loads (append to stage) and regular appends
@@ -6,7 +6,7 @@ import contextlib
 from copy import copy
 import datetime  # noqa: 251
 from types import TracebackType
-from typing import Any, ClassVar, List, NamedTuple, Optional, Sequence, Tuple, Type, Iterable, Iterator, ContextManager, cast
+from typing import Any, ClassVar, Dict, List, NamedTuple, Optional, Sequence, Tuple, Type, Iterable, Iterator, ContextManager, cast
 import zlib
 import re
 
@@ -16,7 +16,7 @@ from dlt.common.schema.typing import COLUMN_HINTS, TColumnType, TColumnSchemaBas
 from dlt.common.storages import FileStorage
 from dlt.common.schema import TColumnSchema, Schema, TTableSchemaColumns, TSchemaTables
 from dlt.common.destination.reference import StateInfo, StorageSchemaInfo,WithStateSync, DestinationClientConfiguration, DestinationClientDwhConfiguration, DestinationClientDwhWithStagingConfiguration, NewLoadJob, WithStagingDataset, TLoadJobState, LoadJob, JobClientBase, FollowupJob, CredentialsConfiguration
-from dlt.common.utils import concat_strings_with_limit
+from dlt.common.utils import chunks, concat_strings_with_limit
 from dlt.destinations.exceptions import DatabaseUndefinedRelation, DestinationSchemaTampered, DestinationSchemaWillNotUpdate
 from dlt.destinations.job_impl import EmptyLoadJobWithoutFollowup, NewReferenceJob
 from dlt.destinations.sql_jobs import SqlMergeJob, SqlStagingCopyJob
@@ -31,6 +31,8 @@ DDL_COMMANDS = [
     "CREATE",
     "DROP"
 ]
+# max number of tables introspected with a single INFORMATION_SCHEMA query, stays within parameter limits of all sql backends
+INFO_SCHEMA_TABLES_CHUNK = 1000
 
 class SqlLoadJob(LoadJob):
     """A job executing sql statement, without followup trait"""
@@ -199,13 +201,21 @@ class SqlJobClientBase(JobClientBase, WithStateSync):
         )
 
     def __enter__(self) -> "SqlJobClientBase":
-        self.sql_client.open_connection()
+        self.sql_client.borrow_connection()
         return self
 
     def __exit__(self, exc_type: Type[BaseException], exc_val: BaseException, exc_tb: TracebackType) -> None:
-        self.sql_client.close_connection()
+        self.sql_client.return_connection(discard=exc_type is not None)
 
     def get_storage_table(self, table_name: str) -> Tuple[bool, TTableSchemaColumns]:
+        _, storage_table = next(iter(self.get_storage_tables([table_name])))
+        return len(storage_table) > 0, storage_table
+
+    def get_storage_tables(self, table_names: Iterable[str]) -> Iterator[Tuple[str, TTableSchemaColumns]]:
+        """Yields a table name and columns for each of `table_names`, columns are empty if table does not exist.
+
+        Columns of many tables are retrieved with a single INFORMATION_SCHEMA query and grouped by table
+        """
 
         def _null_to_bool(v: str) -> bool:
             if v == "NO":
@@ -214,35 +224,38 @@ class SqlJobClientBase(JobClientBase, WithStateSync):
                 return True
             raise ValueError(v)
 
-        fields = ["column_name", "data_type", "is_nullable"]
+        table_names = list(table_names)
+        storage_tables: Dict[str, TTableSchemaColumns] = {table_name: {} for table_name in table_names}
+        folded_names = {table_name.lower(): table_name for table_name in table_names}
+        fields = ["table_name", "column_name", "data_type", "is_nullable"]
         if self.capabilities.schema_supports_numeric_precision:
             fields += ["numeric_precision", "numeric_scale"]
-        db_params = self.sql_client.make_qualified_table_name(table_name, escape=False).split(".", 3)
-        query = f"""
+        db_params = self.sql_client.fully_qualified_dataset_name(escape=False).split(".", 2)
+        for table_names_chunk in chunks(list(storage_tables), INFO_SCHEMA_TABLES_CHUNK):
+            query = f"""
 SELECT {",".join(fields)}
     FROM INFORMATION_SCHEMA.COLUMNS
 WHERE """
-        if len(db_params) == 3:
-            query += "table_catalog = %s AND "
-        query += "table_schema = %s AND table_name = %s ORDER BY ordinal_position;"
-        rows = self.sql_client.execute_sql(query, *db_params)
-
+            if len(db_params) == 2:
+                query += "table_catalog = %s AND "
+            query += f"table_schema = %s AND table_name IN ({','.join(['%s'] * len(table_names_chunk))}) ORDER BY table_name, ordinal_position;"
+            rows = self.sql_client.execute_sql(query, *db_params, *table_names_chunk)
+            # TODO: pull more data to infer indexes, PK and uniques attributes/constraints
+            for c in rows:
+                numeric_precision = c[4] if self.capabilities.schema_supports_numeric_precision else None
+                numeric_scale = c[5] if self.capabilities.schema_supports_numeric_precision else None
+                schema_c: TColumnSchemaBase = {
+                    "name": c[1],
+                    "nullable": _null_to_bool(c[3]),
+                    **self._from_db_type(c[2], numeric_precision, numeric_scale)
+                }
+                # information schema of case insensitive backends may return table name in other casing
+                table_name = c[0] if c[0] in storage_tables else folded_names[c[0].lower()]
+                storage_tables[table_name][c[1]] = schema_c  # type: ignore
         # if no rows we assume that table does not exist
-        schema_table: TTableSchemaColumns = {}
-        if len(rows) == 0:
-            # TODO: additionally check if table exists
-            return False, schema_table
-        # TODO: pull more data to infer indexes, PK and uniques attributes/constraints
-        for c in rows:
-            numeric_precision = c[3] if self.capabilities.schema_supports_numeric_precision else None
-            numeric_scale = c[4] if self.capabilities.schema_supports_numeric_precision else None
-            schema_c: TColumnSchemaBase = {
-                "name": c[0],
-                "nullable": _null_to_bool(c[2]),
-                **self._from_db_type(c[1], numeric_precision, numeric_scale)
-            }
-            schema_table[c[0]] = schema_c  # type: ignore
-        return True, schema_table
+        # TODO: additionally check if table exists
+        for table_name in table_names:
+            yield table_name, storage_tables[table_name]
 
     @abstractmethod
     def _from_db_type(self, db_type: str, precision: Optional[int], scale: Optional[int]) -> TColumnType:
@@ -300,8 +313,8 @@ WHERE """
         """
         sql_updates = []
         schema_update: TSchemaTables = {}
-        for table_name in only_tables or self.schema.tables:
-            exists, storage_table = self.get_storage_table(table_name)
+        for table_name, storage_table in self.get_storage_tables(only_tables or self.schema.tables):
+            exists = len(storage_table) > 0
             new_columns = self._create_table_update(table_name, storage_table)
             if len(new_columns) > 0:
                 # build and add sql to execute
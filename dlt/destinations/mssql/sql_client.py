@@ -29,6 +29,7 @@ class PyOdbcMsSqlClient(SqlClientBase[pyodbc.Connection], DBTransaction):
 
     dbapi: ClassVar[DBApi] = pyodbc
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
+    supports_connection_pooling: ClassVar[bool] = True
 
     def __init__(self, dataset_name: str, credentials: MsSqlCredentials) -> None:
         super().__init__(credentials.database, dataset_name)
@@ -45,6 +46,9 @@ class PyOdbcMsSqlClient(SqlClientBase[pyodbc.Connection], DBTransaction):
         self._conn.autocommit = True
         return self._conn
 
+    def _prepare_borrowed_connection(self) -> None:
+        self._conn.autocommit = True
+
     @raise_open_connection_error
     def close_connection(self) -> None:
         if self._conn:
@@ -24,6 +24,7 @@ class Psycopg2SqlClient(SqlClientBase["psycopg2.connection"], DBTransaction):
 
     dbapi: ClassVar[DBApi] = psycopg2
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
+    supports_connection_pooling: ClassVar[bool] = True
 
     def __init__(self, dataset_name: str, credentials: PostgresCredentials) -> None:
         super().__init__(credentials.database, dataset_name)
@@ -39,6 +40,11 @@ class Psycopg2SqlClient(SqlClientBase["psycopg2.connection"], DBTransaction):
         self._reset_connection()
         return self._conn
 
+    def _prepare_borrowed_connection(self) -> None:
+        self._reset_connection()
+        with self._conn.cursor() as curr:
+            curr.execute(f"SET search_path TO {self.fully_qualified_dataset_name()},public")
+
     @raise_open_connection_error
     def close_connection(self) -> None:
         if self._conn:
@@ -1,5 +1,5 @@
 from contextlib import contextmanager, suppress
-from typing import Any, AnyStr, ClassVar, Iterator, Optional, Sequence, List
+from typing import Any, AnyStr, ClassVar, Hashable, Iterator, Optional, Sequence, List
 
 import snowflake.connector as snowflake_lib
 
@@ -23,6 +23,7 @@ class SnowflakeSqlClient(SqlClientBase[snowflake_lib.SnowflakeConnection], DBTra
 
     dbapi: ClassVar[DBApi] = snowflake_lib
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
+    supports_connection_pooling: ClassVar[bool] = True
 
     def __init__(self, dataset_name: str, credentials: SnowflakeCredentials) -> None:
         super().__init__(credentials.database, dataset_name)
@@ -41,6 +42,10 @@ class SnowflakeSqlClient(SqlClientBase[snowflake_lib.SnowflakeConnection], DBTra
         )
         return self._conn
 
+    def _connection_pool_key(self) -> Hashable:
+        # schema is set when connection is opened, share connections only within a dataset
+        return (super()._connection_pool_key(), self.dataset_name)
+
     @raise_open_connection_error
     def close_connection(self) -> None:
         if self._conn:
@@ -2,11 +2,16 @@ from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from functools import wraps
 import inspect
+import threading
+import time
 from types import TracebackType
-from typing import Any, ClassVar, ContextManager, Generic, Iterator, Optional, Sequence, Tuple, Type, AnyStr, List
+from typing import Any, Callable, ClassVar, ContextManager, Dict, Generic, Hashable, Iterator, Optional, Sequence, Tuple, Type, AnyStr, List, cast
 
+from dlt.common import logger
+from dlt.common.configuration.specs import CredentialsConfiguration
 from dlt.common.typing import TFun
 from dlt.common.destination import DestinationCapabilitiesContext
+from dlt.common.utils import digest128
 
 from dlt.destinations.exceptions import DestinationConnectionError, LoadClientNotConnected
 from dlt.destinations.typing import DBApi, TNativeConn, DBApiCursor, DataFrame, DBTransaction
@@ -16,12 +21,17 @@ class SqlClientBase(ABC, Generic[TNativeConn]):
 
     dbapi: ClassVar[DBApi] = None
     capabilities: ClassVar[DestinationCapabilitiesContext] = None
+    supports_connection_pooling: ClassVar[bool] = False
+    """Native connections may be kept in `connection_pool` between uses. The client must store its connection in `_conn`"""
 
     def __init__(self, database_name: str, dataset_name: str) -> None:
         if not dataset_name:
             raise ValueError(dataset_name)
         self.dataset_name = dataset_name
         self.database_name = database_name
+        self.connection_pool: "SqlConnectionPool" = None
+        """When set, `borrow_connection` and `return_connection` reuse native connections via the pool"""
+        self._pool_key: Hashable = None
 
     @abstractmethod
     def open_connection(self) -> TNativeConn:
@@ -41,12 +51,38 @@ class SqlClientBase(ABC, Generic[TNativeConn]):
             raise AttributeError(name)
         return getattr(self.native_connection, name)
 
+    def borrow_connection(self) -> TNativeConn:
+        """Takes an idle connection from `connection_pool` if client supports pooling, otherwise opens a new connection"""
+        if self.connection_pool is not None and self.supports_connection_pooling:
+            self._pool_key = self._connection_pool_key()
+            conn = self.connection_pool.acquire(self._pool_key, self._is_connection_healthy)
+            if conn is not None:
+                self._conn = conn
+                try:
+                    # connection may have been opened by a client with other settings ie. dataset
+                    self._prepare_borrowed_connection()
+                    return conn
+                except Exception:
+                    logger.exception("Could not prepare pooled connection, opening a new one")
+                    self._conn = None
+                    SqlConnectionPool._close_connection(conn)
+        return self.open_connection()
+
+    def return_connection(self, discard: bool = False) -> None:
+        """Gives the connection back to `connection_pool` if it was borrowed from it, otherwise or when `discard` is set closes the connection"""
+        if self._pool_key is not None and not discard and self.native_connection:
+            conn, self._conn = self._conn, None
+            self.connection_pool.release(self._pool_key, conn)
+        else:
+            self.close_connection()
+        self._pool_key = None
+
     def __enter__(self) -> "SqlClientBase[TNativeConn]":
-        self.open_connection()
+        self.borrow_connection()
         return self
 
     def __exit__(self, exc_type: Type[BaseException], exc_val: BaseException, exc_tb: TracebackType) -> None:
-        self.close_connection()
+        self.return_connection(discard=exc_type is not None)
 
     @property
     @abstractmethod
@@ -125,6 +161,31 @@ SELECT 1
             dataset_name = SqlClientBase.make_staging_dataset_name(dataset_name)
         return self.with_alternative_dataset_name(dataset_name)
 
+    def _connection_pool_key(self) -> Hashable:
+        """Connections are shared between clients of the same type with the same credentials and database, in a single thread"""
+        credentials: CredentialsConfiguration = getattr(self, "credentials", None)
+        fingerprint = digest128(str(credentials.to_native_representation())) if credentials is not None else ""
+        return (type(self), fingerprint, self.database_name, threading.get_ident())
+
+    def _prepare_borrowed_connection(self) -> None:
+        """Applies to the connection borrowed from the pool the session settings that `open_connection` makes for this client. Must be
+           implemented by clients that make session settings ie. the dataset search path
+        """
+        pass
+
+    def _is_connection_healthy(self, conn: TNativeConn) -> bool:
+        """Checks if pooled `conn` is still usable by executing a trivial query"""
+        try:
+            curr = conn.cursor()
+            try:
+                curr.execute("SELECT 1")
+                curr.fetchall()
+            finally:
+                curr.close()
+            return True
+        except Exception:
+            return False
+
     def _ensure_native_conn(self) -> None:
         if not self.native_connection:
             raise LoadClientNotConnected(type(self).__name__ , self.dataset_name)
@@ -154,6 +215,70 @@ SELECT 1
             return f"DELETE FROM {qualified_table_name} WHERE 1=1;"
 
 
+class SqlConnectionPool:
+    """Keeps native connections returned by sql clients and lends them to clients with the same key.
+
+       Connections idle longer than `idle_timeout` seconds are closed. Connections idle longer than `health_check_interval`
+       seconds are checked with a trivial query before being lent. The owner must `close` the pool to close all idle connections.
+    """
+    def __init__(self, idle_timeout: float = 300.0, health_check_interval: float = 5.0) -> None:
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self._idle: Dict[Hashable, List[Tuple[Any, float]]] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def acquire(self, key: Hashable, is_healthy: Callable[[TNativeConn], bool]) -> Optional[TNativeConn]:
+        """Returns the most recently released healthy connection for `key` or None if there's none"""
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                if not idle:
+                    return None
+                conn, released_at = idle.pop()
+            idle_for = time.monotonic() - released_at
+            if idle_for > self.idle_timeout or (idle_for > self.health_check_interval and not is_healthy(conn)):
+                self._close_connection(conn)
+                continue
+            return cast(TNativeConn, conn)
+
+    def release(self, key: Hashable, conn: Any) -> None:
+        """Keeps `conn` for reuse under `key` and closes connections that exceeded the idle timeout"""
+        now = time.monotonic()
+        expired: List[Any] = []
+        with self._lock:
+            if self._closed:
+                expired.append(conn)
+            else:
+                self._idle.setdefault(key, []).append((conn, now))
+                for idle in self._idle.values():
+                    expired.extend(c for c, released_at in idle if now - released_at > self.idle_timeout)
+                    idle[:] = [(c, released_at) for c, released_at in idle if now - released_at <= self.idle_timeout]
+        for c in expired:
+            self._close_connection(c)
+
+    @property
+    def idle_count(self) -> int:
+        with self._lock:
+            return sum(len(idle) for idle in self._idle.values())
+
+    def close(self) -> None:
+        """Closes all idle connections. Connections released afterwards are closed immediately"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn, _ in conns:
+                self._close_connection(conn)
+
+    @staticmethod
+    def _close_connection(conn: Any) -> None:
+        try:
+            conn.close()
+        except Exception:
+            logger.exception("Could not close pooled connection")
+
+
 class DBApiCursorImpl(DBApiCursor):
     """A DBApi Cursor wrapper with dataframes reading functionality"""
     def __init__(self, curr: DBApiCursor) -> None:
@@ -208,7 +208,10 @@ def resource(
     merge_key: TTableHintTemplate[TColumnNames] = None,
     table_format: TTableHintTemplate[TTableFormat] = None,
     selected: bool = True,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    *,
+    max_concurrency: int = None,
+    parallelized: bool = False
 ) -> DltResource:
     ...
 
@@ -224,7 +227,10 @@ def resource(
     merge_key: TTableHintTemplate[TColumnNames] = None,
     table_format: TTableHintTemplate[TTableFormat] = None,
     selected: bool = True,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    *,
+    max_concurrency: int = None,
+    parallelized: bool = False
 ) -> Callable[[Callable[TResourceFunParams, Any]], DltResource]:
     ...
 
@@ -241,7 +247,10 @@ def resource(
     table_format: TTableHintTemplate[TTableFormat] = None,
     selected: bool = True,
     spec: Type[BaseConfiguration] = None,
-    standalone: Literal[True] = True
+    standalone: Literal[True] = True,
+    *,
+    max_concurrency: int = None,
+    parallelized: bool = False
 ) -> Callable[[Callable[TResourceFunParams, Any]], Callable[TResourceFunParams, DltResource]]:
     ...
 
@@ -258,7 +267,10 @@ def resource(
     merge_key: TTableHintTemplate[TColumnNames] = None,
     table_format: TTableHintTemplate[TTableFormat] = None,
     selected: bool = True,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    *,
+    max_concurrency: int = None,
+    parallelized: bool = False
 ) -> DltResource:
     ...
 
@@ -277,6 +289,11 @@ def resource(
     spec: Type[BaseConfiguration] = None,
     standalone: bool = False,
     data_from: TUnboundDltResource = None,
+    *,
+    max_concurrency: int = None,
+    parallelized: bool = False,
+    batch_size: int = None,
+    batch_timeout: float = None
 ) -> Any:
     """When used as a decorator, transforms any generator (yielding) function into a `dlt resource`. When used as a function, it transforms data in `data` argument into a `dlt resource`.
 
@@ -332,6 +349,12 @@ def resource(
 
         data_from (TUnboundDltResource, optional): Allows to pipe data from one resource to another to build multi-step pipelines.
 
+        max_concurrency (int, optional): Maximum number of awaitables, callables and async generators yielded by the resource that are evaluated at the same time.
+        Items produced by `async def` generators are requested on the event loop one at a time per generator. Unlimited if not set.
+
+        parallelized (bool, optional): When `True` the resource generator is advanced in the extract thread pool so blocking resources are extracted in parallel.
+        Items are requested one at a time per generator so their order is preserved and they are written from the main thread. Defaults to `False`.
+
     Raises:
         ResourceNameMissing: indicates that name of the resource cannot be inferred from the `data` being passed.
         InvalidResourceDataType: indicates that the `data` argument cannot be converted into `dlt resource`
@@ -348,7 +371,15 @@ def resource(
             merge_key=merge_key,
             table_format=table_format
         )
-        return DltResource.from_data(_data, _name, _section, table_template, selected, cast(DltResource, data_from), incremental=incremental)
+        resource = DltResource.from_data(_data, _name, _section, table_template, selected, cast(DltResource, data_from), incremental=incremental)
+        if max_concurrency is not None:
+            resource.max_concurrency = max_concurrency
+        if parallelized:
+            resource.parallelized = parallelized
+        if batch_size is not None:
+            resource.batch_size = batch_size
+            resource.batch_timeout = batch_timeout
+        return resource
 
 
     def decorator(f: Callable[TResourceFunParams, Any]) -> Callable[TResourceFunParams, DltResource]:
@@ -427,6 +458,10 @@ def resource(
             name = name or get_callable_name(data)  # type: ignore
             func_module = inspect.getmodule(data.gi_frame)
             source_section = _get_source_section_name(func_module)
+        elif inspect.isasyncgen(data):
+            name = name or get_callable_name(data)  # type: ignore
+            func_module = inspect.getmodule(data.ag_frame)
+            source_section = _get_source_section_name(func_module)
         assert not callable(name)
         return make_resource(name, source_section, data)
 
@@ -443,7 +478,12 @@ def transformer(
     primary_key: TTableHintTemplate[TColumnNames] = None,
     merge_key: TTableHintTemplate[TColumnNames] = None,
     selected: bool = True,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    *,
+    max_concurrency: int = None,
+    parallelized: bool = False,
+    batch_size: int = None,
+    batch_timeout: float = None
 ) -> Callable[[Callable[Concatenate[TDataItem, TResourceFunParams], Any]], DltResource]:
     ...
 
@@ -460,7 +500,12 @@ def transformer(
     merge_key: TTableHintTemplate[TColumnNames] = None,
     selected: bool = True,
     spec: Type[BaseConfiguration] = None,
-    standalone: Literal[True] = True
+    standalone: Literal[True] = True,
+    *,
+    max_concurrency: int = None,
+    parallelized: bool = False,
+    batch_size: int = None,
+    batch_timeout: float = None
 ) -> Callable[[Callable[Concatenate[TDataItem, TResourceFunParams], Any]], Callable[TResourceFunParams, DltResource]]:
     ...
 
@@ -476,7 +521,12 @@ def transformer(
     primary_key: TTableHintTemplate[TColumnNames] = None,
     merge_key: TTableHintTemplate[TColumnNames] = None,
     selected: bool = True,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    *,
+    max_concurrency: int = None,
+    parallelized: bool = False,
+    batch_size: int = None,
+    batch_timeout: float = None
 ) -> DltResource:
     ...
 
@@ -493,7 +543,12 @@ def transformer(
     merge_key: TTableHintTemplate[TColumnNames] = None,
     selected: bool = True,
     spec: Type[BaseConfiguration] = None,
-    standalone: Literal[True] = True
+    standalone: Literal[True] = True,
+    *,
+    max_concurrency: int = None,
+    parallelized: bool = False,
+    batch_size: int = None,
+    batch_timeout: float = None
 ) -> Callable[TResourceFunParams, DltResource]:  # TODO: change back to Callable[TResourceFunParams, DltResource] when mypy 1.6 is fixed
     ...
 
@@ -509,7 +564,12 @@ def transformer(
     merge_key: TTableHintTemplate[TColumnNames] = None,
     selected: bool = True,
     spec: Type[BaseConfiguration] = None,
-    standalone: bool = False
+    standalone: bool = False,
+    *,
+    max_concurrency: int = None,
+    parallelized: bool = False,
+    batch_size: int = None,
+    batch_timeout: float = None
 ) -> Any:
     """A form of `dlt resource` that takes input from other resources via `data_from` argument in order to enrich or transform the data.
 
@@ -564,6 +624,17 @@ def transformer(
         spec (Type[BaseConfiguration], optional): A specification of configuration and secret values required by the source.
 
         standalone (bool, optional): Returns a wrapped decorated function that creates DltResource instance. Must be called before use. Cannot be part of a source.
+
+        max_concurrency (int, optional): Maximum number of awaitables, callables and async generators returned by the transformer that are evaluated at the same time.
+        Use with `async def` transformers to keep that many requests in flight. Unlimited if not set.
+
+        parallelized (bool, optional): When `True` the generators returned by the transformer are advanced in the extract thread pool. Defaults to `False`.
+
+        batch_size (int, optional): When set, parent items are collected into lists of up to `batch_size` items and the transformer is called once per list. Items from
+        parent lists are added one by one and each list holds items with the same `meta`. Use with bulk endpoints to reduce number of requests.
+
+        batch_timeout (float, optional): Passes an incomplete batch to the transformer when its oldest item waits longer than `batch_timeout` seconds. The batch is
+        otherwise passed when it is full or when the parent resources are exhausted.
     """
     if isinstance(f, DltResource):
         raise ValueError("Please pass `data_from=` argument as keyword argument. The only positional argument to transformer is the decorated function")
@@ -579,7 +650,11 @@ def transformer(
         selected=selected,
         spec=spec,
         standalone=standalone,
-        data_from=data_from
+        data_from=data_from,
+        max_concurrency=max_concurrency,
+        parallelized=parallelized,
+        batch_size=batch_size,
+        batch_timeout=batch_timeout
     )
 
 
@@ -37,11 +37,12 @@ except ModuleNotFoundError:
 class ExtractorItemStorage(DataItemStorage):
     load_file_type: TLoaderFileFormat
 
-    def __init__(self, storage: FileStorage, extract_folder: str="extract") -> None:
+    def __init__(self, storage: FileStorage, extract_folder: str="extract", file_max_bytes: int = None) -> None:
         # data item storage with jsonl with pua encoding
         super().__init__(self.load_file_type)
         self.extract_folder = extract_folder
         self.storage = storage
+        self.file_max_bytes = file_max_bytes
 
 
     def _get_data_item_path_template(self, load_id: str, schema_name: str, table_name: str) -> str:
@@ -56,6 +57,10 @@ class JsonLExtractorStorage(ExtractorItemStorage):
     load_file_type: TLoaderFileFormat = "puae-jsonl"
 
 
+class PickleExtractorStorage(ExtractorItemStorage):
+    load_file_type: TLoaderFileFormat = "pickle"
+
+
 class ArrowExtractorStorage(ExtractorItemStorage):
     load_file_type: TLoaderFileFormat = "arrow"
 
@@ -64,11 +69,17 @@ class ExtractorStorage(NormalizeStorage):
     EXTRACT_FOLDER: ClassVar[str] = "extract"
 
     """Wrapper around multiple extractor storages with different file formats"""
-    def __init__(self, C: NormalizeStorageConfiguration) -> None:
+    def __init__(self, C: NormalizeStorageConfiguration, items_file_format: TLoaderFileFormat = "puae-jsonl", file_max_bytes: int = None) -> None:
         super().__init__(True, C)
+        if items_file_format not in ("puae-jsonl", "pickle"):
+            raise ValueError(items_file_format)
+        # file format in which python objects (not arrow tables) are passed to normalize
+        self.items_file_format = items_file_format
+        # large files are rotated so they can be normalized by many workers, compressed files cannot be split into byte ranges
         self._item_storages: Dict[TLoaderFileFormat, ExtractorItemStorage] = {
-            "puae-jsonl": JsonLExtractorStorage(self.storage, extract_folder=self.EXTRACT_FOLDER),
-            "arrow": ArrowExtractorStorage(self.storage, extract_folder=self.EXTRACT_FOLDER)
+            "puae-jsonl": JsonLExtractorStorage(self.storage, extract_folder=self.EXTRACT_FOLDER, file_max_bytes=file_max_bytes),
+            "pickle": PickleExtractorStorage(self.storage, extract_folder=self.EXTRACT_FOLDER, file_max_bytes=file_max_bytes),
+            "arrow": ArrowExtractorStorage(self.storage, extract_folder=self.EXTRACT_FOLDER, file_max_bytes=file_max_bytes)
         }
 
     def _get_extract_path(self, extract_id: str) -> str:
@@ -150,10 +161,14 @@ class Extractor:
         else:
             if resource._table_name_hint_fun:
                 if isinstance(items, list):
+                    # partition items by table name so schema is computed and items written once per table
+                    partitions: Dict[str, List[TDataItem]] = {}
                     for item in items:
-                        self._write_dynamic_table(resource, item)
+                        partitions.setdefault(resource._table_name_hint_fun(item), []).append(item)
+                    for table_name, partition in partitions.items():
+                        self._write_dynamic_table(resource, table_name, partition)
                 else:
-                    self._write_dynamic_table(resource, items)
+                    self._write_dynamic_table(resource, resource._table_name_hint_fun(items), items)
             else:
                 # write item belonging to table with static name
                 table_name = resource.table_name  # type: ignore[assignment]
@@ -173,22 +188,22 @@ class Extractor:
         self.resources_with_items.add(resource_name)
         self.storage.write_data_item(self.extract_id, self.schema.name, table_name, items, columns)
 
-    def _write_dynamic_table(self, resource: DltResource, item: TDataItem) -> None:
-        table_name = resource._table_name_hint_fun(item)
+    def _write_dynamic_table(self, resource: DltResource, table_name: str, items: TDataItems) -> None:
+        """Writes `items` that all belong to the table with `table_name`, computed by table name hint function"""
+        items_list = items if isinstance(items, list) else [items]
         existing_table = self.dynamic_tables.get(table_name)
-        if existing_table is None:
-            self.dynamic_tables[table_name] = [resource.compute_table_schema(item)]
-        else:
-            # quick check if deep table merge is required
-            if resource._table_has_other_dynamic_hints:
-                new_table = resource.compute_table_schema(item)
+        # quick check if deep table merge is required
+        # if there are no other dynamic hints besides name then we just leave the existing partial table
+        if existing_table is None or resource._table_has_other_dynamic_hints:
+            # schema is computed once per distinct set of hints in the partition
+            table_schemas = resource.compute_table_schemas(items_list if resource._table_has_other_dynamic_hints else items_list[:1])
+            if existing_table is None:
+                existing_table = self.dynamic_tables[table_name] = [table_schemas.pop(0)]
+            for table_schema in table_schemas:
                 # this merges into existing table in place
-                utils.merge_tables(existing_table[0], new_table)
-            else:
-                # if there are no other dynamic hints besides name then we just leave the existing partial table
-                pass
+                utils.merge_tables(existing_table[0], table_schema)
         # write to storage with inferred table name
-        self._write_item(table_name, resource.name, item)
+        self._write_item(table_name, resource.name, items)
 
     def _write_static_table(self, resource: DltResource, table_name: str, items: TDataItems) -> None:
         existing_table = self.dynamic_tables.get(table_name)
@@ -199,7 +214,20 @@ class Extractor:
 
 
 class JsonLExtractor(Extractor):
-    file_format = "puae-jsonl"
+    file_format: TLoaderFileFormat = "puae-jsonl"
+
+    def __init__(
+            self,
+            extract_id: str,
+            storage: ExtractorStorage,
+            schema: Schema,
+            resources_with_items: Set[str],
+            dynamic_tables: TSchemaUpdate,
+            collector: Collector = NULL_COLLECTOR
+    ) -> None:
+        super().__init__(extract_id, storage, schema, resources_with_items, dynamic_tables, collector)
+        # python objects are written in the format configured on the storage
+        self.file_format = storage.items_file_format
 
 
 class ArrowExtractor(Extractor):
@@ -240,8 +268,7 @@ def extract(
     collector: Collector = NULL_COLLECTOR,
     *,
     max_parallel_items: int = None,
-    workers: int = None,
-    futures_poll_interval: float = None
+    workers: int = None
 ) -> TSchemaUpdate:
     dynamic_tables: TSchemaUpdate = {}
     schema = source.schema
@@ -258,7 +285,7 @@ def extract(
 
     with collector(f"Extract {source.name}"):
         # yield from all selected pipes
-        with PipeIterator.from_pipes(source.resources.selected_pipes, max_parallel_items=max_parallel_items, workers=workers, futures_poll_interval=futures_poll_interval) as pipes:
+        with PipeIterator.from_pipes(source.resources.selected_pipes, max_parallel_items=max_parallel_items, workers=workers) as pipes:
             left_gens = total_gens = len(pipes._sources)
             collector.update("Resources", 0, total_gens)
             for pipe_item in pipes:
@@ -24,7 +24,7 @@ from dlt.common.data_types.type_helpers import coerce_from_date_types, coerce_va
 
 from dlt.extract.exceptions import IncrementalUnboundError, PipeException
 from dlt.extract.incremental.exceptions import IncrementalCursorPathMissing, IncrementalPrimaryKeyMissing
-from dlt.extract.incremental.typing import IncrementalColumnState, TCursorValue, LastValueFunc
+from dlt.extract.incremental.typing import IncrementalColumnState, TCursorValue, LastValueFunc, TSortOrder
 from dlt.extract.pipe import Pipe
 from dlt.extract.utils import resolve_column_value
 from dlt.extract.typing import SupportsPipe, TTableHintTemplate, MapItem, YieldMapItem, FilterItem, ItemTransform
@@ -72,11 +72,15 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
             specified range of data. Currently Airflow scheduler is detected: "data_interval_start" and "data_interval_end" are taken from the context and passed Incremental class.
             The values passed explicitly to Incremental will be ignored.
             Note that if logical "end date" is present then also "end_value" will be set which means that resource state is not used and exactly this range of date will be loaded
+        row_order: Declares that the resource yields rows in ascending (`asc`) or descending (`desc`) order of the cursor, as defined by `last_value_func`.
+            When the order is known, the resource generator is closed as soon as all further rows are out of range (above `end_value` for `asc`,
+            below the start value for `desc`) so no more data is requested from the source. Defaults to None: the order is not known.
     """
     cursor_path: str = None
     # TODO: Support typevar here
     initial_value: Optional[Any] = None
     end_value: Optional[Any] = None
+    row_order: Optional[TSortOrder] = None
 
     def __init__(
             self,
@@ -85,7 +89,8 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
             last_value_func: Optional[LastValueFunc[TCursorValue]]=max,
             primary_key: Optional[TTableHintTemplate[TColumnNames]] = None,
             end_value: Optional[TCursorValue] = None,
-            allow_external_schedulers: bool = False
+            allow_external_schedulers: bool = False,
+            row_order: Optional[TSortOrder] = None
     ) -> None:
         self.cursor_path = cursor_path
         if self.cursor_path:
@@ -99,6 +104,9 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
         self.resource_name: Optional[str] = None
         self.primary_key: Optional[TTableHintTemplate[TColumnNames]] = primary_key
         self.allow_external_schedulers = allow_external_schedulers
+        self.row_order = row_order
+        self._pipe: SupportsPipe = None
+        """Pipe to which incremental is bound, closed when all further rows are out of range"""
 
         self._cached_state: IncrementalColumnState = None
         """State dictionary cached on first access"""
@@ -142,7 +150,8 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
             last_value_func=self.last_value_func,
             primary_key=self.primary_key,
             end_value=self.end_value,
-            allow_external_schedulers=self.allow_external_schedulers
+            allow_external_schedulers=self.allow_external_schedulers,
+            row_order=self.row_order
         )
 
     def merge(self, other: "Incremental[TCursorValue]") -> "Incremental[TCursorValue]":
@@ -193,6 +202,7 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
             self.initial_value = native_value.initial_value
             self.last_value_func = native_value.last_value_func
             self.end_value = native_value.end_value
+            self.row_order = native_value.row_order
             self.cursor_path_p = self.cursor_path_p
             self.resource_name = self.resource_name
         else:  # TODO: Maybe check if callable(getattr(native_value, '__lt__', None))
@@ -305,6 +315,7 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
         if self.is_partial():
             raise IncrementalCursorPathMissing(pipe.name, None, None)
         self.resource_name = pipe.name
+        self._pipe = pipe
         # try to join external scheduler
         if self.allow_external_schedulers:
             self._join_external_scheduler()
@@ -329,6 +340,13 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
             return self._transformers['json']
         return self._transformers['json']
 
+    def can_close(self) -> bool:
+        """Checks if all further rows will be out of range. Requires `row_order` to be declared.
+
+           Rows ordered ascending are out of range after they reach `end_value`, rows ordered descending after they get below the start value.
+        """
+        return (self.row_order == "asc" and self.end_out_of_range) or (self.row_order == "desc" and self.start_out_of_range)
+
     def __call__(self, rows: TDataItems, meta: Any = None) -> Optional[TDataItems]:
         if rows is None:
             return rows
@@ -337,8 +355,13 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
         transformer.primary_key = self.primary_key
 
         if isinstance(rows, list):
-            return  [item for item in (self._transform_item(transformer, row) for row in rows) if item is not None]
-        return self._transform_item(transformer, rows)
+            rows = [item for item in (self._transform_item(transformer, row) for row in rows) if item is not None]
+        else:
+            rows = self._transform_item(transformer, rows)
+        # stop requesting data from the resource
+        if self._pipe and self.can_close():
+            self._pipe.close()
+        return rows
 
 
 class IncrementalResourceWrapper(ItemTransform[TDataItem]):
@@ -1,18 +1,16 @@
+import sys
+import base64
+import hashlib
+from array import array
 from datetime import datetime, date  # noqa: I251
-from typing import Optional, Tuple, List
+from typing import Any, Iterable, Optional, Sequence, Set, Tuple, List
 
 try:
     import pandas as pd
 except ModuleNotFoundError:
     pd = None
 
-try:
-    import numpy as np
-except ModuleNotFoundError:
-    np = None
-
 from dlt.common.exceptions import MissingDependencyException
-from dlt.common.utils import digest128
 from dlt.common.json import json
 from dlt.common import pendulum
 from dlt.common.typing import TDataItem, TDataItems
@@ -23,12 +21,50 @@ from dlt.extract.utils import resolve_column_value
 from dlt.extract.typing import TTableHintTemplate
 from dlt.common.schema.typing import TColumnNames
 try:
-    from dlt.common.libs.pyarrow import pyarrow as pa, TAnyArrowItem
+    from dlt.common.libs.pyarrow import pyarrow as pa, TAnyArrowItem, hash_rows
 except MissingDependencyException:
     pa = None
 
 
 
+HASH_SIZE = 8
+"""Size in bytes of a row hash stored in the incremental state"""
+ARROW_HASH_BIT = 1
+"""Lowest bit is set in hashes of arrow rows and cleared in hashes of json rows"""
+
+
+def _digest_to_hash(digest: bytes) -> int:
+    return int.from_bytes(digest[:HASH_SIZE], "little") & ~ARROW_HASH_BIT
+
+
+def unique_hash(value: str) -> int:
+    """Returns 64 bit hash of `value`. Those are the leading bytes of `digest128` so digests stored by former versions can be converted"""
+    return _digest_to_hash(hashlib.shake_128(value.encode("utf-8")).digest(HASH_SIZE))
+
+
+def pack_unique_hashes(hashes: Iterable[int]) -> bytes:
+    """Packs `hashes` into little endian 64 bit integers"""
+    packed = array("Q", hashes)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack_unique_hashes(chunks: Sequence[Any]) -> List[int]:
+    """Returns hashes from packed `chunks` stored in the state. Base64 digests stored by former versions are converted."""
+    hashes: List[int] = []
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            hashes.append(_digest_to_hash(base64.b64decode(chunk + "=" * (-len(chunk) % 4))))
+        else:
+            packed = array("Q")
+            packed.frombytes(chunk)
+            if sys.byteorder == "big":
+                packed.byteswap()
+            hashes.extend(packed)
+    return hashes
+
+
 class IncrementalTransformer:
     def __init__(
         self,
@@ -47,6 +83,9 @@ class IncrementalTransformer:
         self.incremental_state = incremental_state
         self.last_value_func = last_value_func
         self.primary_key = primary_key
+        self._unique_hashes_chunks: List[bytes] = None
+        self._unique_hashes_set: Set[int] = None
+        self._unique_hashes_size = 0
 
     def __call__(
         self,
@@ -54,6 +93,54 @@ class IncrementalTransformer:
     ) -> Tuple[bool, bool, bool]:
         ...
 
+    @property
+    def unique_hashes(self) -> Set[int]:
+        """Hashes of rows with cursor equal to `last_value` as a set, kept in sync with the packed chunks stored in the state"""
+        chunks = self.incremental_state["unique_hashes"]
+        # rebuild if chunks were replaced or modified elsewhere ie. by a transformer for other item format
+        if chunks is not self._unique_hashes_chunks or sum(len(chunk) for chunk in chunks) != self._unique_hashes_size:
+            hashes = dict.fromkeys(unpack_unique_hashes(chunks))
+            if any(isinstance(chunk, str) for chunk in chunks):
+                # migrate list of digests stored by former versions
+                chunks = self.incremental_state["unique_hashes"] = [pack_unique_hashes(hashes)]
+            self._unique_hashes_set = set(hashes)
+            self._unique_hashes_chunks = chunks
+            self._unique_hashes_size = sum(len(chunk) for chunk in chunks)
+        return self._unique_hashes_set
+
+    def add_unique_hash(self, unique_value: int) -> bool:
+        """Adds `unique_value` to the state, returns False if it was already present"""
+        hashes = self.unique_hashes
+        if unique_value in hashes:
+            return False
+        hashes.add(unique_value)
+        self._append_unique_hashes([unique_value])
+        return True
+
+    def add_unique_hashes(self, unique_values: Iterable[int]) -> None:
+        """Adds `unique_values` that are not yet present to the state"""
+        hashes = self.unique_hashes
+        new_values = [value for value in dict.fromkeys(unique_values) if value not in hashes]
+        if new_values:
+            hashes.update(new_values)
+            self._append_unique_hashes(new_values)
+
+    def set_unique_hashes(self, unique_values: Iterable[int]) -> None:
+        """Replaces hashes in the state with unique `unique_values`, preserving the order"""
+        packed = pack_unique_hashes(dict.fromkeys(unique_values))
+        self.incremental_state["unique_hashes"] = [packed] if packed else []
+
+    def _append_unique_hashes(self, unique_values: Sequence[int]) -> None:
+        """Appends packed `unique_values` to the state chunks. Trailing chunks that are not larger are merged so the
+           number of chunks stays logarithmic and each hash is copied a logarithmic number of times
+        """
+        chunk = pack_unique_hashes(unique_values)
+        self._unique_hashes_size += len(chunk)
+        chunks = self._unique_hashes_chunks
+        while chunks and len(chunks[-1]) <= len(chunk):
+            chunk = chunks.pop() + chunk
+        chunks.append(chunk)
+
 
 class JsonIncremental(IncrementalTransformer):
     def unique_value(
@@ -61,12 +148,12 @@ class JsonIncremental(IncrementalTransformer):
         row: TDataItem,
         primary_key: Optional[TTableHintTemplate[TColumnNames]],
         resource_name: str
-    ) -> str:
+    ) -> Optional[int]:
         try:
             if primary_key:
-                return digest128(json.dumps(resolve_column_value(primary_key, row), sort_keys=True))
+                return unique_hash(json.dumps(resolve_column_value(primary_key, row), sort_keys=True))
             elif primary_key is None:
-                return digest128(json.dumps(row, sort_keys=True))
+                return unique_hash(json.dumps(row, sort_keys=True))
             else:
                 return None
         except KeyError as k_err:
@@ -113,11 +200,9 @@ class JsonIncremental(IncrementalTransformer):
             if processed_row_value == last_value:
                 unique_value = self.unique_value(row, self.primary_key, self.resource_name)
                 # if unique value exists then use it to deduplicate
-                if unique_value:
-                    if unique_value in self.incremental_state['unique_hashes']:
-                        return None, start_out_of_range, end_out_of_range
-                    # add new hash only if the record row id is same as current last value
-                    self.incremental_state['unique_hashes'].append(unique_value)
+                # add new hash only if the record row id is same as current last value
+                if unique_value is not None and not self.add_unique_hash(unique_value):
+                    return None, start_out_of_range, end_out_of_range
                 return row, start_out_of_range, end_out_of_range
             # skip the record that is not a last_value or new_value: that record was already processed
             check_values = (row_value,) + ((self.start_value,) if self.start_value is not None else ())
@@ -131,53 +216,66 @@ class JsonIncremental(IncrementalTransformer):
         else:
             self.incremental_state["last_value"] = new_value
             unique_value = self.unique_value(row, self.primary_key, self.resource_name)
-            if unique_value:
-                self.incremental_state["unique_hashes"] = [unique_value]
+            if unique_value is not None:
+                self.set_unique_hashes([unique_value])
 
         return row, start_out_of_range, end_out_of_range
 
 
 class ArrowIncremental(IncrementalTransformer):
-    _dlt_index = "_dlt_index"
+    _value_set: "pa.Array" = None
+    _value_set_hashes: Set[int] = None
+    _has_json_hashes: bool = False
 
     def unique_values(
         self,
         item: "TAnyArrowItem",
         unique_columns: List[str],
         resource_name: str
-    ) -> List[Tuple[int, str]]:
-        if not unique_columns:
-            return []
-        item = item
-        indices = item[self._dlt_index].to_pylist()
+    ) -> "pa.Array":
+        """Returns an array with a hash of each row of `item` over `unique_columns`, computed over the columns with `hash_rows`"""
+        if not unique_columns or item.num_rows == 0:
+            return pa.array([], type=pa.uint64())
+        return pa.compute.bit_wise_or(hash_rows(item, unique_columns), pa.scalar(ARROW_HASH_BIT, type=pa.uint64()))
+
+    def json_unique_values(self, item: "TAnyArrowItem", unique_columns: List[str]) -> "pa.Array":
+        """Returns an array with a hash of each row of `item` as computed by former versions and for json rows. Rows are hashed one by one."""
         rows = item.select(unique_columns).to_pylist()
-        return [
-            (index, digest128(json.dumps(row, sort_keys=True))) for index, row in zip(indices, rows)
-        ]
-
-    def _deduplicate(self, tbl: "pa.Table", unique_columns: Optional[List[str]], aggregate: str, cursor_path: str) -> "pa.Table":
-        """Creates unique index if necessary."""
-        # create unique index if necessary
-        if self._dlt_index not in tbl.schema.names:
-            tbl = tbl.append_column(self._dlt_index, pa.array(np.arange(tbl.num_rows)))
-        # code below deduplicates groups that include the cursor column in the group id. that was just artifact of
-        # json incremental and there's no need to duplicate it here
-
-        # if unique_columns is None:
-        #     return tbl
-        # group_cols = unique_columns + [cursor_path]
-        # try:
-        #     tbl = tbl.filter(
-        #         pa.compute.is_in(
-        #             tbl[self._dlt_index],
-        #             tbl.group_by(group_cols).aggregate(
-        #                 [(self._dlt_index, "one"), (cursor_path, aggregate)]
-        #             )[f'{self._dlt_index}_one']
-        #         )
-        #     )
-        # except KeyError as e:
-            # raise IncrementalPrimaryKeyMissing(self.resource_name, unique_columns[0], tbl) from e
-        return tbl
+        return pa.array([unique_hash(json.dumps(row, sort_keys=True)) for row in rows], type=pa.uint64())
+
+    def _unique_hashes_value_set(self) -> "pa.Array":
+        """Returns hashes from the state as an arrow array, rebuilt only when the hashes change"""
+        hashes = self.unique_hashes
+        if hashes is not self._value_set_hashes or len(hashes) != len(self._value_set):
+            self._value_set = pa.array(list(hashes), type=pa.uint64())
+            self._value_set_hashes = hashes
+            self._has_json_hashes = bool(pa.compute.any(pa.compute.equal(
+                pa.compute.bit_wise_and(self._value_set, pa.scalar(ARROW_HASH_BIT, type=pa.uint64())), 0
+            )).as_py())
+        return self._value_set
+
+    def _remove_processed_rows(self, tbl: "TAnyArrowItem", eq_mask: "pa.Array", unique_columns: List[str]) -> Tuple["TAnyArrowItem", "pa.Array"]:
+        """Removes rows selected by `eq_mask` whose hashes are already in the state. Returns filtered table and hashes of the remaining selected rows"""
+        if not unique_columns:
+            return tbl, pa.array([], type=pa.uint64())
+        eq_tbl = tbl.filter(eq_mask)
+        eq_hashes = self.unique_values(eq_tbl, unique_columns, self.resource_name)
+        value_set = self._unique_hashes_value_set()
+        is_processed = pa.compute.is_in(eq_hashes, value_set=value_set)
+        if self._has_json_hashes:
+            # state keeps hashes stored by former versions or by json items of this resource, compare with those as well
+            is_processed = pa.compute.or_(
+                is_processed, pa.compute.is_in(self.json_unique_values(eq_tbl, unique_columns), value_set=value_set)
+            )
+        # spread the flags of selected rows over the whole table
+        remove_mask = pa.compute.replace_with_mask(eq_mask, eq_mask, is_processed)
+        return tbl.filter(pa.compute.invert(remove_mask)), eq_hashes.filter(pa.compute.invert(is_processed))
+
+    def _rows_equal_mask(self, tbl: "TAnyArrowItem", cursor_path: str, value: Any) -> "pa.Array":
+        eq_mask = pa.compute.fill_null(pa.compute.equal(tbl[cursor_path], value), False)
+        if isinstance(eq_mask, pa.ChunkedArray):
+            eq_mask = eq_mask.combine_chunks()
+        return eq_mask
 
     def __call__(
         self,
@@ -198,9 +296,6 @@ class ArrowIncremental(IncrementalTransformer):
             for pk in unique_columns:
                 if pk not in tbl.schema.names:
                     raise IncrementalPrimaryKeyMissing(self.resource_name, pk, tbl)
-            # use primary key as unique index
-            if isinstance(primary_key, str):
-                self._dlt_index = primary_key
         elif primary_key is None:
             unique_columns = tbl.column_names
         else:  # deduplicating is disabled
@@ -214,13 +309,11 @@ class ArrowIncremental(IncrementalTransformer):
 
         if self.last_value_func is max:
             compute = pa.compute.max
-            aggregate = "max"
             end_compare = pa.compute.less
             last_value_compare = pa.compute.greater_equal
             new_value_compare = pa.compute.greater
         elif self.last_value_func is min:
             compute = pa.compute.min
-            aggregate = "min"
             end_compare = pa.compute.greater
             last_value_compare = pa.compute.less_equal
             new_value_compare = pa.compute.less
@@ -259,39 +352,26 @@ class ArrowIncremental(IncrementalTransformer):
                 start_out_of_range = bool(pa.compute.any(pa.compute.invert(keep_filter)).as_py())
                 tbl = tbl.filter(keep_filter)
 
-            # Deduplicate after filtering old values
-            tbl = self._deduplicate(tbl, unique_columns, aggregate, cursor_path)
             # Remove already processed rows where the cursor is equal to the last value
-            eq_rows = tbl.filter(pa.compute.equal(tbl[cursor_path], last_value))
-            # compute index, unique hash mapping
-            unique_values = self.unique_values(eq_rows, unique_columns, self.resource_name)
-            unique_values = [(i, uq_val) for i, uq_val in unique_values if uq_val in self.incremental_state['unique_hashes']]
-            remove_idx = pa.array(i for i, _ in unique_values)
-            # Filter the table
-            tbl = tbl.filter(pa.compute.invert(pa.compute.is_in(tbl[self._dlt_index], remove_idx)))
+            tbl, new_hashes = self._remove_processed_rows(tbl, self._rows_equal_mask(tbl, cursor_path, last_value), unique_columns)
 
             if new_value_compare(row_value, last_value).as_py() and row_value != last_value:  # Last value has changed
                 self.incremental_state['last_value'] = row_value
                 # Compute unique hashes for all rows equal to row value
-                self.incremental_state['unique_hashes'] = [uq_val for _, uq_val in self.unique_values(
-                    tbl.filter(pa.compute.equal(tbl[cursor_path], row_value)), unique_columns, self.resource_name
-                )]
+                self.set_unique_hashes(self.unique_values(
+                    tbl.filter(self._rows_equal_mask(tbl, cursor_path, row_value)), unique_columns, self.resource_name
+                ).to_pylist())
             else:
-                # last value is unchanged, add the hashes
-                self.incremental_state['unique_hashes'] = list(set(self.incremental_state['unique_hashes'] + [uq_val for _, uq_val in unique_values]))
+                # last value is unchanged, add the hashes of new rows equal to it
+                self.add_unique_hashes(new_hashes.to_pylist())
         else:
-            tbl = self._deduplicate(tbl, unique_columns, aggregate, cursor_path)
             self.incremental_state['last_value'] = row_value
-            self.incremental_state['unique_hashes'] = [uq_val for _, uq_val in self.unique_values(
-                tbl.filter(pa.compute.equal(tbl[cursor_path], row_value)), unique_columns, self.resource_name
-            )]
+            self.set_unique_hashes(self.unique_values(
+                tbl.filter(self._rows_equal_mask(tbl, cursor_path, row_value)), unique_columns, self.resource_name
+            ).to_pylist())
 
         if len(tbl) == 0:
             return None, start_out_of_range, end_out_of_range
-        try:
-            tbl = tbl.drop(["_dlt_index"])
-        except KeyError:
-            pass
         if is_pandas:
             return tbl.to_pandas(), start_out_of_range, end_out_of_range
         return tbl, start_out_of_range, end_out_of_range
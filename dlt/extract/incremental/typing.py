@@ -1,10 +1,12 @@
-from typing import TypedDict, Optional, Any, List, TypeVar, Callable, Sequence
+from typing import Literal, TypedDict, Optional, Any, List, TypeVar, Callable, Sequence
 
 
 TCursorValue = TypeVar("TCursorValue", bound=Any)
 LastValueFunc = Callable[[Sequence[TCursorValue]], Any]
+TSortOrder = Literal["asc", "desc"]
 
 class IncrementalColumnState(TypedDict):
     initial_value: Optional[Any]
     last_value: Optional[Any]
-    unique_hashes: List[str]
+    unique_hashes: List[bytes]
+    """Hashes of rows with cursor equal to `last_value` packed in chunks of 64 bit integers. Former versions stored a list of base64 digests"""
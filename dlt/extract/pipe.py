@@ -1,21 +1,21 @@
 import inspect
+import time
 import types
 import asyncio
+import warnings
 import makefun
-from asyncio import Future
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait as wait_for_futures
 from copy import copy
 from threading import Thread
-from typing import Any, Dict, Optional, Sequence, Union, Callable, Iterable, Iterator, List, NamedTuple, Awaitable, Tuple, Type, TYPE_CHECKING, Literal
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Generator, Optional, Sequence, Set, Union, Callable, Iterable, Iterator, List, NamedTuple, Awaitable, Tuple, Type, TYPE_CHECKING, Literal
 
-from dlt.common import sleep
 from dlt.common.configuration import configspec
 from dlt.common.configuration.inject import with_config
 from dlt.common.configuration.specs import BaseConfiguration, ContainerInjectableContext
 from dlt.common.configuration.container import Container
 from dlt.common.exceptions import PipelineException
 from dlt.common.source import unset_current_pipe_name, set_current_pipe_name
-from dlt.common.typing import AnyFun, AnyType, TDataItems
+from dlt.common.typing import AnyFun, AnyType, TDataItem, TDataItems
 from dlt.common.utils import get_callable_name
 
 from dlt.extract.exceptions import (CreatePipeException, DltSourceException, ExtractorException, InvalidStepFunctionArguments,
@@ -50,6 +50,17 @@ class FuturePipeItem(NamedTuple):
     step: int
     pipe: "Pipe"
     meta: Any
+    source: Union[AsyncIterator[TPipedDataItems], Iterator[TPipedDataItems]] = None
+    """An async generator or parallelized iterator that produced the future, next item is requested when future is resolved"""
+
+
+class BatchPipeItem(NamedTuple):
+    item: List[TDataItem]
+    step: int
+    pipe: "Pipe"
+    meta: Any
+    created_at: float
+    """Monotonic time when first item was added to the batch"""
 
 
 class SourcePipeItem(NamedTuple):
@@ -60,7 +71,6 @@ class SourcePipeItem(NamedTuple):
 
 
 # pipeline step may be iterator of data items or mapping function that returns data item or another iterator
-from dlt.common.typing import TDataItem
 TPipeStep = Union[
     Iterable[TPipedDataItems],
     Iterator[TPipedDataItems],
@@ -77,6 +87,35 @@ TPipeStep = Union[
 TPipeNextItemMode = Union[Literal["fifo"], Literal["round_robin"]]
 
 
+class TokenBucket:
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """A token bucket that refills `rate` tokens per second up to `burst` tokens. Each token allows a single request"""
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def delay(self) -> float:
+        """Returns number of seconds until a token is available"""
+        self._refill()
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def reserve(self) -> float:
+        """Takes a token, possibly from the future. Returns number of seconds to wait before making the request"""
+        self._refill()
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
+
+
 class ForkPipe:
     def __init__(self, pipe: "Pipe", step: int = -1, copy_on_fork: bool = False) -> None:
         """A transformer that forks the `pipe` and sends the data items to forks added via `add_pipe` method."""
@@ -109,6 +148,20 @@ class Pipe(SupportsPipe):
         self._gen_idx = 0
         self._steps: List[TPipeStep] = []
         self.parent = parent
+        self.max_concurrency: int = None
+        """Maximum number of awaitables, callables and async generators evaluated at the same time for this pipe. Unlimited if not set"""
+        self.parallelized: bool = False
+        """Evaluates the data generating step and iterators yielded in this pipe in the thread pool, one item at a time"""
+        self.batch_size: int = None
+        """Transformer pipe only: passes lists of up to `batch_size` parent items to the data generating step"""
+        self.batch_timeout: float = None
+        """Transformer pipe only: passes incomplete batch to the data generating step if oldest item waits longer than `batch_timeout` seconds"""
+        self.rate_limit: float = None
+        """Maximum number of requests per second made by this pipe: items requested from its iterators and awaitables or callables it submits"""
+        self.rate_limit_burst: int = 1
+        """Number of requests that may be made at once when the pipe was idle"""
+        self._closing = False
+        """Set by `close` for data generating steps closed by the PipeIterator when their pending item is resolved"""
         # add the steps, this will check and mod transformations
         if steps:
             for step in steps:
@@ -227,9 +280,25 @@ class Pipe(SupportsPipe):
         p = Pipe(self.name, [])
         # set the steps so they are not evaluated again
         p._steps = steps
+        p.max_concurrency = self.max_concurrency
+        p.parallelized = self.parallelized
         # return pipe with resolved dependencies
         return p
 
+    def close(self) -> None:
+        """Closes the generator in the data generating step. Items that were already produced are processed, no new items are requested.
+
+           Async generators and generators of parallelized pipes are evaluated by the PipeIterator in the background. They are closed
+           by the iterator when the item requested from them is resolved.
+        """
+        if self.is_empty:
+            return
+        gen = self.gen
+        if inspect.isasyncgen(gen) or (self.parallelized and inspect.isgenerator(gen)):
+            self._closing = True
+        elif inspect.isgenerator(gen):
+            gen.close()
+
     def ensure_gen_bound(self) -> None:
         """Verifies that gen step is bound to data"""
         head = self.gen
@@ -259,6 +328,8 @@ class Pipe(SupportsPipe):
             # otherwise it must be an iterator
             if isinstance(gen, Iterable):
                 self.replace_gen(iter(gen))
+            elif isinstance(gen, AsyncIterable):
+                self.replace_gen(gen.__aiter__())
         else:
             # verify if transformer can be called
             self._ensure_transform_step(self._gen_idx, gen)
@@ -307,9 +378,9 @@ class Pipe(SupportsPipe):
         return _data
 
     def _verify_head_step(self, step: TPipeStep) -> None:
-        # first element must be Iterable, Iterator or Callable in resource pipe
-        if not isinstance(step, (Iterable, Iterator)) and not callable(step):
-            raise CreatePipeException(self.name, "A head of a resource pipe must be Iterable, Iterator or a Callable")
+        # first element must be Iterable, Iterator, async Iterable or Callable in resource pipe
+        if not isinstance(step, (Iterable, Iterator, AsyncIterable)) and not callable(step):
+            raise CreatePipeException(self.name, "A head of a resource pipe must be Iterable, Iterator, AsyncIterable or a Callable")
 
     def _wrap_transform_step_meta(self, step_no: int, step: TPipeStep) -> TPipeStep:
         # step must be a callable: a transformer or a transformation
@@ -394,6 +465,13 @@ class Pipe(SupportsPipe):
 
         p = Pipe(new_name or self.name, [], new_parent)
         p._steps = self._steps.copy()
+        p._gen_idx = self._gen_idx
+        p.max_concurrency = self.max_concurrency
+        p.parallelized = self.parallelized
+        p.batch_size = self.batch_size
+        p.batch_timeout = self.batch_timeout
+        p.rate_limit = self.rate_limit
+        p.rate_limit_burst = self.rate_limit_burst
         return p
 
     def __repr__(self) -> str:
@@ -410,16 +488,14 @@ class PipeIterator(Iterator[PipeItem]):
     class PipeIteratorConfiguration(BaseConfiguration):
         max_parallel_items: int = 20
         workers: int = 5
-        futures_poll_interval: float = 0.01
         copy_on_fork: bool = False
         next_item_mode: str = "fifo"
 
         __section__ = "extract"
 
-    def __init__(self, max_parallel_items: int, workers: int, futures_poll_interval: float, next_item_mode: TPipeNextItemMode) -> None:
+    def __init__(self, max_parallel_items: int, workers: int, next_item_mode: TPipeNextItemMode) -> None:
         self.max_parallel_items = max_parallel_items
         self.workers = workers
-        self.futures_poll_interval = futures_poll_interval
 
         self._round_robin_index: int = -1
         self._initial_sources_count: int = 0
@@ -428,11 +504,16 @@ class PipeIterator(Iterator[PipeItem]):
         self._thread_pool: ThreadPoolExecutor = None
         self._sources: List[SourcePipeItem] = []
         self._futures: List[FuturePipeItem] = []
+        self._deferred: List[ResolvablePipeItem] = []
+        """Items of pipes that reached `max_concurrency` or are throttled, retried in order before any other item of the pipe"""
+        self._batches: Dict[Pipe, BatchPipeItem] = {}
+        self._rate_limiters: Dict[Pipe, TokenBucket] = {}
         self._next_item_mode = next_item_mode
 
     @classmethod
     @with_config(spec=PipeIteratorConfiguration)
-    def from_pipe(cls, pipe: Pipe, *, max_parallel_items: int = 20, workers: int = 5, futures_poll_interval: float = 0.01, next_item_mode: TPipeNextItemMode = "fifo") -> "PipeIterator":
+    def from_pipe(cls, pipe: Pipe, *, max_parallel_items: int = 20, workers: int = 5, futures_poll_interval: float = None, next_item_mode: TPipeNextItemMode = "fifo") -> "PipeIterator":
+        PipeIterator._warn_futures_poll_interval(futures_poll_interval)
         # join all dependent pipes
         if pipe.parent:
             pipe = pipe.full_pipe()
@@ -440,12 +521,12 @@ class PipeIterator(Iterator[PipeItem]):
         pipe = pipe._clone()
         # head must be iterator
         pipe.evaluate_gen()
-        if not isinstance(pipe.gen, Iterator):
+        if not isinstance(pipe.gen, (Iterator, AsyncIterator)):
             raise PipeGenInvalid(pipe.name, pipe.gen)
         # create extractor
-        extract = cls(max_parallel_items, workers, futures_poll_interval, next_item_mode)
+        extract = cls(max_parallel_items, workers, next_item_mode)
         # add as first source
-        extract._sources.append(SourcePipeItem(pipe.gen, 0, pipe, None))
+        extract._sources.append(PipeIterator._source_from_gen(pipe))
         cls._initial_sources_count = 1
         return extract
 
@@ -458,13 +539,14 @@ class PipeIterator(Iterator[PipeItem]):
         *,
         max_parallel_items: int = 20,
         workers: int = 5,
-        futures_poll_interval: float = 0.01,
+        futures_poll_interval: float = None,
         copy_on_fork: bool = False,
         next_item_mode: TPipeNextItemMode = "fifo"
     ) -> "PipeIterator":
+        PipeIterator._warn_futures_poll_interval(futures_poll_interval)
 
         # print(f"max_parallel_items: {max_parallel_items} workers: {workers}")
-        extract = cls(max_parallel_items, workers, futures_poll_interval, next_item_mode)
+        extract = cls(max_parallel_items, workers, next_item_mode)
         # clone all pipes before iterating (recursively) as we will fork them (this add steps) and evaluate gens
         pipes, _ = PipeIterator.clone_pipes(pipes)
 
@@ -482,11 +564,11 @@ class PipeIterator(Iterator[PipeItem]):
             else:
                 # head of independent pipe must be iterator
                 pipe.evaluate_gen()
-                if not isinstance(pipe.gen, Iterator):
+                if not isinstance(pipe.gen, (Iterator, AsyncIterator)):
                     raise PipeGenInvalid(pipe.name, pipe.gen)
                 # add every head as source only once
                 if not any(i.pipe == pipe for i in extract._sources):
-                    extract._sources.append(SourcePipeItem(pipe.gen, 0, pipe, None))
+                    extract._sources.append(PipeIterator._source_from_gen(pipe))
 
         # reverse pipes for current mode, as we start processing from the back
         if next_item_mode == "fifo":
@@ -498,85 +580,204 @@ class PipeIterator(Iterator[PipeItem]):
 
         return extract
 
+    @staticmethod
+    def _warn_futures_poll_interval(futures_poll_interval: float) -> None:
+        if futures_poll_interval is not None:
+            warnings.warn("futures_poll_interval is deprecated and not used: the pipe iterator waits for the futures to complete instead of polling them. It will be removed in the next major release.", DeprecationWarning, stacklevel=3)
+
     def __next__(self) -> PipeItem:
-        pipe_item: Union[ResolvablePipeItem, SourcePipeItem] = None
+        pipe_item: ResolvablePipeItem = None
         # __next__ should call itself to remove the `while` loop and continue clauses but that may lead to stack overflows: there's no tail recursion opt in python
         # https://stackoverflow.com/questions/13591970/does-python-optimize-tail-recursion (see Y combinator on how it could be emulated)
+        # tells if current item was taken from a source, rate limit for such items was already applied
+        from_source = False
+        # tells if current item is a deferred item that is retried
+        from_deferred = False
         while True:
             # do we need new item?
             if pipe_item is None:
+                from_source = False
+                from_deferred = False
+                # pass expired batches to transformers
+                if len(self._batches) > 0:
+                    batch_item = self._pop_batch(ready_only=True)
+                    if batch_item is not None:
+                        pipe_item = self._advance_step(batch_item)
+                        continue
+                # retry deferred items first so they keep their order
+                if len(self._deferred) > 0:
+                    pipe_item = self._pop_deferred()
+                    from_deferred = pipe_item is not None
                 # process element from the futures
-                if len(self._futures) > 0:
+                if pipe_item is None and len(self._futures) > 0:
                     pipe_item = self._resolve_futures()
                 # if none then take element from the newest source
                 if pipe_item is None:
                     pipe_item = self._get_source_item()
+                    from_source = pipe_item is not None
 
                 if pipe_item is None:
-                    if len(self._futures) == 0 and len(self._sources) == 0:
+                    if len(self._futures) == 0 and len(self._sources) == 0 and len(self._deferred) == 0:
+                        if len(self._batches) > 0:
+                            # no more items will come, pass incomplete batches
+                            pipe_item = self._advance_step(self._pop_batch())
+                            continue
                         # no more elements in futures or sources
                         raise StopIteration()
                     else:
-                        sleep(self.futures_poll_interval)
+                        # sources may be throttled and batches may expire
+                        timeouts = [t for t in (self._batch_wait_timeout(), self._rate_limit_wait_timeout()) if t is not None]
+                        self._wait_for_futures(min(timeouts) if timeouts else None)
                     continue
 
             item = pipe_item.item
-            # if item is iterator, then add it as a new source
-            if isinstance(item, Iterator):
+            # if item is iterator, then add it as a new source. the data generating step of parallelized pipe and iterators
+            # it yields are evaluated in the thread pool, iterators of other steps (ie. ForkPipe) are always expanded here
+            if isinstance(item, Iterator) and not self._is_parallelized_item(pipe_item):
                 # print(f"adding iterable {item}")
                 self._sources.append(SourcePipeItem(item, pipe_item.step, pipe_item.pipe, pipe_item.meta))
                 pipe_item = None
                 continue
 
-            if isinstance(item, Awaitable) or callable(item):
+            if isinstance(item, (Awaitable, AsyncIterator, Iterator)) or callable(item):
+                if not from_deferred and self._has_deferred(pipe_item.pipe):
+                    # wait behind the items deferred before
+                    self._deferred.append(pipe_item)
+                    pipe_item = None
+                    continue
                 # do we have a free slot or one of the slots is done?
                 if len(self._futures) < self.max_parallel_items or self._next_future() >= 0:
+                    if item is not pipe_item.pipe.gen and self._pipe_concurrency_exceeded(pipe_item.pipe):
+                        # print("maximum pipe concurrency exceeded, deferring")
+                        if self._next_future() == -1:
+                            self._wait_for_futures()
+                        # try the item again when done futures are resolved
+                        self._defer(pipe_item, from_deferred)
+                        pipe_item = None
+                        continue
+                    delay = 0.0
+                    if not from_source and pipe_item.pipe.rate_limit:
+                        if self._rate_limit_delay(pipe_item.pipe) > 0:
+                            # try the item again when rate limit allows
+                            self._defer(pipe_item, from_deferred)
+                            pipe_item = None
+                            continue
+                        delay = self._reserve_rate_limit(pipe_item.pipe)
+                    # async generators and parallelized iterators are evaluated one item at a time
+                    if isinstance(item, (AsyncIterator, Iterator)):
+                        self._submit_source(item, pipe_item.step, pipe_item.pipe, pipe_item.meta, delay)
+                        pipe_item = None
+                        continue
                     # check if Awaitable first - awaitable can also be a callable
+                    future: TItemFuture
                     if isinstance(item, Awaitable):
-                        future = asyncio.run_coroutine_threadsafe(item, self._ensure_async_pool())
+                        future = asyncio.run_coroutine_threadsafe(self._await(item), self._ensure_async_pool())
                     elif callable(item):
                         future = self._ensure_thread_pool().submit(item)
                     # print(future)
-                    self._futures.append(FuturePipeItem(future, pipe_item.step, pipe_item.pipe, pipe_item.meta))  # type: ignore
+                    self._futures.append(FuturePipeItem(future, pipe_item.step, pipe_item.pipe, pipe_item.meta))
                     # pipe item consumed for now, request a new one
                     pipe_item = None
                     continue
                 else:
                     # print("maximum futures exceeded, waiting")
-                    sleep(self.futures_poll_interval)
+                    self._wait_for_futures()
                 # try same item later
                 continue
 
             # if we are at the end of the pipe then yield element
             if pipe_item.step == len(pipe_item.pipe) - 1:
                 # must be resolved
-                if isinstance(item, (Iterator, Awaitable)) or callable(item):
+                if isinstance(item, (Iterator, Awaitable, AsyncIterator)) or callable(item):
                     raise PipeItemProcessingError(
                         pipe_item.pipe.name, f"Pipe item at step {pipe_item.step} was not fully evaluated and is of type {type(pipe_item.item).__name__}. This is internal error or you are yielding something weird from resources ie. functions or awaitables.")
                 # mypy not able to figure out that item was resolved
                 return pipe_item  # type: ignore
 
+            # collect items for batched transformer
+            if pipe_item.pipe.batch_size and pipe_item.step + 1 == pipe_item.pipe._gen_idx and pipe_item.pipe.has_parent:
+                batch_item = self._add_to_batch(pipe_item)
+                pipe_item = None if batch_item is None else self._advance_step(batch_item)
+                from_source = False
+                continue
+
             # advance to next step
-            step = pipe_item.pipe[pipe_item.step + 1]
-            try:
-                set_current_pipe_name(pipe_item.pipe.name)
-                next_meta = pipe_item.meta
-                next_item = step(item, meta=pipe_item.meta)  # type: ignore
-                if isinstance(next_item, DataItemWithMeta):
-                    next_meta = next_item.meta
-                    next_item = next_item.data
-            except TypeError as ty_ex:
-                assert callable(step)
-                raise InvalidStepFunctionArguments(pipe_item.pipe.name, get_callable_name(step), inspect.signature(step), str(ty_ex))
-            except (PipelineException, ExtractorException, DltSourceException, PipeException):
-                raise
-            except Exception as ex:
-                raise ResourceExtractionError(pipe_item.pipe.name, step, str(ex), "transform") from ex
-            # create next pipe item if a value was returned. A None means that item was consumed/filtered out and should not be further processed
-            if next_item is not None:
-                pipe_item = ResolvablePipeItem(next_item, pipe_item.step + 1, pipe_item.pipe, next_meta)
-            else:
-                pipe_item = None
+            pipe_item = self._advance_step(pipe_item)
+            from_source = False
+
+    @staticmethod
+    def _is_parallelized_item(pipe_item: ResolvablePipeItem) -> bool:
+        """Checks if `pipe_item` is the data generating step of a parallelized pipe or was produced by it"""
+        pipe = pipe_item.pipe
+        return pipe.parallelized and (pipe_item.step == pipe._gen_idx or pipe_item.item is pipe.gen)
+
+    def _advance_step(self, pipe_item: Union[ResolvablePipeItem, BatchPipeItem]) -> ResolvablePipeItem:
+        """Passes item to the next step of the pipe. Returns None if item was consumed/filtered out"""
+        step = pipe_item.pipe[pipe_item.step + 1]
+        try:
+            set_current_pipe_name(pipe_item.pipe.name)
+            next_meta = pipe_item.meta
+            next_item = step(pipe_item.item, meta=pipe_item.meta)  # type: ignore
+            if isinstance(next_item, DataItemWithMeta):
+                next_meta = next_item.meta
+                next_item = next_item.data
+        except TypeError as ty_ex:
+            assert callable(step)
+            raise InvalidStepFunctionArguments(pipe_item.pipe.name, get_callable_name(step), inspect.signature(step), str(ty_ex))
+        except (PipelineException, ExtractorException, DltSourceException, PipeException):
+            raise
+        except Exception as ex:
+            raise ResourceExtractionError(pipe_item.pipe.name, step, str(ex), "transform") from ex
+        # create next pipe item if a value was returned. A None means that item was consumed/filtered out and should not be further processed
+        if next_item is not None:
+            return ResolvablePipeItem(next_item, pipe_item.step + 1, pipe_item.pipe, next_meta)
+        return None
+
+    def _add_to_batch(self, pipe_item: ResolvablePipeItem) -> BatchPipeItem:
+        """Adds item to the batch of its pipe. Returns a batch that is full or that holds items with different meta. Items that do not fit stay in the pending batch"""
+        pipe = pipe_item.pipe
+        items = pipe_item.item if isinstance(pipe_item.item, list) else [pipe_item.item]
+        if not items:
+            return None
+        full_batch: BatchPipeItem = None
+        batch = self._batches.get(pipe)
+        if batch is not None and batch.meta is not pipe_item.meta and batch.meta != pipe_item.meta:
+            # keep meta association: batch holds items with the same meta
+            full_batch = self._batches.pop(pipe)
+            batch = None
+        if batch is None:
+            batch = self._batches[pipe] = BatchPipeItem([], pipe_item.step, pipe, pipe_item.meta, time.monotonic())
+        batch.item.extend(items)
+        if full_batch is None and len(batch.item) >= pipe.batch_size:
+            full_batch = self._take_batch(pipe)
+        return full_batch
+
+    def _pop_batch(self, ready_only: bool = False) -> BatchPipeItem:
+        """Removes first batch or first batch that is expired or full if `ready_only` is set. Full batch waits until the output of previous batch is consumed"""
+        now = time.monotonic()
+        pipe = next((
+            p for p, b in self._batches.items()
+            if not ready_only or (p.batch_timeout is not None and now - b.created_at >= p.batch_timeout)
+            or (len(b.item) >= p.batch_size and not any(s.pipe is p and s.step > b.step for s in self._sources))
+        ), None)
+        if pipe is None:
+            return None
+        return self._take_batch(pipe)
+
+    def _take_batch(self, pipe: Pipe) -> BatchPipeItem:
+        """Removes at most `batch_size` items from the pending batch of `pipe`, the items that do not fit stay pending"""
+        batch = self._batches.pop(pipe)
+        if len(batch.item) > pipe.batch_size:
+            self._batches[pipe] = batch._replace(item=batch.item[pipe.batch_size:])
+            batch = batch._replace(item=batch.item[:pipe.batch_size])
+        return batch
+
+    def _batch_wait_timeout(self) -> Optional[float]:
+        """Returns time left until the oldest batch with a timeout expires"""
+        timeouts = [b.created_at + p.batch_timeout for p, b in self._batches.items() if p.batch_timeout is not None]
+        if not timeouts:
+            return None
+        return max(0.0, min(timeouts) - time.monotonic())
 
     def close(self) -> None:
         # unregister the pipe name right after execution of gen stopped
@@ -586,10 +787,27 @@ class PipeIterator(Iterator[PipeItem]):
             loop.stop()
 
         # stop all futures
-        for f, _, _, _ in self._futures:
+        for f, *_ in self._futures:
             if not f.done():
                 f.cancel()
+        # close async generators on the event loop
+        parallel_sources: List[Generator[Any, Any, Any]] = []
+        for f, _, _, _, source in self._futures:
+            if inspect.isasyncgen(source):
+                try:
+                    asyncio.run_coroutine_threadsafe(source.aclose(), self._async_pool).result()
+                except Exception:
+                    # generator still running on cancelled future or raised on close
+                    pass
+            elif inspect.isgenerator(source):
+                parallel_sources.append(source)
         self._futures.clear()
+        self._batches.clear()
+        # close coroutines and generators that were never submitted
+        for item, *_ in self._deferred:
+            if inspect.iscoroutine(item) or inspect.isgenerator(item):
+                item.close()
+        self._deferred.clear()
 
         # close all generators
         for gen, _, _, _ in self._sources:
@@ -607,6 +825,9 @@ class PipeIterator(Iterator[PipeItem]):
         if self._thread_pool:
             self._thread_pool.shutdown(wait=True)
             self._thread_pool = None
+        # close generators evaluated in thread pool when no worker executes them
+        for parallel_source in parallel_sources:
+            parallel_source.close()
 
     def _ensure_async_pool(self) -> asyncio.AbstractEventLoop:
         # lazily create async pool is separate thread
@@ -643,6 +864,113 @@ class PipeIterator(Iterator[PipeItem]):
     def __exit__(self, exc_type: Type[BaseException], exc_val: BaseException, exc_tb: types.TracebackType) -> None:
         self.close()
 
+    def _wait_for_futures(self, timeout: float = None) -> None:
+        """Blocks until any of the pending futures is done or `timeout` seconds passed"""
+        if self._futures:
+            wait_for_futures([f.item for f in self._futures], timeout=timeout, return_when=FIRST_COMPLETED)
+        elif timeout:
+            time.sleep(timeout)
+
+    def _rate_limit_delay(self, pipe: Pipe) -> float:
+        """Returns number of seconds until `pipe` may make a request"""
+        if not pipe.rate_limit:
+            return 0.0
+        return self._get_rate_limiter(pipe).delay()
+
+    def _reserve_rate_limit(self, pipe: Pipe) -> float:
+        """Reserves a request for `pipe`. Returns number of seconds to wait before making it"""
+        if not pipe.rate_limit:
+            return 0.0
+        return self._get_rate_limiter(pipe).reserve()
+
+    def _get_rate_limiter(self, pipe: Pipe) -> TokenBucket:
+        rate_limiter = self._rate_limiters.get(pipe)
+        if rate_limiter is None:
+            rate_limiter = self._rate_limiters[pipe] = TokenBucket(pipe.rate_limit, pipe.rate_limit_burst)
+        return rate_limiter
+
+    def _rate_limit_wait_timeout(self) -> Optional[float]:
+        """Returns time left until any of the throttled sources or deferred items may be advanced"""
+        pipes = set(s.pipe for s in self._sources) | set(d.pipe for d in self._deferred)
+        delays = [self._rate_limit_delay(pipe) for pipe in pipes if pipe.rate_limit]
+        return min(delays) if delays else None
+
+    def _has_deferred(self, pipe: Pipe) -> bool:
+        return any(d.pipe is pipe for d in self._deferred)
+
+    def _defer(self, pipe_item: ResolvablePipeItem, retried: bool) -> None:
+        """Defers `pipe_item`. A `retried` item was the first deferred item of its pipe and is retried first again"""
+        if retried:
+            self._deferred.insert(0, pipe_item)
+        else:
+            self._deferred.append(pipe_item)
+
+    def _pop_deferred(self) -> ResolvablePipeItem:
+        """Removes first deferred item of a pipe that is below `max_concurrency` and not throttled. Only the first item of each pipe is considered"""
+        seen_pipes: Set[Pipe] = set()
+        for idx, pipe_item in enumerate(self._deferred):
+            pipe = pipe_item.pipe
+            if pipe in seen_pipes:
+                continue
+            seen_pipes.add(pipe)
+            if not self._pipe_concurrency_exceeded(pipe) and self._rate_limit_delay(pipe) == 0:
+                return self._deferred.pop(idx)
+        return None
+
+    def _pipe_concurrency_exceeded(self, pipe: Pipe) -> bool:
+        """Checks if `pipe` reached `max_concurrency`. Pending futures and async generators that are not exhausted hold a slot,
+           the data generating step of the pipe does not.
+        """
+        if not pipe.max_concurrency:
+            return False
+        in_flight = 0
+        for f in self._futures:
+            if f.pipe is pipe:
+                if f.source is None:
+                    in_flight += not f.item.done()
+                elif f.source is not pipe.gen:
+                    in_flight += 1
+        return in_flight >= pipe.max_concurrency
+
+    def _submit_source(self, source: Union[AsyncIterator[TPipedDataItems], Iterator[TPipedDataItems]], step: int, pipe: Pipe, meta: Any, delay: float = 0.0) -> None:
+        """Requests next item from async generator `source` on the event loop or from iterator `source` in the thread pool.
+           Only one item per source is requested at a time so the items keep their order. The request is made after `delay` seconds.
+        """
+        future: TItemFuture
+        if isinstance(source, AsyncIterator):
+
+            async def _anext() -> TPipedDataItems:
+                if delay:
+                    await asyncio.sleep(delay)
+                # register current pipe name in the event loop thread
+                set_current_pipe_name(pipe.name)
+                return await source.__anext__()
+
+            future = asyncio.run_coroutine_threadsafe(_anext(), self._ensure_async_pool())
+        else:
+
+            def _next() -> TPipedDataItems:
+                if delay:
+                    time.sleep(delay)
+                # register current pipe name in the worker thread
+                set_current_pipe_name(pipe.name)
+                return next(source)
+
+            future = self._ensure_thread_pool().submit(_next)
+        self._futures.append(FuturePipeItem(future, step, pipe, meta, source))
+
+    @staticmethod
+    async def _await(item: Awaitable[TPipedDataItems]) -> TPipedDataItems:
+        """Wraps any awaitable in a coroutine so it can be scheduled on the event loop"""
+        return await item
+
+    def _close_source(self, source: Union[AsyncIterator[TPipedDataItems], Iterator[TPipedDataItems]]) -> None:
+        """Closes async generator on the event loop or generator evaluated in the thread pool. No item may be pending for `source`"""
+        if inspect.isasyncgen(source):
+            asyncio.run_coroutine_threadsafe(source.aclose(), self._ensure_async_pool()).result()
+        elif inspect.isgenerator(source):
+            source.close()
+
     def _next_future(self) -> int:
         return next((i for i, val in enumerate(self._futures) if val.item.done()), -1)
 
@@ -657,7 +985,7 @@ class PipeIterator(Iterator[PipeItem]):
             # nothing done
             return None
 
-        future, step, pipe, meta = self._futures.pop(idx)
+        future, step, pipe, meta, source = self._futures.pop(idx)
 
         if future.cancelled():
             # get next future
@@ -665,16 +993,39 @@ class PipeIterator(Iterator[PipeItem]):
 
         if future.exception():
             ex = future.exception()
+            if source is not None and isinstance(ex, (StopIteration, StopAsyncIteration)):
+                # source is exhausted, get next future
+                return self._resolve_futures()
             if isinstance(ex, (PipelineException, ExtractorException, DltSourceException, PipeException)):
                 raise ex
+            if source is not None:
+                raise ResourceExtractionError(pipe.name, source, str(ex), "generator") from ex
             raise ResourceExtractionError(pipe.name, future, str(ex), "future") from ex
 
         item = future.result()
+        if source is not None:
+            if pipe._closing and source is pipe.gen:
+                # pipe was closed while the item was requested, no more items are requested
+                self._close_source(source)
+            else:
+                # request next item right away so the source is evaluated while current item is processed
+                self._submit_source(source, step, pipe, meta, self._reserve_rate_limit(pipe))
+            if item is None:
+                return self._resolve_futures()
         if isinstance(item, DataItemWithMeta):
             return ResolvablePipeItem(item.data, step, pipe, item.meta)
         else:
             return ResolvablePipeItem(item, step, pipe, meta)
 
+    @staticmethod
+    def _source_from_gen(pipe: Pipe) -> SourcePipeItem:
+        """Creates source from evaluated gen of the `pipe`. Async generators and gens of parallelized pipes are yielded as an item
+           so they are submitted to the event loop or thread pool when first item is requested
+        """
+        if isinstance(pipe.gen, AsyncIterator) or pipe.parallelized:
+            return SourcePipeItem(iter([pipe.gen]), 0, pipe, None)
+        return SourcePipeItem(pipe.gen, 0, pipe, None)  # type: ignore[arg-type]
+
     def _get_source_item(self) -> ResolvablePipeItem:
         if self._next_item_mode == "fifo":
             return self._get_source_item_current()
@@ -685,15 +1036,24 @@ class PipeIterator(Iterator[PipeItem]):
         # no more sources to iterate
         if len(self._sources) == 0:
             return None
+        # get items from last added iterator, this makes the overall Pipe as close to FIFO as possible
+        source_idx = len(self._sources) - 1
+        # skip the sources that are throttled or have deferred items and the sources that feed such pipes so the items keep their order
+        throttled_pipes = set(s.pipe for s in self._sources if self._rate_limit_delay(s.pipe) > 0)
+        throttled_pipes.update(d.pipe for d in self._deferred)
+        while source_idx >= 0 and self._is_held_back(self._sources[source_idx].pipe, throttled_pipes):
+            source_idx -= 1
+        if source_idx < 0:
+            return None
         try:
-            # get items from last added iterator, this makes the overall Pipe as close to FIFO as possible
-            gen, step, pipe, meta = self._sources[-1]
+            gen, step, pipe, meta = self._sources[source_idx]
             # print(f"got {pipe.name}")
             # register current pipe name during the execution of gen
             set_current_pipe_name(pipe.name)
             item = None
             while item is None:
                 item = next(gen)
+            self._reserve_rate_limit(pipe)
             # full pipe item may be returned, this is used by ForkPipe step
             # to redirect execution of an item to another pipe
             if isinstance(item, ResolvablePipeItem):
@@ -706,13 +1066,23 @@ class PipeIterator(Iterator[PipeItem]):
                     return ResolvablePipeItem(item, step, pipe, meta)
         except StopIteration:
             # remove empty iterator and try another source
-            self._sources.pop()
+            self._sources.pop(source_idx)
             return self._get_source_item()
         except (PipelineException, ExtractorException, DltSourceException, PipeException):
             raise
         except Exception as ex:
             raise ResourceExtractionError(pipe.name, gen, str(ex), "generator") from ex
 
+    @staticmethod
+    def _is_held_back(pipe: Pipe, throttled_pipes: Set[Pipe]) -> bool:
+        """Checks if `pipe` is throttled or is a parent of a throttled pipe"""
+        for throttled in throttled_pipes:
+            while throttled is not None:
+                if throttled is pipe:
+                    return True
+                throttled = throttled.parent
+        return False
+
     def _get_source_item_round_robin(self) -> ResolvablePipeItem:
         sources_count = len(self._sources)
         # no more sources to iterate
@@ -725,11 +1095,20 @@ class PipeIterator(Iterator[PipeItem]):
             # print(f"got {pipe.name}")
             # register current pipe name during the execution of gen
             item = None
+            throttled_count = 0
             while item is None:
                 self._round_robin_index = (self._round_robin_index + 1) % sources_count
                 gen, step, pipe, meta = self._sources[self._round_robin_index]
+                if self._rate_limit_delay(pipe) > 0:
+                    # skip throttled source, give up if all sources are throttled
+                    throttled_count += 1
+                    if throttled_count == sources_count:
+                        return None
+                    continue
+                throttled_count = 0
                 set_current_pipe_name(pipe.name)
                 item = next(gen)
+            self._reserve_rate_limit(pipe)
             # full pipe item may be returned, this is used by ForkPipe step
             # to redirect execution of an item to another pipe
             if isinstance(item, ResolvablePipeItem):
@@ -1,6 +1,6 @@
 from copy import copy, deepcopy
 from collections.abc import Mapping as C_Mapping
-from typing import List, TypedDict, cast, Any
+from typing import List, Sequence, TypedDict, cast, Any
 
 from dlt.common.schema.utils import DEFAULT_WRITE_DISPOSITION, merge_columns, new_column, new_table
 from dlt.common.schema.typing import TColumnNames, TColumnProp, TColumnSchema, TPartialTableSchema, TTableSchemaColumns, TWriteDisposition, TAnySchemaColumns, TTableFormat
@@ -75,19 +75,35 @@ class DltResourceSchema:
         if not self._table_schema_template:
             return new_table(self.name, resource=self.name)
 
-        # resolve a copy of a held template
+        # if table template present and has dynamic hints, the data item must be provided
+        if self._table_name_hint_fun and item is None:
+            raise DataItemRequiredForDynamicTableHints(self.name)
+        return self._table_schema_from_template(self._resolve_table_template(item))
+
+    def compute_table_schemas(self, items: Sequence[TDataItem]) -> List[TPartialTableSchema]:
+        """Computes the table schemas like `compute_table_schema` for each of `items`. Items with the same resolved hints share a schema so a schema is created and validated once per distinct set of hints"""
+        if not self._table_schema_template:
+            return [new_table(self.name, resource=self.name)]
+
+        resolved_templates: List[TTableSchemaTemplate] = []
+        for item in items:
+            resolved_template = self._resolve_table_template(item)
+            if resolved_template not in resolved_templates:
+                resolved_templates.append(resolved_template)
+        return [self._table_schema_from_template(resolved_template) for resolved_template in resolved_templates]
+
+    def _resolve_table_template(self, item: TDataItem) -> TTableSchemaTemplate:
+        """Resolves dynamic hints of a copy of a held template with `item`"""
         table_template = copy(self._table_schema_template)
         if "name" not in table_template:
             table_template["name"] = self.name
         table_template["columns"] = copy(self._table_schema_template["columns"])
-
-        # if table template present and has dynamic hints, the data item must be provided
-        if self._table_name_hint_fun and item is None:
-            raise DataItemRequiredForDynamicTableHints(self.name)
-        # resolve
         resolved_template: TTableSchemaTemplate = {k: self._resolve_hint(item, v) for k, v in table_template.items()}  # type: ignore
         resolved_template.pop("incremental", None)
         resolved_template.pop("validator", None)
+        return resolved_template
+
+    def _table_schema_from_template(self, resolved_template: TTableSchemaTemplate) -> TPartialTableSchema:
         table_schema = self._merge_keys(resolved_template)
         table_schema["resource"] = self.name
         validate_dict_ignoring_xkeys(
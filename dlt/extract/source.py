@@ -24,7 +24,7 @@ from dlt.extract.schema import DltResourceSchema, TTableSchemaTemplate
 from dlt.extract.incremental import Incremental, IncrementalResourceWrapper
 from dlt.extract.exceptions import (
     InvalidTransformerDataTypeGeneratorFunctionRequired, InvalidParentResourceDataType, InvalidParentResourceIsAFunction, InvalidResourceDataType, InvalidResourceDataTypeIsNone, InvalidTransformerGeneratorFunction,
-    DataItemRequiredForDynamicTableHints, InvalidResourceDataTypeAsync, InvalidResourceDataTypeBasic,
+    DataItemRequiredForDynamicTableHints, InvalidResourceDataTypeBasic,
     InvalidResourceDataTypeMultiplePipes, ParametrizedResourceUnbound, ResourceNameMissing, ResourceNotATransformer, ResourcesNotFoundError, DeletingResourcesNotSupported)
 
 
@@ -84,7 +84,7 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
             name = name or get_callable_name(data)
 
         # if generator, take name from it
-        if inspect.isgenerator(data):
+        if inspect.isgenerator(data) or inspect.isasyncgen(data):
             name = name or get_callable_name(data)  # type: ignore
 
         # name is mandatory
@@ -92,8 +92,6 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
             raise ResourceNameMissing()
 
         # several iterable types are not allowed and must be excluded right away
-        if isinstance(data, (AsyncIterator, AsyncIterable)):
-            raise InvalidResourceDataTypeAsync(name, data, type(data))
         if isinstance(data, (str, dict)):
             raise InvalidResourceDataTypeBasic(name, data, type(data))
 
@@ -103,8 +101,8 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
             DltResource._ensure_valid_transformer_resource(name, data)
             parent_pipe = DltResource._get_parent_pipe(name, data_from)
 
-        # create resource from iterator, iterable or generator function
-        if isinstance(data, (Iterable, Iterator)) or callable(data):
+        # create resource from iterator, iterable, async iterator or (async) generator function
+        if isinstance(data, (Iterable, Iterator, AsyncIterable, AsyncIterator)) or callable(data):
             pipe = Pipe.from_data(name, data, parent=parent_pipe)
             return cls(pipe, table_schema_template, selected, incremental=incremental, section=section, args_bound=not callable(data))
         else:
@@ -125,6 +123,42 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
         """Checks if the resource is a transformer that takes data from another resource"""
         return self._pipe.has_parent
 
+    @property
+    def max_concurrency(self) -> Optional[int]:
+        """Maximum number of awaitables, callables and async generators yielded by this resource that are evaluated at the same time. Unlimited if not set"""
+        return self._pipe.max_concurrency
+
+    @max_concurrency.setter
+    def max_concurrency(self, value: Optional[int]) -> None:
+        self._pipe.max_concurrency = value
+
+    @property
+    def parallelized(self) -> bool:
+        """When `True` the resource generator and iterators yielded by the resource are advanced in the thread pool, one item at a time"""
+        return self._pipe.parallelized
+
+    @parallelized.setter
+    def parallelized(self, value: bool) -> None:
+        self._pipe.parallelized = value
+
+    @property
+    def batch_size(self) -> Optional[int]:
+        """Transformer only: maximum number of parent items passed to the transformer in a single list. Items are not batched if not set"""
+        return self._pipe.batch_size
+
+    @batch_size.setter
+    def batch_size(self, value: Optional[int]) -> None:
+        self._pipe.batch_size = value
+
+    @property
+    def batch_timeout(self) -> Optional[float]:
+        """Transformer only: maximum number of seconds a parent item waits in an incomplete batch"""
+        return self._pipe.batch_timeout
+
+    @batch_timeout.setter
+    def batch_timeout(self, value: Optional[float]) -> None:
+        self._pipe.batch_timeout = value
+
     @property
     def requires_args(self) -> bool:
         """Checks if resource has unbound arguments"""
@@ -275,6 +309,22 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
             self._pipe.replace_gen(_gen_wrap(self._pipe.gen))
         return self
 
+    def add_rate_limit(self, requests_per_second: float, burst: int = 1) -> "DltResource":  # noqa: A003
+        """Limits the rate of requests made by the resource to `requests_per_second`.
+
+        A request is an item requested from the resource generator or from iterators it yields and an awaitable or callable returned by a transformer. Requests
+        above the limit are deferred by the pipe iterator which keeps extracting other resources in the meantime, so there is no need to sleep in the generator.
+
+        Args:
+            requests_per_second (float): The maximum sustained number of requests per second. Pass `None` to remove the limit
+            burst (int, optional): The number of requests that can be made at once after the resource was idle. Defaults to 1.
+        Returns:
+            "DltResource": returns self
+        """
+        self._pipe.rate_limit = requests_per_second
+        self._pipe.rate_limit_burst = burst
+        return self
+
     def add_step(self, item_transform: ItemTransformFunctionWithMeta[TDataItems], insert_at: int = None) -> "DltResource":  # noqa: A003
         if insert_at is None:
             self._pipe.append_step(item_transform)
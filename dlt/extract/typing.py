@@ -46,6 +46,10 @@ class SupportsPipe(Protocol):
         """Checks if pipe is connected to parent pipe from which it takes data items. Connected pipes are created from transformer resources"""
         ...
 
+    def close(self) -> None:
+        """Closes the data generating step so no more data is requested from it"""
+        ...
+
 
 ItemTransformFunctionWithMeta = Callable[[TDataItem, str], TAny]
 ItemTransformFunctionNoMeta = Callable[[TDataItem], TAny]
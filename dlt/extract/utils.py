@@ -122,8 +122,9 @@ def wrap_compat_transformer(name: str, f: AnyFun, sig: inspect.Signature, *args:
 
 
 def wrap_resource_gen(name: str, f: AnyFun, sig: inspect.Signature, *args: Any, **kwargs: Any) -> AnyFun:
-    """Wraps a generator or generator function so it is evaluated on extraction"""
-    if inspect.isgeneratorfunction(inspect.unwrap(f)) or inspect.isgenerator(f):
+    """Wraps a (async) generator or (async) generator function so it is evaluated on extraction"""
+    unwrapped_f = inspect.unwrap(f)
+    if inspect.isgeneratorfunction(unwrapped_f) or inspect.isgenerator(f) or inspect.isasyncgenfunction(unwrapped_f) or inspect.isasyncgen(f):
         # if no arguments then no wrap
         # if len(sig.parameters) == 0:
         #     return f
@@ -14,6 +14,16 @@ class LoaderConfiguration(PoolRunnerConfiguration):
     """when True, raises on terminally failed jobs immediately"""
     raise_on_max_retries: int = 5
     """When gt 0 will raise when job reaches raise_on_max_retries"""
+    min_job_poll_interval: float = 0.05
+    """Initial interval (seconds) to poll running jobs for state, doubled each time no job changed state"""
+    max_job_poll_interval: float = 1.0
+    """Maximum interval (seconds) to poll running jobs for state"""
+    pool_connections: bool = True
+    """Reuse destination connections between jobs started in the same worker thread. Supported by sql destinations"""
+    connection_idle_timeout: float = 300.0
+    """Pooled connections idle longer than that (seconds) are closed"""
+    connection_health_check_interval: float = 5.0
+    """Pooled connections idle longer than that (seconds) are checked with a trivial query before reuse"""
     _load_storage_config: LoadStorageConfiguration = None
 
     def on_resolved(self) -> None:
@@ -3,10 +3,11 @@ from copy import copy
 from functools import reduce
 import datetime  # noqa: 251
 from typing import Dict, List, Optional, Tuple, Set, Iterator, Iterable, Callable
-from multiprocessing.pool import ThreadPool
+from multiprocessing.pool import ThreadPool, AsyncResult
+from queue import Empty, Queue
 import os
 
-from dlt.common import sleep, logger
+from dlt.common import logger
 from dlt.common.configuration import with_config, known_sections
 from dlt.common.configuration.accessors import config
 from dlt.common.pipeline import LoadInfo, SupportsPipeline
@@ -16,6 +17,7 @@ from dlt.common.typing import StrAny
 from dlt.common.runners import TRunMetrics, Runnable, workermethod
 from dlt.common.runtime.collector import Collector, NULL_COLLECTOR
 from dlt.common.runtime.logger import pretty_format_exception
+from dlt.common.runtime.signals import raise_if_signalled
 from dlt.common.exceptions import TerminalValueError, DestinationTerminalException, DestinationTransientException
 from dlt.common.schema import Schema, TSchemaTables
 from dlt.common.schema.typing import TTableSchema, TWriteDisposition
@@ -23,6 +25,8 @@ from dlt.common.storages import LoadStorage
 from dlt.common.destination.reference import DestinationClientDwhConfiguration, FollowupJob, JobClientBase, WithStagingDataset, DestinationReference, LoadJob, NewLoadJob, TLoadJobState, DestinationClientConfiguration, SupportsStagingDestination
 
 from dlt.destinations.job_impl import EmptyLoadJob
+from dlt.destinations.job_client_impl import SqlJobClientBase
+from dlt.destinations.sql_client import SqlConnectionPool
 
 from dlt.load.configuration import LoaderConfiguration
 from dlt.load.exceptions import LoadClientJobFailed, LoadClientJobRetry, LoadClientUnsupportedWriteDisposition, LoadClientUnsupportedFileFormats
@@ -49,9 +53,13 @@ class Load(Runnable[ThreadPool]):
         self.capabilities = destination.capabilities()
         self.staging_destination = staging_destination
         self.pool: ThreadPool = None
+        self.connection_pool: SqlConnectionPool = None
+        """Keeps destination connections between jobs during a single `run`"""
         self.load_storage: LoadStorage = self.create_storage(is_storage_owner)
         self._processed_load_ids: Dict[str, str] = {}
         """Load ids to dataset name"""
+        self._started_job_files: "Queue[str]" = Queue()
+        """File names of jobs started in the background, fed by the pool callbacks"""
 
 
     def create_storage(self, is_storage_owner: bool) -> LoadStorage:
@@ -69,10 +77,15 @@ class Load(Runnable[ThreadPool]):
         return load_storage
 
     def get_destination_client(self, schema: Schema) -> JobClientBase:
-        return self.destination.client(schema, self.initial_client_config)
+        return self._use_connection_pool(self.destination.client(schema, self.initial_client_config))
 
     def get_staging_destination_client(self, schema: Schema) -> JobClientBase:
-        return self.staging_destination.client(schema, self.initial_staging_client_config)
+        return self._use_connection_pool(self.staging_destination.client(schema, self.initial_staging_client_config))
+
+    def _use_connection_pool(self, job_client: JobClientBase) -> JobClientBase:
+        if isinstance(job_client, SqlJobClientBase):
+            job_client.sql_client.connection_pool = self.connection_pool
+        return job_client
 
     def is_staging_destination_job(self, file_path: str) -> bool:
         return self.staging_destination is not None and os.path.splitext(file_path)[1][1:] in self.staging_destination.capabilities().supported_loader_file_formats
@@ -122,13 +135,11 @@ class Load(Runnable[ThreadPool]):
         self.load_storage.start_job(load_id, job.file_name())
         return job
 
-    def spool_new_jobs(self, load_id: str, schema: Schema) -> Tuple[int, List[LoadJob]]:
-        # TODO: validate file type, combine files, finalize etc., this is client specific, jsonl for single table
-        # can just be combined, insert_values must be finalized and then combined
+    def spool_new_jobs(self, load_id: str, schema: Schema, max_jobs: int = None, skip_job_ids: Iterable[str] = ()) -> Tuple[int, List[LoadJob]]:
+        """Starts up to `max_jobs` (by default `workers`) new jobs and waits until all of them are started"""
+        # small job files of the same table are combined by normalize (see `combine_files_max_bytes`)
         # use thread based pool as jobs processing is mostly I/O and we do not want to pickle jobs
-        # TODO: combine files by providing a list of files pertaining to same table into job, so job must be
-        # extended to accept a list
-        load_files = self.load_storage.list_new_jobs(load_id)[:self.config.workers]
+        load_files = self._list_new_job_files(load_id, max_jobs or self.config.workers, skip_job_ids)
         file_count = len(load_files)
         if file_count == 0:
             logger.info(f"No new jobs found in {load_id}")
@@ -145,6 +156,49 @@ class Load(Runnable[ThreadPool]):
         # remove None jobs and check the rest
         return file_count, [job for job in jobs if job is not None]
 
+    def start_new_jobs(self, load_id: str, schema: Schema, max_jobs: int, skip_job_ids: Iterable[str] = ()) -> Tuple[List[LoadJob], Dict[str, "AsyncResult[LoadJob]"]]:
+        """Starts up to `max_jobs` new jobs without waiting for them to get started.
+
+           Returns a list of jobs that were started synchronously (when no pool is present) and a dictionary of pending
+           job starts on the pool, keyed by job file name. File names of done starts are sent to `_started_job_files`.
+        """
+        load_files = self._list_new_job_files(load_id, max_jobs, skip_job_ids)
+        jobs: List[LoadJob] = []
+        starting_jobs: Dict[str, "AsyncResult[LoadJob]"] = {}
+        if load_files:
+            logger.info(f"Will start {len(load_files)} new jobs in {load_id}")
+        for file in load_files:
+            if self.pool:
+                on_started = self._job_started_callback(file)
+                starting_jobs[file] = self.pool.apply_async(
+                    Load.w_spool_job,
+                    (id(self), file, load_id, schema),
+                    callback=on_started,
+                    error_callback=on_started
+                )
+            else:
+                jobs.append(Load.w_spool_job(self, file, load_id, schema))
+        return jobs, starting_jobs
+
+    def _job_started_callback(self, file_name: str) -> Callable[[object], None]:
+        """Returns pool callback that sends `file_name` to `_started_job_files`"""
+        return lambda _: self._started_job_files.put(file_name)
+
+    @staticmethod
+    def _retry_invariant_job_id(file_name: str) -> str:
+        """Job id that does not change when job is retried"""
+        return LoadStorage.parse_job_file_name(file_name)._replace(retry_count=0).job_id()
+
+    def _list_new_job_files(self, load_id: str, max_jobs: int, skip_job_ids: Iterable[str] = ()) -> List[str]:
+        """Lists up to `max_jobs` new job files skipping jobs with retry invariant ids in `skip_job_ids`"""
+        if max_jobs <= 0:
+            return []
+        skip_job_ids = set(skip_job_ids)
+        # new jobs are taken from the in memory index of the storage so the new jobs folder is not listed on each call
+        return list(self.load_storage.list_new_jobs_from_index(
+            load_id, max_jobs, (lambda file: self._retry_invariant_job_id(file) in skip_job_ids) if skip_job_ids else None
+        ))
+
     def retrieve_jobs(self, client: JobClientBase, load_id: str, staging_client: JobClientBase = None) -> Tuple[int, List[LoadJob]]:
         jobs: List[LoadJob] = []
 
@@ -183,9 +237,9 @@ class Load(Runnable[ThreadPool]):
         table_chain: List[TTableSchema] = []
         # make sure all the jobs for the table chain is completed
         for table in get_child_tables(schema.tables, top_merged_table["name"]):
-            table_jobs = self.load_storage.list_jobs_for_table(load_id, table["name"])
+            table_jobs = self.load_storage.list_job_states_for_table(load_id, table["name"])
             # all jobs must be completed in order for merge to be created
-            if any(job.state not in ("failed_jobs", "completed_jobs") and job.job_file_info.job_id() != being_completed_job_id for job in table_jobs):
+            if any(state not in ("failed_jobs", "completed_jobs") and job_file_info.job_id() != being_completed_job_id for state, job_file_info in table_jobs):
                 return None
             # if there are no jobs for the table, skip it, unless the write disposition is replace, as we need to create and clear the child tables
             if not table_jobs and top_merged_table["write_disposition"] != "replace":
@@ -202,7 +256,7 @@ class Load(Runnable[ThreadPool]):
             # NOTE: we may move that logic to the interface
             starting_job_file_name = starting_job.file_name()
             if state == "completed" and not self.is_staging_destination_job(starting_job_file_name):
-                client = self.destination.client(schema, self.initial_client_config)
+                client = self.get_destination_client(schema)
                 top_job_table = get_top_level_table(schema.tables, starting_job.job_file_info().table_name)
                 # if all tables of chain completed, create follow  up jobs
                 if table_chain := self.get_completed_table_chain(load_id, schema, top_job_table, starting_job.job_file_info().job_id()):
@@ -356,11 +410,30 @@ class Load(Runnable[ThreadPool]):
         self.collector.update("Jobs", no_completed_jobs, total_jobs)
         if no_failed_jobs > 0:
             self.collector.update("Jobs", no_failed_jobs, message="WARNING: Some of the jobs failed!", label="Failed")
-        # loop until all jobs are processed
-        while True:
-            try:
+        # job ids started in this run, if they are retried they go back to new jobs and will be picked up in the next run
+        started_job_ids: Set[str] = set(self._retry_invariant_job_id(job.file_name()) for job in jobs)
+        # jobs being started in the background on the pool
+        starting_jobs: Dict[str, "AsyncResult[LoadJob]"] = {}
+        started_files: List[str] = []
+        poll_interval = self.config.min_job_poll_interval
+        # loop until all jobs are processed, keep `workers` jobs in flight at all times
+        try:
+            while True:
+                # collect jobs that got started in the background
+                for file_name in started_files + self._get_started_job_files():
+                    # files may be left over from a previous package that raised
+                    if result := starting_jobs.pop(file_name, None):
+                        # callback is called just before the result is ready, w_spool_job does not raise
+                        jobs.append(result.get())
+                started_files = []
                 remaining_jobs = self.complete_jobs(load_id, jobs, schema)
-                if len(remaining_jobs) == 0:
+                # refill free worker slots with new jobs (including the followup jobs)
+                free_slots = self.config.workers - len(remaining_jobs) - len(starting_jobs)
+                new_jobs, new_starting_jobs = self.start_new_jobs(load_id, schema, free_slots, started_job_ids)
+                started_job_ids.update(self._retry_invariant_job_id(job.file_name()) for job in new_jobs)
+                started_job_ids.update(self._retry_invariant_job_id(f) for f in new_starting_jobs)
+                starting_jobs.update(new_starting_jobs)
+                if len(remaining_jobs) == 0 and len(new_jobs) == 0 and len(starting_jobs) == 0:
                     # get package status
                     package_info = self.load_storage.get_load_package_info(load_id)
                     # possibly raise on failed jobs
@@ -375,14 +448,51 @@ class Load(Runnable[ThreadPool]):
                             if r_c > 0 and r_c % self.config.raise_on_max_retries == 0:
                                 raise LoadClientJobRetry(load_id, new_job.job_file_info.job_id(), r_c, self.config.raise_on_max_retries)
                     break
+                # do not wait if any of the jobs changed state or new jobs were started synchronously
+                made_progress = len(remaining_jobs) < len(jobs) or len(new_jobs) > 0
                 # process remaining jobs again
-                jobs = remaining_jobs
-                # this will raise on signal
-                sleep(1)
-            except LoadClientJobFailed:
-                # the package is completed and skipped
-                self.complete_package(load_id, schema, True)
-                raise
+                jobs = remaining_jobs + new_jobs
+                if made_progress:
+                    poll_interval = self.config.min_job_poll_interval
+                    raise_if_signalled()
+                else:
+                    # wait until any background job gets started or poll interval passes
+                    started_files = self._wait_for_jobs(poll_interval)
+                    poll_interval = min(poll_interval * 2, self.config.max_job_poll_interval)
+        except LoadClientJobFailed:
+            # the package is completed and skipped, jobs starting in the background must settle first
+            self._wait_for_starting_jobs(starting_jobs)
+            self.complete_package(load_id, schema, True)
+            raise
+        finally:
+            # do not leave jobs being started in the background: they move files between package folders
+            self._wait_for_starting_jobs(starting_jobs)
+
+    def _wait_for_starting_jobs(self, starting_jobs: Dict[str, "AsyncResult[LoadJob]"]) -> None:
+        """Waits until all jobs started in the background are started. Started jobs stay in the package and are retrieved on the next run"""
+        while starting_jobs:
+            _, result = starting_jobs.popitem()
+            result.wait()
+        # started job files were already collected
+        self._get_started_job_files()
+
+    def _wait_for_jobs(self, timeout: float) -> List[str]:
+        """Waits `timeout` seconds or until any job started in the background is started. Returns started job files. Raises on signal"""
+        raise_if_signalled()
+        started_files = self._get_started_job_files(timeout)
+        raise_if_signalled()
+        return started_files
+
+    def _get_started_job_files(self, timeout: float = None) -> List[str]:
+        """Gets all files from `_started_job_files`, waits `timeout` seconds for the first one if `timeout` is set"""
+        started_files: List[str] = []
+        try:
+            if timeout is not None:
+                started_files.append(self._started_job_files.get(timeout=timeout))
+            while True:
+                started_files.append(self._started_job_files.get_nowait())
+        except Empty:
+            return started_files
 
     def run(self, pool: ThreadPool) -> TRunMetrics:
         # store pool
@@ -404,8 +514,15 @@ class Load(Runnable[ThreadPool]):
         # get top load id and mark as being processed
         # TODO: another place where tracing must be refactored
         self._processed_load_ids[load_id] = None
-        with self.collector(f"Load {schema.name} in {load_id}"):
-            self.load_single_package(load_id, schema)
+        if self.config.pool_connections:
+            self.connection_pool = SqlConnectionPool(self.config.connection_idle_timeout, self.config.connection_health_check_interval)
+        try:
+            with self.collector(f"Load {schema.name} in {load_id}"):
+                self.load_single_package(load_id, schema)
+        finally:
+            if self.connection_pool:
+                self.connection_pool.close()
+                self.connection_pool = None
 
         return TRunMetrics(False, len(self.load_storage.list_packages()))
 
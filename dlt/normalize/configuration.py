@@ -1,15 +1,23 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 from dlt.common.configuration import configspec
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.runners.configuration import PoolRunnerConfiguration, TPoolType
 from dlt.common.storages import LoadStorageConfiguration, NormalizeStorageConfiguration, SchemaStorageConfiguration
 
+TJsonLItemsNormalizer = Literal["row", "arrow"]
+
 
 @configspec
 class NormalizeConfiguration(PoolRunnerConfiguration):
     pool_type: TPoolType = "process"
     destination_capabilities: DestinationCapabilitiesContext = None  # injectable
+    jsonl_items_normalizer: TJsonLItemsNormalizer = "row"
+    """Normalizes extracted jsonl items `row` by row or in `arrow` column batches per table when parquet files are produced. `arrow` requires `pyarrow`"""
+    max_file_range_bytes: int = 64 * 1024 * 1024
+    """Extracted jsonl files larger than that are split into newline aligned byte ranges normalized by parallel workers, 0 disables splitting. Compressed files are not split"""
+    combine_files_max_bytes: int = 0
+    """New job files of the same table and format smaller than that are combined into files up to that size, 0 disables combining"""
     _schema_storage_config: SchemaStorageConfiguration
     _normalize_storage_config: NormalizeStorageConfiguration
     _load_storage_config: LoadStorageConfiguration
@@ -22,6 +30,9 @@ class NormalizeConfiguration(PoolRunnerConfiguration):
             self,
             pool_type: TPoolType = "process",
             workers: int = None,
+            jsonl_items_normalizer: TJsonLItemsNormalizer = "row",
+            max_file_range_bytes: int = 64 * 1024 * 1024,
+            combine_files_max_bytes: int = 0,
             _schema_storage_config: SchemaStorageConfiguration = None,
             _normalize_storage_config: NormalizeStorageConfiguration = None,
             _load_storage_config: LoadStorageConfiguration = None
@@ -1,13 +1,18 @@
 import os
-from typing import List, Dict, Tuple, Protocol
+from typing import Any, Iterable, Iterator, List, Dict, Optional, Set, Tuple, Protocol
 from pathlib import Path
 
 from dlt.common import json, logger
-from dlt.common.json import custom_pua_decode
+from dlt.common.configuration.container import Container
+from dlt.common.data_writers.typed_pickle import load_typed_items
+from dlt.common.data_types import TDataType, coerce_value
+from dlt.common.destination import DestinationCapabilitiesContext
+from dlt.common.json import custom_pua_decode, PUA_START, PUA_CHARACTER_MAX, _DECIMAL, _DATETIME, _DATE
 from dlt.common.runtime import signals
 from dlt.common.schema.typing import TTableSchemaColumns
+from dlt.common.schema.utils import is_complete_column
 from dlt.common.storages import NormalizeStorage, LoadStorage, NormalizeStorageConfiguration, FileStorage
-from dlt.common.typing import TDataItem
+from dlt.common.typing import TDataItem, StrAny
 from dlt.common.schema import TSchemaUpdate, Schema
 from dlt.common.utils import TRowCount, merge_row_count, increase_row_count
 
@@ -21,11 +26,83 @@ class ItemsNormalizer(Protocol):
         schema: Schema,
         load_id: str,
         root_table_name: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        table_names: Optional[Set[str]] = None,
     ) -> Tuple[List[TSchemaUpdate], int, TRowCount]:
         ...
 
 
 class JsonLItemsNormalizer(ItemsNormalizer):
+    def _filter_rows(
+        self,
+        schema: Schema,
+        load_id: str,
+        root_table_name: str,
+        item: TDataItem,
+        table_names: Optional[Set[str]] = None,
+    ) -> Iterator[Tuple[Tuple[str, str], StrAny]]:
+        """Flattens `item` into rows of (table name, parent table) and filters out the rows of not requested tables and empty rows"""
+        for (table_name, parent_table), row in schema.normalize_data_item(
+            item, load_id, root_table_name
+        ):
+            # write only the requested tables
+            if table_names is not None and table_name not in table_names:
+                continue
+            # filter row, may eliminate some or all fields
+            row = schema.filter_row(table_name, row)
+            # do not process empty rows
+            if row:
+                yield (table_name, parent_table), row
+
+    def _normalize_rows(
+        self,
+        load_storage: LoadStorage,
+        schema: Schema,
+        load_id: str,
+        rows: Iterable[Tuple[Tuple[str, str], StrAny]],
+        schema_update: TSchemaUpdate,
+        column_schemas: Dict[str, TTableSchemaColumns],
+        row_counts: TRowCount,
+        decode_pua: bool = True,
+    ) -> int:
+        """Coerces `rows` into their tables, collects schema changes in `schema_update` and writes the rows. Returns number of rows written"""
+        schema_name = schema.name
+        items_count = 0
+        for (table_name, parent_table), row in rows:
+            # decode pua types
+            if decode_pua:
+                for k, v in row.items():
+                    row[k] = custom_pua_decode(v)  # type: ignore
+            # coerce row of values into schema table, generating partial table with new columns if any
+            row, partial_table = schema.coerce_row(
+                table_name, parent_table, row
+            )
+            # theres a new table or new columns in existing table
+            if partial_table:
+                # update schema and save the change
+                schema.update_table(partial_table)
+                table_updates = schema_update.setdefault(table_name, [])
+                table_updates.append(partial_table)
+                # update our columns
+                column_schemas[table_name] = schema.get_table_columns(
+                    table_name
+                )
+            # get current columns schema
+            columns = column_schemas.get(table_name)
+            if not columns:
+                columns = schema.get_table_columns(table_name)
+                column_schemas[table_name] = columns
+            # store row
+            # TODO: it is possible to write to single file from many processes using this: https://gitlab.com/warsaw/flufl.lock
+            load_storage.write_data_item(
+                load_id, schema_name, table_name, row, columns
+            )
+            # count total items
+            items_count += 1
+            increase_row_count(row_counts, table_name, 1)
+        return items_count
+
     def _normalize_chunk(
         self,
         load_storage: LoadStorage,
@@ -33,53 +110,27 @@ class JsonLItemsNormalizer(ItemsNormalizer):
         load_id: str,
         root_table_name: str,
         items: List[TDataItem],
+        table_names: Optional[Set[str]] = None,
+        decode_pua: bool = True,
     ) -> Tuple[TSchemaUpdate, int, TRowCount]:
         column_schemas: Dict[
             str, TTableSchemaColumns
         ] = {}  # quick access to column schema for writers below
         schema_update: TSchemaUpdate = {}
-        schema_name = schema.name
         items_count = 0
         row_counts: TRowCount = {}
 
         for item in items:
-            for (table_name, parent_table), row in schema.normalize_data_item(
-                item, load_id, root_table_name
-            ):
-                # filter row, may eliminate some or all fields
-                row = schema.filter_row(table_name, row)
-                # do not process empty rows
-                if row:
-                    # decode pua types
-                    for k, v in row.items():
-                        row[k] = custom_pua_decode(v)  # type: ignore
-                    # coerce row of values into schema table, generating partial table with new columns if any
-                    row, partial_table = schema.coerce_row(
-                        table_name, parent_table, row
-                    )
-                    # theres a new table or new columns in existing table
-                    if partial_table:
-                        # update schema and save the change
-                        schema.update_table(partial_table)
-                        table_updates = schema_update.setdefault(table_name, [])
-                        table_updates.append(partial_table)
-                        # update our columns
-                        column_schemas[table_name] = schema.get_table_columns(
-                            table_name
-                        )
-                    # get current columns schema
-                    columns = column_schemas.get(table_name)
-                    if not columns:
-                        columns = schema.get_table_columns(table_name)
-                        column_schemas[table_name] = columns
-                    # store row
-                    # TODO: it is possible to write to single file from many processes using this: https://gitlab.com/warsaw/flufl.lock
-                    load_storage.write_data_item(
-                        load_id, schema_name, table_name, row, columns
-                    )
-                    # count total items
-                    items_count += 1
-                    increase_row_count(row_counts, table_name, 1)
+            items_count += self._normalize_rows(
+                load_storage,
+                schema,
+                load_id,
+                self._filter_rows(schema, load_id, root_table_name, item, table_names),
+                schema_update,
+                column_schemas,
+                row_counts,
+                decode_pua,
+            )
             signals.raise_if_signalled()
         return schema_update, items_count, row_counts
 
@@ -91,16 +142,30 @@ class JsonLItemsNormalizer(ItemsNormalizer):
         schema: Schema,
         load_id: str,
         root_table_name: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        table_names: Optional[Set[str]] = None,
     ) -> Tuple[List[TSchemaUpdate], int, TRowCount]:
         schema_updates: List[TSchemaUpdate] = []
         row_counts: TRowCount = {}
-        with normalize_storage.storage.open_file(extracted_items_file) as f:
+        if NormalizeStorage.parse_normalize_file_name(extracted_items_file).file_format == "pickle":
+            return self._normalize_pickle_file(
+                extracted_items_file, load_storage, normalize_storage, schema, load_id, root_table_name, table_names
+            )
+        with normalize_storage.storage.open_file(extracted_items_file, "rb") as f:
+            # process only lines in the requested byte range
+            if start:
+                f.seek(start)
+            position = start
             # enumerate jsonl file line by line
             items_count = 0
             for line_no, line in enumerate(f):
-                items: List[TDataItem] = json.loads(line)
+                if end is not None and position >= end:
+                    break
+                position += len(line)
+                items: List[TDataItem] = json.loadb(line)
                 partial_update, items_count, r_counts = self._normalize_chunk(
-                    load_storage, schema, load_id, root_table_name, items
+                    load_storage, schema, load_id, root_table_name, items, table_names
                 )
                 schema_updates.append(partial_update)
                 merge_row_count(row_counts, r_counts)
@@ -110,6 +175,179 @@ class JsonLItemsNormalizer(ItemsNormalizer):
 
         return schema_updates, items_count, row_counts
 
+    def _normalize_pickle_file(
+        self,
+        extracted_items_file: str,
+        load_storage: LoadStorage,
+        normalize_storage: NormalizeStorage,
+        schema: Schema,
+        load_id: str,
+        root_table_name: str,
+        table_names: Optional[Set[str]] = None,
+    ) -> Tuple[List[TSchemaUpdate], int, TRowCount]:
+        schema_updates: List[TSchemaUpdate] = []
+        row_counts: TRowCount = {}
+        items_count = 0
+        with normalize_storage.storage.open_file(extracted_items_file, "rb") as f:
+            # each frame holds a list of items with python types, no decoding is needed
+            for frame_no, items in enumerate(load_typed_items(f)):
+                partial_update, items_count, r_counts = self._normalize_chunk(
+                    load_storage, schema, load_id, root_table_name, items, table_names, decode_pua=False
+                )
+                schema_updates.append(partial_update)
+                merge_row_count(row_counts, r_counts)
+                logger.debug(
+                    f"Processed {frame_no} frames from file {extracted_items_file}, items {items_count}"
+                )
+
+        return schema_updates, items_count, row_counts
+
+
+class ArrowItemsNormalizer(JsonLItemsNormalizer):
+    """Normalizes jsonl items into arrow tables per table when parquet files are produced.
+
+       All rows of a chunk are flattened first and grouped by table. When a table and all its columns already exist in the schema,
+       each column is converted into an arrow array: arrow infers the type of the values which are then cast into the column data type
+       with `pyarrow.compute`. Decimals, timestamps and dates encoded with PUA markers are parsed by arrow as well.
+       Values of different types in a column (variants) fail the conversion or the cast. Such batches and batches that would create new
+       tables or columns are normalized row by row like in `JsonLItemsNormalizer`, as are all items if other file formats are produced.
+    """
+
+    # data types that may be written from column batches and inferred arrow data types that may be safely cast into them
+    COLUMNAR_DATA_TYPES: Dict[TDataType, Tuple[TDataType, ...]] = {
+        "text": ("text",),
+        "double": ("double", "bigint"),
+        "bool": ("bool",),
+        "bigint": ("bigint",),
+        "timestamp": ("timestamp", "text"),
+        "date": ("date", "text"),
+        "time": ("time",),
+        "decimal": ("decimal", "text"),
+        "binary": ("binary",),
+        "complex": ("complex",),
+    }
+    # PUA markers of values that arrow parses from strings
+    ARROW_PUA_MARKERS: Dict[str, TDataType] = {_DECIMAL: "decimal", _DATETIME: "timestamp", _DATE: "date"}
+    PUA_MARKER_PATTERN = f"^[{chr(PUA_START)}-{chr(PUA_START + PUA_CHARACTER_MAX)}]"
+
+    def _normalize_chunk(
+        self,
+        load_storage: LoadStorage,
+        schema: Schema,
+        load_id: str,
+        root_table_name: str,
+        items: List[TDataItem],
+        table_names: Optional[Set[str]] = None,
+        decode_pua: bool = True,
+    ) -> Tuple[TSchemaUpdate, int, TRowCount]:
+        if load_storage.loader_file_format != "parquet":
+            # rows written from arrow batches must be converted back into python objects, row by row normalization is faster
+            return super()._normalize_chunk(load_storage, schema, load_id, root_table_name, items, table_names, decode_pua)
+        # flatten all items and group rows by table, parent tables are always seen before their child tables
+        table_rows: Dict[Tuple[str, str], List[StrAny]] = {}
+        for item in items:
+            for table, row in self._filter_rows(schema, load_id, root_table_name, item, table_names):
+                table_rows.setdefault(table, []).append(row)
+            signals.raise_if_signalled()
+
+        column_schemas: Dict[str, TTableSchemaColumns] = {}
+        schema_update: TSchemaUpdate = {}
+        items_count = 0
+        row_counts: TRowCount = {}
+        for table, rows in table_rows.items():
+            table_name = table[0]
+            batch = self._coerce_columns(schema, table_name, rows, decode_pua)
+            if batch is None:
+                # new table, columns or variants: normalize row by row
+                items_count += self._normalize_rows(
+                    load_storage, schema, load_id, ((table, row) for row in rows), schema_update, column_schemas, row_counts, decode_pua
+                )
+            else:
+                self._write_columns(load_storage, schema, load_id, table_name, batch)
+                items_count += len(rows)
+                increase_row_count(row_counts, table_name, len(rows))
+        return schema_update, items_count, row_counts
+
+    def _coerce_columns(
+        self, schema: Schema, table_name: str, rows: List[StrAny], decode_pua: bool = True
+    ) -> Any:
+        """Transposes `rows` into an arrow table with columns cast into existing column types. Returns None if schema must change"""
+        from dlt.common.libs.pyarrow import pyarrow, get_py_arrow_datatype, get_column_type_from_py_arrow, json_string_array
+
+        table = schema.tables.get(table_name)
+        if not table:
+            return None
+        table_columns = table["columns"]
+        caps = Container()[DestinationCapabilitiesContext]
+        # preserve order of columns as they appear in rows
+        col_names = dict.fromkeys(k for row in rows for k in row)
+        arrays: Dict[str, Any] = {}
+        for col_name in col_names:
+            values = [row.get(col_name) for row in rows]
+            column = table_columns.get(col_name)
+            if not column and all(v is None for v in values):
+                # like in row normalization, columns are not created from nulls
+                continue
+            if not column or not is_complete_column(column):
+                return None
+            data_type = column["data_type"]
+            allowed_types = self.COLUMNAR_DATA_TYPES.get(data_type)
+            if not allowed_types:
+                return None
+            if data_type == "complex":
+                if not all(isinstance(v, (dict, list)) for v in values if v is not None):
+                    return None
+                # remove pua markers from nested values, complex values are stored as json strings like in the parquet writer
+                values = [None if v is None else coerce_value("complex", "complex", v) for v in values]
+            try:
+                if data_type == "complex":
+                    array, values_type = json_string_array(values), "complex"
+                else:
+                    array = pyarrow.array(values)
+                    values_type = None if pyarrow.types.is_null(array.type) else get_column_type_from_py_arrow(array.type)["data_type"]
+                    if decode_pua and values_type == "text":
+                        array, values_type = self._decode_pua_array(array, values)
+                if array.null_count and not column.get("nullable", True):
+                    return None
+                target_type = get_py_arrow_datatype(column, caps, "UTC")
+                if values_type is None:
+                    array = pyarrow.nulls(len(array), type=target_type)
+                elif values_type not in allowed_types:
+                    return None
+                elif array.type != target_type:
+                    # safe cast fails on overflows, truncation of values and strings that are not ISO timestamps, dates or decimals
+                    array = pyarrow.compute.cast(array, target_type)
+            except (pyarrow.ArrowException, ValueError, TypeError, OverflowError):
+                # values of several types or values that do not fit into the column type
+                return None
+            arrays[col_name] = array
+        return pyarrow.Table.from_arrays(list(arrays.values()), names=list(arrays.keys()))
+
+    def _decode_pua_array(self, array: Any, values: List[Any]) -> Tuple[Any, TDataType]:
+        """Decodes PUA encoded values in string `array`. Returns decoded array and data type of its values"""
+        from dlt.common.libs.pyarrow import pyarrow, get_column_type_from_py_arrow
+
+        if not pyarrow.compute.any(pyarrow.compute.match_substring_regex(array, self.PUA_MARKER_PATTERN)).as_py():
+            return array, "text"
+        for marker, data_type in self.ARROW_PUA_MARKERS.items():
+            # strip the marker, values are cast from strings
+            if pyarrow.compute.all(pyarrow.compute.starts_with(array, marker)).as_py():
+                return pyarrow.compute.utf8_slice_codeunits(array, start=1), data_type
+        # other or mixed markers are decoded in python
+        array = pyarrow.array([custom_pua_decode(v) for v in values])
+        return array, get_column_type_from_py_arrow(array.type)["data_type"]
+
+    def _write_columns(
+        self,
+        load_storage: LoadStorage,
+        schema: Schema,
+        load_id: str,
+        table_name: str,
+        batch: Any,
+    ) -> None:
+        # the writer casts timestamps into its configured timezone
+        load_storage.write_data_item(load_id, schema.name, table_name, batch, schema.get_table_columns(table_name))
+
 
 class ParquetItemsNormalizer(ItemsNormalizer):
     def __call__(
@@ -120,7 +358,14 @@ class ParquetItemsNormalizer(ItemsNormalizer):
         schema: Schema,
         load_id: str,
         root_table_name: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        table_names: Optional[Set[str]] = None,
     ) -> Tuple[List[TSchemaUpdate], int, TRowCount]:
+        # parquet files are never split into ranges and do not change the schema
+        # they hold a single table so they are skipped when other tables are normalized again
+        if table_names is not None and root_table_name not in table_names:
+            return [], 0, {}
         from dlt.common.libs import pyarrow
         with normalize_storage.storage.open_file(extracted_items_file, "rb") as f:
             items_count = pyarrow.get_row_count(f)
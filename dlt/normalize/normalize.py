@@ -1,8 +1,10 @@
 import os
-from typing import Any, Callable, List, Dict, Sequence, Tuple, Set
-from multiprocessing.pool import AsyncResult, Pool as ProcessPool
+import time
+from queue import Empty, Queue
+from typing import Any, Callable, List, Dict, NamedTuple, Sequence, Tuple, Set, Union
+from multiprocessing.pool import Pool as ProcessPool
 
-from dlt.common import pendulum, json, logger, sleep
+from dlt.common import pendulum, json, logger
 from dlt.common.configuration import with_config, known_sections
 from dlt.common.configuration.accessors import config
 from dlt.common.configuration.container import Container
@@ -12,28 +14,52 @@ from dlt.common.runners import TRunMetrics, Runnable
 from dlt.common.runtime import signals
 from dlt.common.runtime.collector import Collector, NULL_COLLECTOR
 from dlt.common.schema.typing import TStoredSchema, TTableSchemaColumns
-from dlt.common.schema.utils import merge_schema_updates
+from dlt.common.schema.utils import diff_tables, get_child_tables, get_top_level_table, merge_schema_updates
 from dlt.common.storages.exceptions import SchemaNotFoundError
-from dlt.common.storages import NormalizeStorage, SchemaStorage, LoadStorage, LoadStorageConfiguration, NormalizeStorageConfiguration
+from dlt.common.storages import NormalizeStorage, SchemaStorage, LoadStorage, LoadStorageConfiguration, NormalizeStorageConfiguration, TExtractedItemsRange
 from dlt.common.typing import TDataItem
 from dlt.common.schema import TSchemaUpdate, Schema
 from dlt.common.schema.exceptions import CannotCoerceColumnException
 from dlt.common.exceptions import TerminalValueError
 from dlt.common.pipeline import NormalizeInfo
-from dlt.common.utils import chunks, TRowCount, merge_row_count, increase_row_count
+from dlt.common.utils import TRowCount, merge_row_count, increase_row_count
 
-from dlt.normalize.configuration import NormalizeConfiguration
-from dlt.normalize.items_normalizers import ParquetItemsNormalizer, JsonLItemsNormalizer, ItemsNormalizer
+from dlt.normalize.configuration import NormalizeConfiguration, TJsonLItemsNormalizer
+from dlt.normalize.items_normalizers import ParquetItemsNormalizer, JsonLItemsNormalizer, ArrowItemsNormalizer, ItemsNormalizer
 
 # normalize worker wrapping function (map_parallel, map_single) return type
 TMapFuncRV = Tuple[Sequence[TSchemaUpdate], TRowCount]
 # normalize worker wrapping function signature
 TMapFuncType = Callable[[Schema, str, Sequence[str]], TMapFuncRV]  # input parameters: (schema name, load_id, list of files to process)
-# tuple returned by the worker
-TWorkerRV = Tuple[List[TSchemaUpdate], int, List[str], TRowCount]
+
+
+class TWorkerArgs(NamedTuple):
+    """Arguments of the worker, see `Normalize.w_normalize_files`"""
+    normalize_storage_config: NormalizeStorageConfiguration
+    loader_storage_config: LoadStorageConfiguration
+    destination_caps: DestinationCapabilitiesContext
+    stored_schema: TStoredSchema
+    load_id: str
+    extracted_items_ranges: Sequence[TExtractedItemsRange]
+    jsonl_items_normalizer: TJsonLItemsNormalizer = "row"
+    table_names: Set[str] = None
+
+
+class TWorkerRV(NamedTuple):
+    """Tuple returned by the worker"""
+    schema_updates: List[TSchemaUpdate]
+    total_items: int
+    file_names: List[str]
+    row_counts: TRowCount
+    started_at: float
+    finished_at: float
 
 
 class Normalize(Runnable[ProcessPool]):
+    RESULT_POLL_INTERVAL: float = 1.0
+    """Seconds to wait for a worker result before checking for signals"""
+    COMBINE_FILE_FORMATS: Sequence[TLoaderFileFormat] = ("jsonl", "insert_values", "parquet")
+    """Formats of job files that are combined, `reference` and `sql` jobs have no writer and are never combined"""
 
     @with_config(spec=NormalizeConfiguration, sections=(known_sections.NORMALIZE,))
     def __init__(self, collector: Collector = NULL_COLLECTOR, schema_storage: SchemaStorage = None, config: NormalizeConfiguration = config.value) -> None:
@@ -74,9 +100,12 @@ class Normalize(Runnable[ProcessPool]):
         destination_caps: DestinationCapabilitiesContext,
         stored_schema: TStoredSchema,
         load_id: str,
-        extracted_items_files: Sequence[str],
+        extracted_items_ranges: Sequence[TExtractedItemsRange],
+        jsonl_items_normalizer: TJsonLItemsNormalizer = "row",
+        table_names: Set[str] = None,
     ) -> TWorkerRV:
 
+        started_at = time.time()
         schema_updates: List[TSchemaUpdate] = []
         total_items = 0
         row_counts: TRowCount = {}
@@ -108,7 +137,7 @@ class Normalize(Runnable[ProcessPool]):
             try:
                 root_tables: Set[str] = set()
                 populated_root_tables: Set[str] = set()
-                for extracted_items_file in extracted_items_files:
+                for extracted_items_file, start, end, _ in extracted_items_ranges:
                     line_no: int = 0
                     parsed_file_name = NormalizeStorage.parse_normalize_file_name(extracted_items_file)
                     root_table_name = parsed_file_name.table_name
@@ -120,9 +149,11 @@ class Normalize(Runnable[ProcessPool]):
                     normalizer: ItemsNormalizer
                     if file_format == "parquet":
                         normalizer = ParquetItemsNormalizer()
+                    elif jsonl_items_normalizer == "arrow":
+                        normalizer = ArrowItemsNormalizer()
                     else:
                         normalizer = JsonLItemsNormalizer()
-                    partial_updates, items_count, r_counts = normalizer(extracted_items_file, load_storage, normalize_storage, schema, load_id, root_table_name)
+                    partial_updates, items_count, r_counts = normalizer(extracted_items_file, load_storage, normalize_storage, schema, load_id, root_table_name, start, end, table_names)
                     schema_updates.extend(partial_updates)
                     total_items += items_count
                     merge_row_count(row_counts, r_counts)
@@ -133,7 +164,7 @@ class Normalize(Runnable[ProcessPool]):
                     increase_row_count(row_counts, root_table_name, 0)
                 # write empty jobs for tables without items if table exists in schema
                 for table_name in root_tables - populated_root_tables:
-                    if table_name not in schema.tables:
+                    if table_name not in schema.tables or (table_names is not None and table_name not in table_names):
                         continue
                     logger.debug(f"Writing empty job for table {table_name}")
                     columns = schema.get_table_columns(table_name)
@@ -144,9 +175,9 @@ class Normalize(Runnable[ProcessPool]):
             finally:
                 load_storage.close_writers(load_id)
 
-        logger.info(f"Processed total {total_items} items in {len(extracted_items_files)} files")
+        logger.info(f"Processed total {total_items} items in {len(extracted_items_ranges)} file ranges")
 
-        return schema_updates, total_items, load_storage.closed_files(), row_counts
+        return TWorkerRV(schema_updates, total_items, load_storage.closed_files(), row_counts, started_at, time.time())
 
     def update_table(self, schema: Schema, schema_updates: List[TSchemaUpdate]) -> None:
         for schema_update in schema_updates:
@@ -156,91 +187,154 @@ class Normalize(Runnable[ProcessPool]):
                     # merge columns
                     schema.update_table(partial_table)
 
+    def reconcile_schema_updates(self, schema: Schema, schema_updates: List[TSchemaUpdate]) -> Tuple[List[TSchemaUpdate], Set[str]]:
+        """Applies `schema_updates` of the tables that do not conflict with `schema`. Returns applied updates and names of the conflicting tables.
+
+           Conflicts happen when parallel workers infer different data types for the same new column.
+        """
+        conflicting_tables: Set[str] = set()
+        for schema_update in schema_updates:
+            for table_name, table_updates in schema_update.items():
+                table = schema.tables.get(table_name)
+                if table is None or table_name in conflicting_tables:
+                    continue
+                for partial_table in table_updates:
+                    try:
+                        diff_tables(table, partial_table)
+                    except CannotCoerceColumnException as exc:
+                        logger.warning(f"Parallel schema update conflict in table {table_name} ({str(exc)})")
+                        conflicting_tables.add(table_name)
+                        break
+        applied_updates = [
+            {table_name: table_updates for table_name, table_updates in schema_update.items() if table_name not in conflicting_tables}
+            for schema_update in schema_updates
+        ]
+        self.update_table(schema, applied_updates)
+        return applied_updates, conflicting_tables
+
     @staticmethod
-    def group_worker_files(files: Sequence[str], no_groups: int) -> List[Sequence[str]]:
-        # sort files so the same tables are in the same worker
-        files = list(sorted(files))
-
-        chunk_size = max(len(files) // no_groups, 1)
-        chunk_files = list(chunks(files, chunk_size))
-        # distribute the remainder files to existing groups starting from the end
-        remainder_l = len(chunk_files) - no_groups
-        l_idx = 0
-        while remainder_l > 0:
-            for idx, file in enumerate(reversed(chunk_files.pop())):
-                chunk_files[-l_idx - idx - remainder_l].append(file)  # type: ignore
-            remainder_l -=1
-            l_idx = idx + 1
-        return chunk_files
+    def get_table_chains(schema: Schema, table_names: Set[str]) -> Set[str]:
+        """Returns names of all tables in the table chains (root table and all its descendants) of `table_names`"""
+        chain_tables: Set[str] = set()
+        for table_name in table_names:
+            top_table = get_top_level_table(schema.tables, table_name)
+            chain_tables.update(t["name"] for t in get_child_tables(schema.tables, top_table["name"]))
+        return chain_tables
+
+    @staticmethod
+    def group_worker_ranges(ranges: Sequence[TExtractedItemsRange], no_groups: int) -> List[List[TExtractedItemsRange]]:
+        """Splits `ranges` into at most `no_groups` groups with similar number of bytes to process"""
+        # sort ranges so the same files and tables are in the same worker
+        ranges = sorted(ranges)
+        total_size = sum(r.size for r in ranges)
+        chunk_ranges: List[List[TExtractedItemsRange]] = []
+        processed_size = 0
+        for r in ranges:
+            # start new group when most of the range falls outside the share of bytes of the current group
+            if not chunk_ranges or (len(chunk_ranges) < no_groups and processed_size + r.size / 2 >= total_size * len(chunk_ranges) / no_groups):
+                chunk_ranges.append([])
+            chunk_ranges[-1].append(r)
+            processed_size += r.size
+        return chunk_ranges
 
     def map_parallel(self, schema: Schema, load_id: str, files: Sequence[str]) -> TMapFuncRV:
         workers = self.pool._processes  # type: ignore
-        chunk_files = self.group_worker_files(files, workers)
+        # large files are split so all the workers get similar amount of bytes to process
+        ranges = [r for file in files for r in self.normalize_storage.split_extracted_file(file, self.config.max_file_range_bytes)]
+        chunk_ranges = self.group_worker_ranges(ranges, workers)
         schema_dict: TStoredSchema = schema.to_dict()
-        config_tuple = (self.normalize_storage.config, self.load_storage.config, self.config.destination_capabilities, schema_dict)
-        param_chunk = [[*config_tuple, load_id, files] for files in chunk_files]
-        tasks: List[Tuple[AsyncResult[TWorkerRV], List[Any]]] = []
+        param_chunk = [
+            TWorkerArgs(
+                self.normalize_storage.config,
+                self.load_storage.config,
+                self.config.destination_capabilities,
+                schema_dict,
+                load_id,
+                worker_ranges,
+                self.config.jsonl_items_normalizer,
+            )
+            for worker_ranges in chunk_ranges
+        ]
         row_counts: TRowCount = {}
 
         # return stats
         schema_updates: List[TSchemaUpdate] = []
 
+        # workers push results or exceptions here as soon as they complete
+        completed: "Queue[Tuple[TWorkerArgs, float, Union[TWorkerRV, BaseException]]]" = Queue()
+
+        def _submit(params: TWorkerArgs) -> None:
+            submitted_at = time.time()
+            self.pool.apply_async(
+                Normalize.w_normalize_files,
+                params,
+                callback=lambda rv: completed.put((params, submitted_at, rv)),
+                error_callback=lambda exc: completed.put((params, submitted_at, exc))
+            )
+
         # push all tasks to queue
         for params in param_chunk:
-            pending: AsyncResult[TWorkerRV] = self.pool.apply_async(Normalize.w_normalize_files, params)
-            tasks.append((pending, params))
-
-        while len(tasks) > 0:
-            sleep(0.3)
-            # operate on copy of the list
-            for task in list(tasks):
-                pending, params = task
-                if pending.ready():
-                    if pending.successful():
-                        result: TWorkerRV = pending.get()
-                        try:
-                            # gather schema from all manifests, validate consistency and combine
-                            self.update_table(schema, result[0])
-                            schema_updates.extend(result[0])
-                            # update metrics
-                            self.collector.update("Files", len(result[2]))
-                            self.collector.update("Items", result[1])
-                            # merge row counts
-                            merge_row_count(row_counts, result[3])
-                        except CannotCoerceColumnException as exc:
-                            # schema conflicts resulting from parallel executing
-                            logger.warning(f"Parallel schema update conflict, retrying task ({str(exc)}")
-                            # delete all files produced by the task
-                            for file in result[2]:
-                                os.remove(file)
-                            # schedule the task again
-                            schema_dict = schema.to_dict()
-                            # TODO: it's time for a named tuple
-                            params[3] = schema_dict
-                            retry_pending: AsyncResult[TWorkerRV] = self.pool.apply_async(Normalize.w_normalize_files, params)
-                            tasks.append((retry_pending, params))
-                        # remove finished tasks
-                        tasks.remove(task)
-                    else:
-                        # raise the exception
-                        pending.get()
-                        raise AssertionError("unreachable code: pending.get must raise")
+            _submit(params)
+        pending_tasks = len(param_chunk)
+
+        while pending_tasks > 0:
+            try:
+                params, submitted_at, result = completed.get(timeout=self.RESULT_POLL_INTERVAL)
+            except Empty:
+                # wake up periodically so signals are not blocked by waiting for the workers
+                signals.raise_if_signalled()
+                continue
+            pending_tasks -= 1
+            if isinstance(result, BaseException):
+                raise result
+            # gather schema from all manifests, validate consistency and combine
+            applied_updates, conflicting_tables = self.reconcile_schema_updates(schema, result.schema_updates)
+            schema_updates.extend(applied_updates)
+            # update metrics
+            self._update_task_metrics(result, submitted_at)
+            if conflicting_tables:
+                # root table rows get random _dlt_id and child rows link to it so the whole
+                # table chain of a conflicting table must be normalized again
+                conflicting_tables = self.get_table_chains(schema, conflicting_tables)
+            # merge row counts, conflicting tables will be counted when normalized again
+            merge_row_count(row_counts, {t: c for t, c in result.row_counts.items() if t not in conflicting_tables})
+            if conflicting_tables:
+                # delete only files of the conflicting tables
+                for file in result.file_names:
+                    if LoadStorage.parse_job_file_name(file).table_name in conflicting_tables:
+                        os.remove(file)
+                # normalize the conflicting tables again with the reconciled schema, new variant columns will be created
+                logger.warning(f"Normalizing tables {conflicting_tables} again after schema conflict")
+                _submit(params._replace(stored_schema=schema.to_dict(), table_names=conflicting_tables))
+                pending_tasks += 1
 
         return schema_updates, row_counts
 
     def map_single(self, schema: Schema, load_id: str, files: Sequence[str]) -> TMapFuncRV:
+        submitted_at = time.time()
         result = Normalize.w_normalize_files(
             self.normalize_storage.config,
             self.load_storage.config,
             self.config.destination_capabilities,
             schema.to_dict(),
             load_id,
-            files,
+            [r for file in files for r in self.normalize_storage.split_extracted_file(file, 0)],
+            self.config.jsonl_items_normalizer,
         )
-        self.update_table(schema, result[0])
-        self.collector.update("Files", len(result[2]))
-        self.collector.update("Items", result[1])
-        return result[0], result[3]
+        self.update_table(schema, result.schema_updates)
+        self._update_task_metrics(result, submitted_at)
+        return result.schema_updates, result.row_counts
+
+    def _update_task_metrics(self, result: TWorkerRV, submitted_at: float) -> None:
+        self.collector.update("Files", len(result.file_names))
+        self.collector.update("Items", result.total_items)
+        # report timing of each task to spot imbalance between the workers
+        queue_time = result.started_at - submitted_at
+        run_time = result.finished_at - result.started_at
+        items_per_sec = result.total_items / run_time if run_time > 0 else 0.0
+        message = f"queued {queue_time:.2f}s, ran {run_time:.2f}s, {items_per_sec:.0f} items/s"
+        logger.info(f"Normalize task with {result.total_items} items completed: {message}")
+        self.collector.update("Tasks", message=message)
 
     def spool_files(self, schema_name: str, load_id: str, map_f: TMapFuncType, files: Sequence[str]) -> None:
         schema = Normalize.load_or_create_schema(self.schema_storage, schema_name)
@@ -252,6 +346,10 @@ class Normalize(Runnable[ProcessPool]):
             logger.info(f"Saving schema {schema_name} with version {schema.version}, writing manifest files")
             # schema is updated, save it to schema volume
             self.schema_storage.save_schema(schema)
+        # combine small job files so each of them does not become a separate load job
+        if self.config.combine_files_max_bytes:
+            removed_count = self.load_storage.combine_temp_job_files(load_id, self.config.combine_files_max_bytes, self.COMBINE_FILE_FORMATS)
+            logger.info(f"Combined job files in {load_id}, {removed_count} jobs removed")
         # save schema to temp load folder
         self.load_storage.save_temp_schema(schema, load_id)
         # save schema updates even if empty
@@ -275,15 +373,8 @@ class Normalize(Runnable[ProcessPool]):
 
         # if pool is not present use map_single method to run normalization in single process
         map_parallel_f = self.map_parallel if self.pool else self.map_single
-        try:
-            # process parallel
-            self.spool_files(schema_name, load_id, map_parallel_f, files)
-        except CannotCoerceColumnException as exc:
-            # schema conflicts resulting from parallel executing
-            logger.warning(f"Parallel schema update conflict, switching to single thread ({str(exc)}")
-            # start from scratch
-            self.load_storage.create_temp_load_package(load_id)
-            self.spool_files(schema_name, load_id, self.map_single, files)
+        # schema conflicts between parallel workers are reconciled in map_parallel
+        self.spool_files(schema_name, load_id, map_parallel_f, files)
 
         return load_id
 
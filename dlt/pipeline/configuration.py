@@ -24,6 +24,10 @@ class PipelineConfiguration(BaseConfiguration):
     """Stores all schemas in single dataset. When False, each schema will get a separate dataset with `{dataset_name}_{schema_name}"""
     full_refresh: bool = False
     """When set to True, each instance of the pipeline with the `pipeline_name` starts from scratch when run and loads the data to a separate dataset."""
+    extract_items_format: TLoaderFileFormat = "puae-jsonl"
+    """Format of the files passed from extract to normalize. `pickle` keeps python types and is faster to read than `puae-jsonl`"""
+    extract_file_max_bytes: Optional[int] = None
+    """Extracted files are rotated when they reach that many (uncompressed) bytes so a large resource is normalized by many workers. Not set by default: only uncompressed extracted files are split by normalize"""
     progress: Optional[str] = None
     runtime: RunConfiguration
 
@@ -270,7 +270,7 @@ class Pipeline(SupportsPipeline):
     ) -> ExtractInfo:
         """Extracts the `data` and prepare it for the normalization. Does not require destination or credentials to be configured. See `run` method for the arguments' description."""
         # create extract storage to which all the sources will be extracted
-        storage = ExtractorStorage(self._normalize_storage_config)
+        storage = ExtractorStorage(self._normalize_storage_config, self.config.extract_items_format, self.config.extract_file_max_bytes)
         extract_ids: List[str] = []
         try:
             with self._maybe_destination_capabilities():
@@ -1249,7 +1249,7 @@ class Pipeline(SupportsPipeline):
         # this will extract the state into current load package and update the schema with the _dlt_pipeline_state table
         # note: the schema will be persisted because the schema saving decorator is over the state manager decorator for extract
         state_source = DltSource(self.default_schema.name, self.pipeline_name, self.default_schema, [state_resource(state)])
-        storage = ExtractorStorage(self._normalize_storage_config)
+        storage = ExtractorStorage(self._normalize_storage_config, self.config.extract_items_format, self.config.extract_file_max_bytes)
         extract_id = extract_with_schema(storage, state_source, self.default_schema, _NULL_COLLECTOR, 1, 1)
         storage.commit_extract_files(extract_id)
         return state
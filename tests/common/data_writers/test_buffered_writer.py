@@ -1,9 +1,11 @@
 import os
-from typing import Iterator, Set, Literal
+import sys
+from typing import Any, Dict, Iterator, Set, Literal
 
 import pytest
 
-from dlt.common.data_writers.buffered import BufferedDataWriter, DataWriter
+from dlt.common.data_writers.buffered import BufferedDataWriter, DataWriter, WriterMemoryBudget, BackgroundWriterThread, estimate_item_size
+from dlt.common import json
 from dlt.common.data_writers.exceptions import BufferedDataWriterClosed
 from dlt.common.destination import TLoaderFileFormat, DestinationCapabilitiesContext
 from dlt.common.schema.utils import new_column
@@ -18,11 +20,18 @@ import datetime  # noqa: 251
 ALL_WRITERS: Set[Literal[TLoaderFileFormat]] = {"insert_values", "jsonl", "parquet", "arrow", "puae-jsonl"}
 
 
-def get_writer(_format: TLoaderFileFormat = "insert_values", buffer_max_items: int = 10, disable_compression: bool = False) -> BufferedDataWriter[DataWriter]:
+def get_writer(
+    _format: TLoaderFileFormat = "insert_values",
+    buffer_max_items: int = 10,
+    disable_compression: bool = False,
+    memory_budget: WriterMemoryBudget = None,
+    writer_thread: BackgroundWriterThread = None,
+    background_flush: bool = False
+) -> BufferedDataWriter[DataWriter]:
     caps = DestinationCapabilitiesContext.generic_capabilities()
     caps.preferred_loader_file_format = _format
     file_template = os.path.join(TEST_STORAGE_ROOT, f"{_format}.%s")
-    return BufferedDataWriter(_format, file_template, buffer_max_items=buffer_max_items, disable_compression=disable_compression, _caps=caps)
+    return BufferedDataWriter(_format, file_template, buffer_max_items=buffer_max_items, disable_compression=disable_compression, _caps=caps, memory_budget=memory_budget, background_flush=background_flush, writer_thread=lambda: writer_thread)
 
 
 def test_write_no_item() -> None:
@@ -219,3 +228,133 @@ def test_writer_items_count_arrow() -> None:
         writer._flush_items()
         assert writer._buffered_items_count == 0
         assert writer._writer.items_count == 7
+
+
+def test_memory_budget_flushes_largest_buffers() -> None:
+    c1 = {"col1": new_column("col1", "text")}
+    budget = WriterMemoryBudget(max_buffered_bytes=20000)
+    small_writer = get_writer(_format="jsonl", buffer_max_items=1000, memory_budget=budget)
+    large_writer = get_writer(_format="jsonl", buffer_max_items=1000, memory_budget=budget)
+    small_writer.write_data_item([{"col1": "a"}], columns=c1)
+    small_bytes = budget.buffered_bytes
+    assert small_bytes == small_writer._buffered_items_bytes > 0
+    large_writer.write_data_item([{"col1": "a" * 1000} for _ in range(10)], columns=c1)
+    # budget not exceeded
+    assert large_writer._file is None
+    large_writer.write_data_item([{"col1": "a" * 1000} for _ in range(10)], columns=c1)
+    # largest buffer got flushed, small buffer still there
+    assert large_writer._buffered_items == []
+    assert large_writer._writer.items_count == 20
+    assert small_writer._buffered_items_count == 1
+    assert budget.buffered_bytes == small_bytes
+    small_writer.close()
+    large_writer.close()
+    assert budget.buffered_bytes == 0
+
+
+def test_memory_budget_open_files_lru() -> None:
+    c1 = {"col1": new_column("col1", "bigint")}
+    budget = WriterMemoryBudget(max_open_files=2)
+    writers = [get_writer(_format="jsonl", buffer_max_items=1, memory_budget=budget) for _ in range(3)]
+    writers[0].write_data_item({"col1": 1}, columns=c1)
+    writers[1].write_data_item({"col1": 1}, columns=c1)
+    # use first writer so the second is least recently used
+    writers[0].write_data_item({"col1": 2}, columns=c1)
+    assert all(w.closed_files == [] for w in writers)
+    writers[2].write_data_item({"col1": 1}, columns=c1)
+    # least recently used file got rotated
+    assert writers[1]._file is None
+    assert len(writers[1].closed_files) == 1
+    assert writers[0]._file is not None and writers[2]._file is not None
+    # writer with rotated file opens new one and rotates the next lru
+    writers[1].write_data_item({"col1": 2}, columns=c1)
+    assert len(writers[0].closed_files) == 1
+    for writer in writers:
+        writer.close()
+    assert sum(len(w.closed_files) for w in writers) == 4
+
+
+def test_memory_budget_open_files_background_flush() -> None:
+    c1 = {"col1": new_column("col1", "bigint")}
+    budget = WriterMemoryBudget(max_open_files=2)
+    writer_thread = BackgroundWriterThread()
+    writers = [
+        get_writer(_format="jsonl", buffer_max_items=1, memory_budget=budget, writer_thread=writer_thread, background_flush=True) for _ in range(3)
+    ]
+    for i in range(30):
+        writers[i % 3].write_data_item({"col1": i}, columns=c1)
+    for writer in writers:
+        writer.close()
+    writer_thread.shutdown()
+    # files are rotated on the background thread holding the lock of the evicted writer
+    assert len(budget._open_files) == 0
+    values = []
+    for writer in writers:
+        assert len(writer.closed_files) > 1
+        for file_name in writer.closed_files:
+            with FileStorage.open_zipsafe_ro(file_name, "r", encoding="utf-8") as f:
+                values.extend(json.loads(line)["col1"] for line in f)
+    assert sorted(values) == list(range(30))
+
+
+def test_estimate_item_size() -> None:
+    row = {"col1": "a" * 100, "col2": [1, 2, 3]}
+    assert estimate_item_size(row) >= sys.getsizeof(row) + sys.getsizeof(row["col1"])
+    # long lists are sampled and extrapolated
+    rows = [dict(row) for _ in range(10000)]
+    assert abs(estimate_item_size(rows) - sys.getsizeof(rows) - 10000 * estimate_item_size(row)) <= 10000
+    # deep nesting does not hit the recursion limit
+    nested: Dict[str, Any] = {}
+    for _ in range(sys.getrecursionlimit() * 2):
+        nested = {"n": nested}
+    assert estimate_item_size(nested) > 0
+
+
+def test_writer_compression_codec() -> None:
+    c1 = {"col1": new_column("col1", "bigint")}
+    caps = DestinationCapabilitiesContext.generic_capabilities()
+    file_template = os.path.join(TEST_STORAGE_ROOT, "jsonl.%s")
+    with BufferedDataWriter("jsonl", file_template, disable_compression=False, compression_codec="gzip", compression_level=1, _caps=caps) as writer:
+        writer.write_data_item([{"col1": 1}, {"col1": 2}], columns=c1)
+    assert FileStorage.is_gzipped(writer.closed_files[0])
+    with FileStorage.open_zipsafe_ro(writer.closed_files[0], "r", encoding="utf-8") as f:
+        assert f.readlines() == ['{"col1":1}\n', '{"col1":2}\n']
+
+
+@pytest.mark.parametrize("background_flush", [True, False], ids=["background", "sync"])
+def test_background_flush(background_flush: bool) -> None:
+    c1 = new_column("col1", "bigint")
+    c2 = new_column("col2", "bigint")
+    t1 = {"col1": c1}
+    t2 = {"col2": c2, "col1": c1}
+
+    writer_thread = BackgroundWriterThread(max_pending_flushes=2)
+    with get_writer(buffer_max_items=5, writer_thread=writer_thread, background_flush=background_flush) as writer:
+        writer.file_max_items = 20
+        for i in range(0, 50):
+            writer.write_data_item({"col1": i}, t1)
+        # schema change rotates the file for insert values
+        for i in range(50, 60):
+            writer.write_data_item({"col1": i, "col2": i}, t2)
+        assert writer._buffered_items_count <= 5
+    writer_thread.shutdown()
+    assert writer._pending_flushes == []
+    # files rotated on max items and on schema change
+    assert len(writer.closed_files) == 4
+    values = []
+    for file_name in writer.closed_files:
+        with FileStorage.open_zipsafe_ro(file_name, "r", encoding="utf-8") as f:
+            rows = f.readlines()[2:]
+        # col1 and col2 have the same values
+        values.extend(int(row.strip(",;()\n").split(",")[0]) for row in rows)
+    assert values == list(range(60))
+
+
+def test_background_flush_error() -> None:
+    writer_thread = BackgroundWriterThread()
+    writer = get_writer(buffer_max_items=1, writer_thread=writer_thread, background_flush=True)
+    # insert values requires schema, exception happens on background thread
+    writer.write_data_item([{"col1": 1}], None)
+    with pytest.raises(AssertionError):
+        writer.close()
+    writer_thread.shutdown()
@@ -122,3 +122,130 @@ def test_string_literal_escape_unicode() -> None:
     assert escape_redshift_literal("イロハニホヘト チリヌルヲ ワカヨタレソ ツネナラム") == "'イロハニホヘト チリヌルヲ ワカヨタレソ ツネナラム'"
     assert escape_redshift_identifier("ąćł\"") == '"ąćł"""'
     assert escape_redshift_identifier("イロハニホヘト チリヌルヲ \"ワカヨタレソ ツネナラム") == '"イロハニホヘト チリヌルヲ ""ワカヨタレソ ツネナラム"'
+
+
+def test_typed_pickle_writer() -> None:
+    from dataclasses import dataclass
+    from datetime import datetime, date, timezone  # noqa: I251
+    from typing import NamedTuple
+    from uuid import uuid4
+    from hexbytes import HexBytes
+
+    from dlt.common import Decimal
+    from dlt.common.wei import Wei
+    from dlt.common.data_writers.typed_pickle import load_typed_items
+
+    @dataclass
+    class Point:
+        x: int
+        y: int
+
+    class Pair(NamedTuple):
+        left: str
+        right: str
+
+    uuid = uuid4()
+    now = pendulum.now()
+    rows = [
+        {"timestamp": now, "date": pendulum.date(1974, 8, 11), "decimal": Decimal("1.212"), "wei": Wei(2**100)},
+        {"uuid": uuid, "hexbytes": HexBytes(b"abc"), "bytes": b"bytes", "point": Point(1, 2), "pair": Pair("a", "b")},
+    ]
+    with io.BytesIO() as f:
+        writer = DataWriter.class_factory("pickle")(f)
+        # each write produces one frame
+        writer.write_all(None, rows[:1])
+        writer.write_data(rows[1:])
+        assert writer.items_count == 2
+        f.seek(0)
+        frames = list(load_typed_items(f))
+    assert len(frames) == 2
+    row = frames[0][0]
+    # pendulum is converted to standard lib types
+    assert type(row["timestamp"]) is datetime
+    assert row["timestamp"] == now
+    assert row["timestamp"].tzinfo == timezone(now.utcoffset())
+    assert type(row["date"]) is date
+    assert row["date"] == date(1974, 8, 11)
+    assert type(row["decimal"]) is Decimal
+    assert type(row["wei"]) is Wei
+    assert row["wei"] == 2**100
+    row = frames[1][0]
+    assert row["uuid"] == uuid
+    assert type(row["hexbytes"]) is HexBytes
+    assert row["bytes"] == b"bytes"
+    # objects are converted like in json
+    assert row["point"] == {"x": 1, "y": 2}
+    assert row["pair"] == {"left": "a", "right": "b"}
+
+
+def test_typed_pickle_writer_collections() -> None:
+    import pickle
+    from collections import OrderedDict, defaultdict
+    from datetime import timedelta  # noqa: I251
+
+    from dlt.common.data_writers.typed_pickle import load_typed_items
+
+    class Items(list):  # type: ignore[type-arg]
+        pass
+
+    nested = defaultdict(list, {"values": Items([1, 2])})
+    rows = [OrderedDict([("b", 1), ("a", {"nested": nested, "duration": pendulum.duration(seconds=3)})])]
+    with io.BytesIO() as f:
+        writer = DataWriter.class_factory("pickle")(f)
+        writer.write_all(None, rows)
+        f.seek(0)
+        frames = list(load_typed_items(f))
+    row = frames[0][0]
+    # subclasses are stored as plain types
+    assert type(row) is dict
+    assert list(row.keys()) == ["b", "a"]
+    assert type(row["a"]["nested"]) is dict
+    assert type(row["a"]["nested"]["values"]) is list
+    assert row["a"]["nested"] == {"values": [1, 2]}
+    assert type(row["a"]["duration"]) is timedelta
+    assert row["a"]["duration"] == timedelta(seconds=3)
+
+    # pickle frames with other globals are not loaded
+    with io.BytesIO() as f:
+        pickle.dump([{"cls": OrderedDict()}], f)
+        f.seek(0)
+        with pytest.raises(pickle.UnpicklingError):
+            list(load_typed_items(f))
+
+
+def test_typed_pickle_writer_scalars() -> None:
+    from enum import Enum, IntEnum
+
+    from dlt.common.data_writers.typed_pickle import load_typed_items
+
+    class Name(str):
+        pass
+
+    class Count(int):
+        pass
+
+    class Ratio(float):
+        pass
+
+    class Color(str, Enum):
+        RED = "red"
+
+    class Level(IntEnum):
+        HIGH = 2
+
+    rows = [{"name": Name("x"), "count": Count(1), "ratio": Ratio(0.5), "color": Color.RED, "level": Level.HIGH}]
+    with io.BytesIO() as f:
+        writer = DataWriter.class_factory("pickle")(f)
+        writer.write_all(None, rows)
+        f.seek(0)
+        row = list(load_typed_items(f))[0][0]
+    # subclasses are stored as base types, enums as their values
+    assert row == {"name": "x", "count": 1, "ratio": 0.5, "color": "red", "level": 2}
+    assert [type(v) for v in row.values()] == [str, int, float, str, int]
+
+    # sets are pickled natively, the normalizer rejects them when coercing the values
+    with io.BytesIO() as f:
+        writer = DataWriter.class_factory("pickle")(f)
+        writer.write_all(None, [{"set": {1, 2}, "frozenset": frozenset([1])}])
+        f.seek(0)
+        assert list(load_typed_items(f))[0][0] == {"set": {1, 2}, "frozenset": frozenset([1])}
@@ -90,6 +90,61 @@ def test_preserve_complex_value_with_hint(norm: RelationalNormalizer) -> None:
     assert "value__complex" not in flattened_row
 
 
+def test_flatten_plans_invalidation(norm: RelationalNormalizer) -> None:
+    row = {"f 1": {"complex": True}}
+    flattened_row, _ = norm._flatten("mock_table", row, 0)  # type: ignore[arg-type]
+    assert flattened_row == {"f_1__complex": True}
+    assert norm._flatten_plans[("mock_table", 0)]["f 1"].child_name == "f_1"
+    # same plan is used for next row
+    flattened_row, _ = norm._flatten("mock_table", row, 0)  # type: ignore[arg-type]
+    assert flattened_row == {"f_1__complex": True}
+
+    # complex column added to the table invalidates table plans
+    norm.schema.update_table(
+        new_table("mock_table", columns=[{"name": "f_1", "data_type": "complex", "nullable": True}])
+    )
+    assert ("mock_table", 0) not in norm._flatten_plans
+    flattened_row, _ = norm._flatten("mock_table", row, 0)  # type: ignore[arg-type]
+    assert flattened_row == {"f_1": {"complex": True}}
+
+    # changed preferred types invalidate all plans
+    flattened_row, _ = norm._flatten("other_table", row, 0)  # type: ignore[arg-type]
+    assert flattened_row == {"f_1__complex": True}
+    norm.schema._settings.setdefault("preferred_types", {})[TSimpleRegex("re:^f_1$")] = "complex"
+    norm.schema._compile_settings()
+    flattened_row, _ = norm._flatten("other_table", row, 0)  # type: ignore[arg-type]
+    assert flattened_row == {"f_1": {"complex": True}}
+
+    # any recompilation of settings invalidates all plans
+    norm._flatten("mock_table", row, 0)  # type: ignore[arg-type]
+    norm.schema._compile_settings()
+    norm._flatten("other_table", row, 0)  # type: ignore[arg-type]
+    assert ("mock_table", 0) not in norm._flatten_plans
+
+
+def test_flatten_plans_capped(norm: RelationalNormalizer) -> None:
+    norm.MAX_FLATTEN_PLANS = 2
+    for i in range(5):
+        flattened_row, _ = norm._flatten("mock_table", {f"k{i}": i, "nested": {f"n{i}": i}}, 0)  # type: ignore[arg-type]
+        assert flattened_row == {f"k{i}": i, f"nested__n{i}": i}
+        assert len(norm._flatten_plans[("mock_table", 0)]) <= 2
+        assert all(len(plan.nested) <= 2 for plan in norm._flatten_plans[("mock_table", 0)].values())
+    # least recently used plan is evicted
+    assert list(norm._flatten_plans[("mock_table", 0)]) == ["k4", "nested"]
+    norm._flatten("mock_table", {"nested": {}, "k4": 4}, 0)  # type: ignore[arg-type]
+    norm._flatten("mock_table", {"k5": 5}, 0)  # type: ignore[arg-type]
+    assert list(norm._flatten_plans[("mock_table", 0)]) == ["k4", "k5"]
+
+
+def test_flatten_incomplete_column(norm: RelationalNormalizer) -> None:
+    # column with hints only
+    norm.schema.update_table(
+        new_table("mock_table", columns=[{"name": "f_1", "primary_key": True}])  # type: ignore[typeddict-item]
+    )
+    flattened_row, _ = norm._flatten("mock_table", {"f 1": 1}, 0)  # type: ignore[arg-type]
+    assert flattened_row == {"f_1": 1}
+
+
 def test_child_table_linking(norm: RelationalNormalizer) -> None:
     row = {
         "f": [{
@@ -307,6 +362,31 @@ def test_list_position(norm: RelationalNormalizer) -> None:
         assert row["_dlt_list_idx"] == pos
 
 
+def test_tuple_normalized_as_list(norm: RelationalNormalizer) -> None:
+    # items that do not pass through json (ie. typed pickle) keep tuples, those must normalize exactly like lists
+    list_row: StrAny = {
+        "_dlt_id": "123456",
+        "f": [{"l": ["a", "b"], "v": 120}],
+        "ll": [[1, 2], [3]],
+    }
+    tuple_row: StrAny = {
+        "_dlt_id": "123456",
+        "f": ({"l": ("a", "b"), "v": 120},),
+        "ll": ((1, 2), (3,)),
+    }
+    list_rows = list(norm._normalize_row(list_row, {}, ("table", )))  # type: ignore[arg-type]
+    tuple_rows = list(norm._normalize_row(tuple_row, {}, ("table", )))  # type: ignore[arg-type]
+    assert tuple_rows == list_rows
+    assert [t[0][0] for t in tuple_rows].count("table__f__l") == 2
+
+    # tuples in complex columns are preserved as they are
+    norm.schema.update_table(new_table("event_slot", columns=[{"name": "value", "data_type": "complex"}]))
+    row = {"value": ("from", {"complex": True})}
+    normalized_rows = list(norm._normalize_row(row, {}, ("event_slot", )))  # type: ignore[arg-type]
+    assert len(normalized_rows) == 1
+    assert normalized_rows[0][1]["value"] == ("from", {"complex": True})
+
+
 # def test_list_of_lists(norm: RelationalNormalizer) -> None:
 #     row = {
 #         "l":[
@@ -174,6 +174,37 @@ def test_coerce_row_iso_timestamp(schema: Schema) -> None:
     assert new_columns[0]["name"] == "timestamp__v_text"
 
 
+def test_coerce_row_shape_plans(schema: Schema) -> None:
+    _add_preferred_types(schema)
+    row_1 = {"timestamp": 78172.128, "confidence": 0.1, "empty": None}
+    _, new_table = schema.coerce_row("event_user", None, row_1)
+    # no plan for shapes that change schema
+    assert "event_user" not in schema._coerce_row_plans
+    schema.update_table(new_table)
+    new_row_1, new_table = schema.coerce_row("event_user", None, row_1)
+    assert new_table is None
+    plans = schema._coerce_row_plans["event_user"]
+    assert len(plans) == 1
+    # float is coerced into timestamp, double passed as is, None dropped
+    assert list(plans.values())[0] == [("timestamp", "timestamp", "double", False), ("confidence", "double", "double", True)]
+    # same shape uses plan
+    new_row_2, new_table = schema.coerce_row("event_user", None, {"timestamp": 78172.128, "confidence": 0.1, "empty": None})
+    assert new_table is None
+    assert new_row_2 == new_row_1 == {"timestamp": pendulum.parse("1970-01-01T21:42:52.128000+00:00"), "confidence": 0.1}
+    # value that cannot be coerced falls back to variant
+    row_3 = {"timestamp": 78172.128, "confidence": "0.1"}
+    new_row_3, new_table = schema.coerce_row("event_user", None, row_3)
+    assert new_table is None
+    assert new_row_3["confidence"] == 0.1
+    assert len(plans) == 2
+    new_row_3, new_table = schema.coerce_row("event_user", None, {"timestamp": 78172.128, "confidence": "STR"})
+    assert new_row_3 == {"timestamp": new_row_1["timestamp"], "confidence__v_text": "STR"}
+    assert new_table["columns"]["confidence__v_text"]["variant"] is True
+    # table update drops plans
+    schema.update_table(new_table)
+    assert "event_user" not in schema._coerce_row_plans
+
+
 def test_shorten_variant_column(schema: Schema) -> None:
     schema.naming.max_length = 9
     _add_preferred_types(schema)
@@ -5,6 +5,7 @@ import pytest
 from pathlib import Path
 from typing import cast, TextIO
 
+from dlt.common.compression import TCompressionCodec, open_compressed
 from dlt.common.storages.file_storage import FileStorage
 from dlt.common.utils import encoding_for_mode, set_working_dir, uniq_id
 
@@ -236,3 +237,27 @@ def test_open_compressed() -> None:
         content = f.read()
         assert isinstance(content, str)
         assert content == bstr.decode("utf-8")
+
+
+@pytest.mark.parametrize("codec", ["gzip", "zstd", "lz4"])
+def test_open_compressed_codecs(codec: TCompressionCodec) -> None:
+    if codec == "zstd":
+        pytest.importorskip("zstandard")
+    if codec == "lz4":
+        pytest.importorskip("lz4.frame")
+    tstr = "dataisfunindeed\n" * 100
+    storage = FileStorage(TEST_STORAGE_ROOT)
+    fname = storage.make_full_path("file.txt")
+    with open_compressed(fname, "wt", codec, level=1, encoding="utf-8") as f:
+        f.write(tstr)
+    # codec detected from the header
+    assert FileStorage.compression_codec(fname) == codec
+    assert FileStorage.is_gzipped(fname) is (codec == "gzip")
+    with storage.open_file("file.txt", mode="r") as f:
+        assert f.read() == tstr
+    with storage.open_file("file.txt", mode="rb") as f:
+        assert f.read() == tstr.encode("utf-8")
+    # not compressed file
+    with open(fname, "wb") as f:
+        f.write(tstr.encode("utf-8"))
+    assert FileStorage.compression_codec(fname) is None
@@ -7,10 +7,13 @@ from dlt.common import sleep, json, pendulum
 from dlt.common.schema import Schema, TSchemaTables
 from dlt.common.storages.load_storage import LoadPackageInfo, LoadStorage, ParsedLoadJobFileName, TJobState
 from dlt.common.configuration import resolve_configuration
-from dlt.common.storages import LoadStorageConfiguration
+from dlt.common.data_writers import BufferedDataWriter
+from dlt.common.destination import DestinationCapabilitiesContext, TLoaderFileFormat
+from dlt.common.schema.utils import new_column
+from dlt.common.storages import FileStorage, LoadStorageConfiguration
 from dlt.common.storages.exceptions import LoadPackageNotFound, NoMigrationPathException
 from dlt.common.typing import StrAny
-from dlt.common.utils import uniq_id
+from dlt.common.utils import custom_environ, uniq_id
 
 from tests.utils import TEST_STORAGE_ROOT, write_version, autouse_test_storage
 
@@ -159,6 +162,43 @@ def test_retry_job(storage: LoadStorage) -> None:
     assert LoadStorage.parse_job_file_name(new_fp).retry_count == 2
 
 
+def test_list_job_states_for_table(storage: LoadStorage) -> None:
+    load_id, fn = start_loading_file(storage, "test file")  # type: ignore[arg-type]
+    assert storage.list_job_states_for_table(load_id, "unknown_table") == []
+    assert storage.list_job_states_for_table(load_id, "mock_table") == [("started_jobs", LoadStorage.parse_job_file_name(fn))]
+    # index is updated by job methods
+    new_fn = Path(storage.retry_job(load_id, fn)).name
+    assert storage.list_job_states_for_table(load_id, "mock_table") == [("new_jobs", LoadStorage.parse_job_file_name(new_fn))]
+    storage.start_job(load_id, new_fn)
+    storage.fail_job(load_id, new_fn, "EXCEPTION")
+    assert storage.list_job_states_for_table(load_id, "mock_table") == [("failed_jobs", LoadStorage.parse_job_file_name(new_fn))]
+    job_info = storage.list_jobs_for_table(load_id, "mock_table")[0]
+    assert job_info.state == "failed_jobs"
+    assert job_info.failed_message == "EXCEPTION"
+    # index reflects the package folders
+    storage._drop_jobs_index(load_id)
+    assert storage.list_job_states_for_table(load_id, "mock_table") == [("failed_jobs", LoadStorage.parse_job_file_name(new_fn))]
+    storage.complete_load_package(load_id, False)
+    with pytest.raises(LoadPackageNotFound):
+        storage.list_job_states_for_table(load_id, "mock_table")
+
+
+def test_list_new_jobs_from_index(storage: LoadStorage) -> None:
+    load_id, fn = start_loading_file(storage, "test file")  # type: ignore[arg-type]
+    assert storage.list_new_jobs_from_index(load_id, 10) == []
+    # retried job is a new job again, index is updated by job methods
+    new_fn = Path(storage.retry_job(load_id, fn)).name
+    assert storage.list_new_jobs_from_index(load_id, 10) == storage.list_new_jobs(load_id)
+    assert storage.list_new_jobs_from_index(load_id, 0) == []
+    assert storage.list_new_jobs_from_index(load_id, 10, lambda f: f == new_fn) == []
+    storage.start_job(load_id, new_fn)
+    assert storage.list_new_jobs_from_index(load_id, 10) == []
+    # index reflects the package folders
+    storage.retry_job(load_id, new_fn)
+    storage._drop_jobs_index(load_id)
+    assert storage.list_new_jobs_from_index(load_id, 10) == storage.list_new_jobs(load_id)
+
+
 def test_build_parse_job_path(storage: LoadStorage) -> None:
     file_id = uniq_id(5)
     f_n_t = ParsedLoadJobFileName("test_table", file_id, 0, "jsonl")
@@ -217,6 +257,60 @@ def test_get_unknown_package_info(storage: LoadStorage) -> None:
         storage.get_load_package_info("UNKNOWN LOAD ID")
 
 
+def test_writers_use_gzip(storage: LoadStorage) -> None:
+    # codec configured for extract files in shared data writer section does not apply to load packages
+    load_id = uniq_id()
+    storage.create_temp_load_package(load_id)
+    with custom_environ({"DATA_WRITER__COMPRESSION_CODEC": "zstd"}):
+        storage.write_data_item(load_id, "mock", "items", {"id": 1}, {"id": new_column("id", "bigint")})
+        storage.close_writers(load_id)
+    job_file, = storage.storage.list_folder_files(os.path.join(load_id, LoadStorage.NEW_JOBS_FOLDER))
+    assert FileStorage.compression_codec(storage.storage.make_full_path(job_file)) == "gzip"
+
+
+@pytest.mark.parametrize("file_format", ["jsonl", "insert_values", "parquet"])
+def test_combine_temp_job_files(file_format: TLoaderFileFormat) -> None:
+    C = resolve_configuration(LoadStorageConfiguration())
+    storage = LoadStorage(True, file_format, LoadStorage.ALL_SUPPORTED_FILE_FORMATS, C)
+    load_id = uniq_id()
+    storage.create_temp_load_package(load_id)
+    caps = DestinationCapabilitiesContext.generic_capabilities()
+    columns = {"id": new_column("id", "bigint"), "value": new_column("value", "text")}
+    for table_name in ["items", "other_items"]:
+        path_template = storage._get_data_item_path_template(load_id, None, table_name)
+        with BufferedDataWriter(file_format, path_template, buffer_max_items=2, file_max_items=2, _caps=caps) as writer:
+            for i in range(0, 9):
+                writer.write_data_item({"id": i, "value": f"line\r\n{i}"}, columns)
+    jobs_folder = os.path.join(load_id, LoadStorage.NEW_JOBS_FOLDER)
+    assert len(storage.storage.list_folder_files(jobs_folder)) == 10
+    # files larger than max size are not combined
+    assert storage.combine_temp_job_files(load_id, 1, [file_format]) == 0
+    # other formats are not combined
+    assert storage.combine_temp_job_files(load_id, 1024 * 1024, ["reference"]) == 0
+    # each table gets one file
+    assert storage.combine_temp_job_files(load_id, 1024 * 1024, [file_format]) == 8
+    job_files = storage.storage.list_folder_files(jobs_folder)
+    assert sorted(LoadStorage.parse_job_file_name(f).table_name for f in job_files) == ["items", "other_items"]
+    for job_file in job_files:
+        assert LoadStorage.parse_job_file_name(job_file).file_format == file_format
+        job_path = storage.storage.make_full_path(job_file)
+        if file_format == "parquet":
+            import pyarrow.parquet as pq
+            rows = pq.read_table(job_path).to_pylist()
+        elif file_format == "jsonl":
+            with storage.storage.open_file(job_file, "rb") as f:
+                rows = [json.loadb(line) for line in f]
+        else:
+            with FileStorage.open_zipsafe_ro(job_path, "r", encoding="utf-8", newline="") as f:
+                content = f.read()
+            assert content.startswith("INSERT INTO {}(")
+            assert content.endswith(";")
+            assert content.count("line\r\n") == 9
+            continue
+        # files are combined in order of random file ids
+        assert sorted(rows, key=lambda r: r["id"]) == [{"id": i, "value": f"line\r\n{i}"} for i in range(0, 9)]
+
+
 def test_full_migration_path() -> None:
     # create directory structure
     s = LoadStorage(True, "jsonl", LoadStorage.ALL_SUPPORTED_FILE_FORMATS)
@@ -1,9 +1,11 @@
+import gzip
+import os
 import pytest
 
 from dlt.common.utils import uniq_id
 from dlt.common.storages import NormalizeStorage, NormalizeStorageConfiguration
 from dlt.common.storages.exceptions import NoMigrationPathException
-from dlt.common.storages.normalize_storage import TParsedNormalizeFileName
+from dlt.common.storages.normalize_storage import TParsedNormalizeFileName, TExtractedItemsRange
 
 from tests.utils import write_version, autouse_test_storage
 
@@ -25,6 +27,41 @@ def test_build_extracted_file_name() -> None:
     assert NormalizeStorage.parse_normalize_file_name(name) == TParsedNormalizeFileName("", "table", load_id, "jsonl")
 
 
+def test_split_extracted_file() -> None:
+    s = NormalizeStorage(True)
+    lines = [b"[" + b"1," * idx + b"0]\n" for idx in range(0, 100)]
+    content = b"".join(lines)
+    file_name = os.path.join(NormalizeStorage.EXTRACTED_FOLDER, NormalizeStorage.build_extracted_file_stem("event", "table", uniq_id()) + ".jsonl")
+    with open(s.storage.make_full_path(file_name), "wb") as f:
+        f.write(content)
+
+    # small files and disabled splitting give single range
+    assert s.split_extracted_file(file_name, 0) == [TExtractedItemsRange(file_name, 0, None, len(content))]
+    assert s.split_extracted_file(file_name, len(content)) == [TExtractedItemsRange(file_name, 0, None, len(content))]
+
+    ranges = s.split_extracted_file(file_name, 1000)
+    assert len(ranges) > 5
+    # ranges cover the whole file and are aligned to lines
+    assert ranges[0].start == 0
+    assert ranges[-1].end == len(content)
+    for prev, next_ in zip(ranges, ranges[1:]):
+        assert prev.end == next_.start
+    split_lines = []
+    for r in ranges:
+        assert r.size == r.end - r.start
+        assert content[r.end - 1:r.end] == b"\n"
+        split_lines.extend(content[r.start:r.end].splitlines(keepends=True))
+    assert split_lines == lines
+    # range boundary falling exactly on the line end
+    ranges = s.split_extracted_file(file_name, len(lines[0]))
+    assert ranges[0] == TExtractedItemsRange(file_name, 0, len(lines[0]), len(lines[0]))
+
+    # compressed files are not split
+    with open(s.storage.make_full_path(file_name), "wb") as f:
+        f.write(gzip.compress(content))
+    assert len(s.split_extracted_file(file_name, 1000)) == 1
+
+
 def test_full_migration_path() -> None:
     # create directory structure
     s = NormalizeStorage(True)
@@ -2,7 +2,8 @@ from copy import deepcopy
 
 import pyarrow as pa
 
-from dlt.common.libs.pyarrow import py_arrow_to_table_schema_columns, get_py_arrow_datatype
+from dlt.common import json
+from dlt.common.libs.pyarrow import py_arrow_to_table_schema_columns, get_py_arrow_datatype, json_string_array, hash_rows
 from dlt.common.destination import DestinationCapabilitiesContext
 from tests.cases import TABLE_UPDATE_COLUMNS_SCHEMA
 
@@ -49,3 +50,37 @@ def test_py_arrow_to_table_schema_columns():
 
     # Resulting schema should match the original
     assert result == dlt_schema
+
+
+def test_json_string_array():
+    values = [{"a": 'q"uote', "b": [1, {"c": "\\"}]}, None, [1, 2], "ąę", 1.5, None]
+    array = json_string_array(values)
+    array.validate(full=True)
+    assert array.type == pa.string()
+    assert array.to_pylist() == [None if v is None else json.dumps(v) for v in values]
+    # explicit validity keeps None values as json null
+    array = json_string_array(values, [True, True, False, True, True, False])
+    assert array.to_pylist() == [json.dumps(values[0]), "null", None, '"ąę"', "1.5", None]
+    assert json_string_array([]).to_pylist() == []
+
+
+def test_hash_rows():
+    table = pa.table({
+        "id": [1, 2, 1, None, 1, 0],
+        "name": ["a", "", "a", None, "ab", None],
+        "tags": [[1], [], [1], None, [2], None],
+        "flag": [True, False, True, None, True, None],
+        "dict": pa.array(["q", "w", "q", "w", "q", None]).dictionary_encode(),
+    })
+    hashes = hash_rows(table, table.column_names).to_pylist()
+    assert hashes[0] == hashes[2]
+    assert len(set(hashes)) == 5
+    # column order, slicing and chunking do not change the hashes
+    assert hash_rows(table.select(list(reversed(table.column_names))), table.column_names).to_pylist() == hashes
+    assert hash_rows(table.slice(2), table.column_names).to_pylist() == hashes[2:]
+    assert hash_rows(pa.concat_tables([table.slice(0, 3), table.slice(3)]), table.column_names).to_pylist() == hashes
+    assert hash_rows(table.to_batches()[0], table.column_names).to_pylist() == hashes
+    # nulls differ from zero values and empty strings
+    assert len(set(hash_rows(pa.table({"v": ["", None, "\x00"]}), ["v"]).to_pylist())) == 3
+    assert len(set(hash_rows(pa.table({"v": [0, None]}), ["v"]).to_pylist())) == 2
+    assert hash_rows(table.slice(0, 0), ["id"]).to_pylist() == []
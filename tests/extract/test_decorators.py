@@ -1,4 +1,5 @@
 import os
+import time
 from typing import List, Optional, Dict, Iterator, Any, cast
 
 import pytest
@@ -299,6 +300,118 @@ def test_resource_name_from_generator() -> None:
     assert r.name == "some_data"
     assert r.section == "test_decorators"
 
+    async def some_async_data():
+        yield [1, 2, 3]
+
+    r = dlt.resource(some_async_data())
+    assert r.name == "some_async_data"
+    assert r.section == "test_decorators"
+    assert list(r) == [1, 2, 3]
+
+
+def test_async_generator_resources() -> None:
+    @dlt.resource
+    async def pages(count: int = 3):
+        for page in range(count):
+            yield [page * 10, page * 10 + 1]
+
+    @dlt.transformer(data_from=pages, max_concurrency=2)
+    async def details(page: List[int], mul: int = 2):
+        for item in page:
+            yield item * mul
+
+    assert details.max_concurrency == 2
+    assert pages.max_concurrency is None
+    assert list(pages) == [0, 1, 10, 11, 20, 21]
+    assert list(pages(1)) == [0, 1]
+    assert sorted(details) == [0, 2, 20, 22, 40, 42]
+    assert sorted(pages(2) | details(mul=3)) == [0, 3, 30, 33]
+    # setting survives cloning of the resource
+    assert details.with_name("renamed").max_concurrency == 2
+
+
+def test_parallelized_resources() -> None:
+    @dlt.resource(parallelized=True)
+    def numbers(count: int = 3):
+        yield from range(count)
+
+    @dlt.resource
+    def letters():
+        yield from ["a", "b", "c"]
+
+    assert numbers.parallelized is True
+    assert letters.parallelized is False
+    assert numbers.with_name("renamed").parallelized is True
+
+    @dlt.source
+    def mixed():
+        return numbers(4), letters
+
+    items = list(mixed())
+    assert [i for i in items if isinstance(i, int)] == [0, 1, 2, 3]
+    assert [i for i in items if isinstance(i, str)] == ["a", "b", "c"]
+
+
+def test_batched_transformer() -> None:
+    @dlt.resource
+    def ids():
+        yield from range(5)
+
+    @dlt.transformer(data_from=ids, batch_size=2, batch_timeout=1.0)
+    def bulk_details(batch: List[int]):
+        yield {"ids": batch}
+
+    assert bulk_details.batch_size == 2
+    assert bulk_details.batch_timeout == 1.0
+    assert list(bulk_details) == [{"ids": [0, 1]}, {"ids": [2, 3]}, {"ids": [4]}]
+    # batching can be disabled
+    bulk_details.batch_size = None
+    assert list(bulk_details) == [{"ids": i} for i in range(5)]
+
+
+def test_resource_rate_limit() -> None:
+    @dlt.resource
+    def ids():
+        yield from range(4)
+
+    r = ids().add_rate_limit(20, burst=2)
+    assert r._pipe.rate_limit == 20
+    assert r._pipe.rate_limit_burst == 2
+    start_ts = time.time()
+    assert list(r) == [0, 1, 2, 3]
+    assert time.time() - start_ts > 0.09
+    # limit is removed
+    assert r.add_rate_limit(None)._pipe.rate_limit is None
+
+
+def test_parallelized_resource_with_transformer() -> None:
+    @dlt.resource(parallelized=True)
+    def numbers():
+        for i in range(3):
+            time.sleep(0.01)
+            yield i
+
+    @dlt.transformer(data_from=numbers)
+    def tens(item: int):
+        yield item * 10
+
+    @dlt.transformer(data_from=numbers, parallelized=True)
+    def hundreds(item: int):
+        time.sleep(0.01)
+        yield item * 100
+
+    # forked items are passed to the transformer, not emitted as data
+    assert list(numbers | tens) == [0, 10, 20]
+    assert list(numbers | hundreds) == [0, 100, 200]
+
+    @dlt.source
+    def chained():
+        return numbers, tens, hundreds
+
+    items = list(chained())
+    assert sorted(items) == sorted([0, 1, 2, 0, 10, 20, 0, 100, 200])
+    assert all(isinstance(i, int) for i in items)
+
 
 def test_source_sections() -> None:
     # source in __init__.py of module
@@ -5,6 +5,7 @@ from dlt.extract.extract import ExtractorStorage, extract
 from dlt.extract.source import DltResource, DltSource
 
 from tests.utils import clean_test_storage
+from tests.common.configuration.utils import environment
 from tests.extract.utils import expect_extracted_file
 
 
@@ -110,3 +111,57 @@ def test_extract_renamed_clone_and_parent():
     assert "tx_clone" in schema_update
     # mind that pipe name of the evaluated parent will have different name than the resource
     assert source.tx_clone._pipe.parent.name == "input_gen_tx_clone"
+
+
+def test_extract_dynamic_table_list_partitioned() -> None:
+    @dlt.resource
+    def events():
+        yield [{"type": "a" if i % 2 else "b", "col": f"c_{i % 4}", "i": i} for i in range(8)]
+
+    events_r = events()
+    events_r.apply_hints(table_name=lambda item: item["type"], columns=lambda item: {item["col"]: {"data_type": "text"}})
+
+    written = []
+    storage = ExtractorStorage(NormalizeStorageConfiguration())
+    write_data_item = storage.get_storage("puae-jsonl").write_data_item
+
+    def _write_data_item(load_id, schema_name, table_name, item, columns):
+        written.append((table_name, item))
+        return write_data_item(load_id, schema_name, table_name, item, columns)
+
+    storage.get_storage("puae-jsonl").write_data_item = _write_data_item  # type: ignore[method-assign]
+    source = DltSource("events", "module", dlt.Schema("events"), [events_r])
+    extract_id = storage.create_extract_id()
+    schema_update = extract(extract_id, source, storage)
+    # each table got a single write with all its items in order
+    assert [(t, [i["i"] for i in items]) for t, items in written] == [("b", [0, 2, 4, 6]), ("a", [1, 3, 5, 7])]
+    # dynamic hints of all items got merged
+    assert set(schema_update["a"][0]["columns"]) == {"c_1", "c_3"}
+    assert set(schema_update["b"][0]["columns"]) == {"c_0", "c_2"}
+
+
+def test_extract_writer_thread_created_with_background_flush(environment) -> None:
+    @dlt.resource
+    def events():
+        yield [{"i": i} for i in range(10)]
+
+    for background_flush in (False, True):
+        environment["DATA_WRITER__BACKGROUND_FLUSH"] = str(background_flush).lower()
+        storage = ExtractorStorage(NormalizeStorageConfiguration())
+        item_storage = storage.get_storage("puae-jsonl")
+        source = DltSource("events", "module", dlt.Schema("events"), [events()])
+        extract_id = storage.create_extract_id()
+        extract(extract_id, source, storage)
+        # thread is created only when writers flush on background
+        assert (item_storage.writer_thread is not None) is background_flush
+        storage.commit_extract_files(extract_id)
+
+
+def test_compute_table_schemas_per_distinct_hints() -> None:
+    events_r = dlt.resource([], name="events")
+    events_r.apply_hints(table_name=lambda item: item["type"], columns=lambda item: {item["col"]: {"data_type": "text"}})
+    items = [{"type": "b", "col": f"c_{i % 4}", "i": i} for i in range(0, 16, 2)]
+    # one schema per distinct set of resolved hints, in order of appearance
+    schemas = events_r.compute_table_schemas(items)
+    assert [list(s["columns"]) for s in schemas] == [["c_0"], ["c_2"]]
+    assert schemas[0] == events_r.compute_table_schema(items[0])
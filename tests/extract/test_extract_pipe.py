@@ -1,7 +1,7 @@
 import os
 import asyncio
 import inspect
-from typing import List, Sequence
+from typing import Any, List, Sequence
 import time
 
 import pytest
@@ -364,6 +364,268 @@ def test_pipe_transformation_changes_meta() -> None:
     assert [pi.meta for pi in _l] == ["X1", "X2", "X3"]
 
 
+def test_pipe_waits_for_futures() -> None:
+    # poll interval is not used, finished futures are picked up immediately
+    @dlt.defer
+    def deferred_step(item: int):
+        sleep(0.05)
+        return item
+
+    async def async_step(item: int):
+        await asyncio.sleep(0.05)
+        return item
+
+    for step in (deferred_step, async_step):
+        p = Pipe.from_data("data", iter(range(20)))
+        p.append_step(step)  # type: ignore[arg-type]
+        start_ts = time.time()
+        _l = list(PipeIterator.from_pipe(p, max_parallel_items=5, workers=5))
+        assert sorted(pi.item for pi in _l) == list(range(20))
+        assert time.time() - start_ts < 5.0
+
+    # poll interval is not used anymore
+    with pytest.warns(DeprecationWarning):
+        PipeIterator.from_pipe(Pipe.from_data("data", [1]), futures_poll_interval=10.0)
+
+
+def test_async_generator_pipe() -> None:
+    async def pages():
+        for page in range(3):
+            await asyncio.sleep(0.01)
+            yield [page * 10, page * 10 + 1]
+        # items may be yielded with meta
+        yield DataItemWithMeta("M", [99])
+
+    p = Pipe.from_data("pages", pages)
+    _l = list(PipeIterator.from_pipe(p))
+    assert _f_items(_l) == [[0, 1], [10, 11], [20, 21], [99]]
+    assert _l[-1].meta == "M"
+    # async generator instance is iterated once
+    p = Pipe.from_data("pages", pages())
+    assert _f_items(list(PipeIterator.from_pipes([p]))) == [[0, 1], [10, 11], [20, 21], [99]]
+
+    # async generators work as transformers
+    async def details(page: List[int]):
+        for item in page:
+            await asyncio.sleep(0.01)
+            yield item * 2
+
+    p = Pipe.from_data("pages", pages)
+    t = Pipe("details", [details], parent=p)
+    assert sorted(_f_items(list(PipeIterator.from_pipes([p, t], yield_parents=False)))) == [0, 2, 20, 22, 40, 42, 198]
+
+    # exception in async generator
+    async def raise_gen():
+        yield 1
+        raise RuntimeError("we fail")
+
+    with pytest.raises(ResourceExtractionError) as py_ex:
+        list(PipeIterator.from_pipe(Pipe.from_data("raise_gen", raise_gen)))
+    assert isinstance(py_ex.value.__cause__, RuntimeError)
+
+
+@pytest.mark.parametrize("max_concurrency", (1, 3, None))
+def test_pipe_max_concurrency(max_concurrency: int) -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def details(item: int):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        yield item
+
+    async def detail(item: int):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return item
+
+    for step in (details, detail):
+        in_flight = max_in_flight = 0
+        p = Pipe.from_data("data", list(range(12)))
+        t = Pipe("details", [step], parent=p)
+        t.max_concurrency = max_concurrency
+        _l = list(PipeIterator.from_pipes([t], yield_parents=False, max_parallel_items=6))
+        assert sorted(_f_items(_l)) == list(range(12))
+        assert max_in_flight == (max_concurrency or 6)
+
+
+def test_pipe_max_concurrency_keeps_order() -> None:
+    started: List[int] = []
+
+    async def async_data():
+        for item in range(12):
+            yield item
+
+    async def detail(item: int):
+        started.append(item)
+        await asyncio.sleep(0.01)
+        return item
+
+    # items of async generator are resolved from futures and deferred one after another
+    p = Pipe.from_data("data", async_data)
+    p.append_step(detail)  # type: ignore[arg-type]
+    p.max_concurrency = 2
+    _l = list(PipeIterator.from_pipe(p))
+    assert sorted(_f_items(_l)) == list(range(12))
+    # deferred items are started in order
+    assert started == list(range(12))
+
+
+@pytest.mark.parametrize("next_item_mode", ("fifo", "round_robin"))
+def test_parallelized_pipes(next_item_mode: str) -> None:
+    def blocking_gen(name: str):
+        for i in range(5):
+            sleep(0.05)
+            yield f"{name}_{i}"
+        # nested iterators keep their position
+        yield iter([f"{name}_nested"])
+
+    pipes = [Pipe.from_data(f"data_{n}", blocking_gen(f"data_{n}")) for n in range(4)]
+    for p in pipes:
+        p.parallelized = True
+    start_ts = time.time()
+    _l = list(PipeIterator.from_pipes(pipes, workers=4, next_item_mode=next_item_mode))  # type: ignore[arg-type]
+    # four generators were advanced at the same time
+    assert time.time() - start_ts < 0.9
+    for n in range(4):
+        name = f"data_{n}"
+        assert [pi.item for pi in _l if pi.pipe.name == name] == [f"{name}_{i}" for i in range(5)] + [f"{name}_nested"]
+
+
+def test_close_parallelized_pipe() -> None:
+    got_exit = False
+
+    def long_gen():
+        nonlocal got_exit
+        try:
+            for i in range(10000):
+                sleep(0.001)
+                yield i
+        except GeneratorExit:
+            got_exit = True
+
+    def raise_step(item: int):
+        if item == 10:
+            raise RuntimeError("we fail")
+        return item
+
+    p = Pipe.from_data("data", long_gen())
+    p.parallelized = True
+    p.append_step(raise_step)  # type: ignore[arg-type]
+    with pytest.raises(ResourceExtractionError):
+        with ManagedPipeIterator.from_pipe(p) as pipe_iter:
+            list(pipe_iter)
+    assert got_exit is True
+
+
+def test_batched_transformer() -> None:
+    batches: List[Any] = []
+
+    def ids():
+        yield from range(5)
+        yield [5, 6, 7, 8, 9, 10]
+        yield DataItemWithMeta("M", 11)
+        yield DataItemWithMeta("M", [12, 13])
+
+    def details(batch: List[int], meta: Any = None):
+        batches.append((batch, meta))
+        yield [i * 2 for i in batch]
+
+    p = Pipe.from_data("ids", ids)
+    t = Pipe("details", [details], parent=p)
+    t.batch_size = 3
+    _l = list(PipeIterator.from_pipes([t], yield_parents=False))
+    assert [pi.item for pi in _l] == [[0, 2, 4], [6, 8, 10], [12, 14, 16], [18, 20], [22, 24, 26]]
+    # batches are split on meta change, last batch is passed when parent is exhausted
+    assert batches == [([0, 1, 2], None), ([3, 4, 5], None), ([6, 7, 8], None), ([9, 10], None), ([11, 12, 13], "M")]
+
+    # items that do not fit stay in the pending batch and keep their order
+    def long_ids():
+        yield list(range(8))
+        yield 8
+        yield list(range(9, 12))
+
+    batches.clear()
+    p = Pipe.from_data("ids", long_ids)
+    t = Pipe("details", [details], parent=p)
+    t.batch_size = 3
+    _l = list(PipeIterator.from_pipes([t], yield_parents=False))
+    assert [b[0] for b in batches] == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9, 10, 11]]
+    assert [pi.item for pi in _l] == [[0, 2, 4], [6, 8, 10], [12, 14, 16], [18, 20, 22]]
+
+    # incomplete batch is passed on timeout
+    def slow_ids():
+        for i in range(3):
+            yield i
+            sleep(0.1)
+
+    batches.clear()
+    p = Pipe.from_data("ids", slow_ids)
+    t = Pipe("details", [details], parent=p)
+    t.batch_size = 100
+    t.batch_timeout = 0.05
+    assert [pi.item for pi in PipeIterator.from_pipes([t], yield_parents=False)] == [[0], [2], [4]]
+    assert [b[0] for b in batches] == [[0], [1], [2]]
+
+
+@pytest.mark.parametrize("next_item_mode", ("fifo", "round_robin"))
+def test_rate_limited_pipe(next_item_mode: str) -> None:
+    def gen(name: str):
+        for i in range(5):
+            yield f"{name}_{i}"
+
+    throttled = Pipe.from_data("throttled", gen("throttled"))
+    throttled.rate_limit = 20
+    throttled.rate_limit_burst = 2
+    free = Pipe.from_data("free", gen("free"))
+    start_ts = time.time()
+    items = []
+    for pi in PipeIterator.from_pipes([throttled, free], next_item_mode=next_item_mode):  # type: ignore[arg-type]
+        items.append((pi.item, time.time() - start_ts))
+    # throttled pipe does not block the other pipe
+    free_done = max(ts for item, ts in items if item.startswith("free"))
+    assert free_done < 0.05
+    throttled_ts = [ts for item, ts in items if item.startswith("throttled")]
+    assert [item for item, _ in items if item.startswith("throttled")] == [f"throttled_{i}" for i in range(5)]
+    # 2 items in burst, 3 items at 20 items per second
+    assert 0.14 < throttled_ts[-1] < 1.0
+
+
+def test_rate_limited_transformer_keeps_order() -> None:
+    def tx(item: int):
+        yield item
+
+    p = Pipe.from_data("data", list(range(6)))
+    t = Pipe("tx", [tx], parent=p)
+    t.rate_limit = 20
+    # parent items are held back while the transformer is throttled
+    assert _f_items(list(PipeIterator.from_pipes([t], yield_parents=False))) == list(range(6))
+    assert _f_items(list(PipeIterator.from_pipe(t))) == list(range(6))
+
+
+def test_rate_limited_transformer_futures() -> None:
+    async def detail(item: int):
+        return item
+
+    def tx(item: int):
+        return detail(item)
+
+    p = Pipe.from_data("data", list(range(11)))
+    t = Pipe("details", [tx], parent=p)
+    t.rate_limit = 20
+    start_ts = time.time()
+    _l = list(PipeIterator.from_pipes([t], yield_parents=False))
+    assert sorted(pi.item for pi in _l) == list(range(11))
+    # first request in burst, 10 requests at 20 per second
+    assert 0.45 < time.time() - start_ts < 1.5
+
+
 def test_pipe_multiple_iterations() -> None:
     # list based pipe should iterate many times
     p = Pipe.from_data("data", [1, 2, 3])
@@ -1,11 +1,13 @@
 import os
+import asyncio
 from time import sleep
-from typing import Optional, Any
+from typing import Dict, List, Optional, Any
 from datetime import datetime  # noqa: I251
 from itertools import chain
 
 import duckdb
 import pytest
+import pyarrow as pa
 
 import dlt
 from dlt.common.configuration.container import Container
@@ -16,10 +18,12 @@ from dlt.common.pipeline import StateInjectableContext, resource_state
 from dlt.common.schema.schema import Schema
 from dlt.common.utils import uniq_id, digest128, chunks
 from dlt.common.json import json
+from dlt.common.libs.pyarrow import hash_rows
 
 from dlt.extract.source import DltSource
 from dlt.sources.helpers.transform import take_first
 from dlt.extract.incremental import IncrementalCursorPathMissing, IncrementalPrimaryKeyMissing
+from dlt.extract.incremental.transform import unique_hash, unpack_unique_hashes, ARROW_HASH_BIT
 from dlt.pipeline.exceptions import PipelineStepFailed
 
 from tests.extract.utils import AssertItems, data_to_item_format, TItemFormat, ALL_ITEM_FORMATS, data_item_to_list
@@ -451,14 +455,96 @@ def test_descending_order_unique_hashes(item_type: TItemFormat) -> None:
 
     s = p.state["sources"][p.default_schema_name]['resources']['some_data']['incremental']['created_at']
 
-    last_hash = digest128(json.dumps({'created_at': 24}))
+    if item_type == "json":
+        last_hash = unique_hash(json.dumps({'created_at': 24}))
+    else:
+        last_hash = hash_rows(pa.table({"created_at": [24]}), ["created_at"])[0].as_py() | ARROW_HASH_BIT
 
-    assert s['unique_hashes'] == [last_hash]
+    assert unpack_unique_hashes(s['unique_hashes']) == [last_hash]
 
     # make sure nothing is returned on a next run, source will use state from the active pipeline
     assert list(some_data()) == []
 
 
+@pytest.mark.parametrize("item_type", ALL_ITEM_FORMATS)
+def test_unique_hashes_same_cursor_value(item_type: TItemFormat) -> None:
+    """Many rows share the cursor value and arrive in several batches, duplicates in later batches and runs are skipped"""
+    data = [{"id": i, "created_at": 1} for i in range(1000)]
+
+    @dlt.resource(primary_key="id")
+    def some_data(created_at=dlt.sources.incremental("created_at")):
+        for chunk in chunks(data, 100):
+            yield data_to_item_format(item_type, chunk)
+        # repeat a batch within the same run
+        yield data_to_item_format(item_type, data[:100])
+
+    def _count_rows(items) -> int:
+        return sum(1 if isinstance(item, dict) else len(item) for item in items)
+
+    p = dlt.pipeline(pipeline_name=uniq_id(), destination="duckdb")
+    p.extract(some_data())
+    assert p.normalize().row_counts["some_data"] == 1000
+    s = p.state["sources"][p.default_schema_name]['resources']['some_data']['incremental']['created_at']
+    # all hashes are kept without duplicates in a few packed chunks
+    hashes = unpack_unique_hashes(s["unique_hashes"])
+    assert len(hashes) == len(set(hashes)) == 1000
+    assert all(isinstance(chunk, bytes) for chunk in s["unique_hashes"])
+    assert len(s["unique_hashes"]) <= 10
+    # nothing is returned on a next run, source will use state from the active pipeline
+    assert _count_rows(some_data()) == 0
+
+
+def test_arrow_unique_hashes_match_json() -> None:
+    """Hashes of whole arrow rows are compatible with hashes of json rows stored in the state"""
+    data = [{"id": i, "created_at": 1 if i < 5 else 2, "value": f"v{i}"} for i in range(10)]
+    item_type: TItemFormat = "json"
+
+    @dlt.resource
+    def some_data(created_at=dlt.sources.incremental("created_at")):
+        yield data_to_item_format(item_type, data)
+
+    p = dlt.pipeline(pipeline_name=uniq_id())
+    p.extract(some_data())
+    json_hashes = p.state["sources"][p.default_schema_name]['resources']['some_data']['incremental']['created_at']["unique_hashes"]
+    assert len(unpack_unique_hashes(json_hashes)) == 5
+    # rows with the last value were already processed as json
+    item_type = "arrow"
+    assert list(some_data()) == []
+    # new row with the last value is added
+    data.append({"id": 10, "created_at": 2, "value": "v10"})
+    assert [tbl.num_rows for tbl in some_data()] == [1]
+
+
+@pytest.mark.parametrize("item_type", ALL_ITEM_FORMATS)
+def test_migrate_unique_hashes_list(item_type: TItemFormat) -> None:
+    """List of digests stored by former versions is converted into packed hashes and still deduplicates rows"""
+    data = [{"id": i, "created_at": 1} for i in range(10)]
+    # json items hash the primary key value, arrow items the row with primary key columns
+    keys = [json.dumps(row["id"] if item_type == "json" else {"id": row["id"]}) for row in data]
+
+    @dlt.resource(primary_key="id")
+    def some_data(created_at=dlt.sources.incremental("created_at")):
+        yield data_to_item_format(item_type, data)
+
+    with Container().injectable_context(StateInjectableContext(state={})):
+        r = some_data()
+        r.state["incremental"] = {"created_at": {
+            "initial_value": None,
+            "last_value": 1,
+            "unique_hashes": [digest128(key) for key in keys[:5]]
+        }}
+        assert data_item_to_list(item_type, list(r)) == data[5:]
+        s = r.state["incremental"]["created_at"]
+    assert all(isinstance(chunk, bytes) for chunk in s["unique_hashes"])
+    hashes = unpack_unique_hashes(s["unique_hashes"])
+    assert hashes[:5] == [unique_hash(key) for key in keys[:5]]
+    if item_type == "json":
+        assert hashes[5:] == [unique_hash(key) for key in keys[5:]]
+    else:
+        # new arrow rows are hashed over columns
+        assert len(hashes) == 10 and all(h & ARROW_HASH_BIT for h in hashes[5:])
+
+
 @pytest.mark.parametrize("item_type", ALL_ITEM_FORMATS)
 def test_unique_keys_json_identifiers(item_type: TItemFormat) -> None:
     """Uses primary key name that is matching the name of the JSON element in the original namespace but gets converted into destination namespace"""
@@ -923,6 +1009,85 @@ def test_end_value_with_batches(item_type: TItemFormat) -> None:
     assert items == list(range(1, 14))
 
 
+@pytest.mark.parametrize("item_type", ALL_ITEM_FORMATS)
+@pytest.mark.parametrize("row_order", ["asc", "desc", None])
+def test_row_order_closes_generator(item_type: TItemFormat, row_order: str) -> None:
+    """Pages are requested only until rows get out of range when row order is declared"""
+    requested_pages = []
+
+    @dlt.resource
+    def paged_sequence(
+            updated_at: dlt.sources.incremental[int] = dlt.sources.incremental('updated_at')
+    ) -> Any:
+        pages = range(0, 10) if row_order != "desc" else reversed(range(0, 10))
+        for page in pages:
+            requested_pages.append(page)
+            data = [{'updated_at': i} for i in range(page * 10, page * 10 + 10)]
+            if row_order == "desc":
+                data.reverse()
+            yield data_to_item_format(item_type, data)
+
+    if row_order == "desc":
+        # descending rows get below the start value
+        incremental = dlt.sources.incremental(initial_value=30, row_order=row_order)
+    else:
+        incremental = dlt.sources.incremental(initial_value=0, end_value=35, row_order=row_order)
+    rows = list(paged_sequence(updated_at=incremental))
+    rows_count = sum(1 if isinstance(row, dict) else len(row) for row in rows)
+    if row_order == "desc":
+        assert rows_count == 70
+        # page 2 contains rows below the start value, next pages are not requested
+        assert requested_pages == [9, 8, 7, 6, 5, 4, 3, 2]
+    elif row_order == "asc":
+        assert rows_count == 35
+        # page 3 contains rows above the end value, next pages are not requested
+        assert requested_pages == [0, 1, 2, 3]
+    else:
+        assert rows_count == 35
+        assert requested_pages == list(range(0, 10))
+
+
+@pytest.mark.parametrize("gen_type", ["async", "parallelized"])
+def test_row_order_closes_background_generator(gen_type: str) -> None:
+    """Async and parallelized generators are closed when the pending item is resolved"""
+    requested_pages = []
+    closed = []
+
+    def _page(page: int) -> List[Dict[str, int]]:
+        requested_pages.append(page)
+        return [{'updated_at': i} for i in range(page * 10, page * 10 + 10)]
+
+    if gen_type == "async":
+        @dlt.resource
+        async def paged_sequence(
+                updated_at: dlt.sources.incremental[int] = dlt.sources.incremental('updated_at')
+        ) -> Any:
+            try:
+                for page in range(0, 10):
+                    await asyncio.sleep(0.01)
+                    yield _page(page)
+            finally:
+                closed.append(True)
+    else:
+        @dlt.resource(parallelized=True)
+        def paged_sequence(  # type: ignore[misc]
+                updated_at: dlt.sources.incremental[int] = dlt.sources.incremental('updated_at')
+        ) -> Any:
+            try:
+                for page in range(0, 10):
+                    sleep(0.01)
+                    yield _page(page)
+            finally:
+                closed.append(True)
+
+    incremental = dlt.sources.incremental(initial_value=0, end_value=35, row_order="asc")
+    rows = list(paged_sequence(updated_at=incremental))
+    assert sum(1 if isinstance(row, dict) else len(row) for row in rows) == 35
+    # the next page is requested before page 3 gets processed, no more pages are requested after that
+    assert requested_pages == [0, 1, 2, 3, 4]
+    assert closed == [True]
+
+
 @pytest.mark.parametrize("item_type", ALL_ITEM_FORMATS)
 def test_load_with_end_value_does_not_write_state(item_type: TItemFormat) -> None:
     """When loading chunk with initial/end value range. The resource state is untouched.
@@ -12,8 +12,8 @@ from dlt.common import json, pendulum
 from dlt.common.configuration.container import Container
 from dlt.common.pipeline import StateInjectableContext
 from dlt.common.typing import AnyFun, StrAny
-from dlt.common.utils import digest128
 from dlt.extract.source import DltResource
+from dlt.extract.incremental.transform import unique_hash, unpack_unique_hashes
 from dlt.sources.helpers.transform import skip_first, take_first
 
 from tests.pipeline.utils import assert_load_info
@@ -302,13 +302,13 @@ def test_merge_with_dispatch_and_incremental(destination_config: DestinationTest
         assert len(list(_get_shuffled_events(True) | github_resource)) == 100
         incremental_state = github_resource.state
         assert incremental_state["incremental"]["created_at"]["last_value"] == newest_issue["created_at"]
-        assert incremental_state["incremental"]["created_at"]["unique_hashes"] == [digest128(f'"{newest_issue["id"]}"')]
+        assert unpack_unique_hashes(incremental_state["incremental"]["created_at"]["unique_hashes"]) == [unique_hash(f'"{newest_issue["id"]}"')]
         # subsequent load will skip all elements
         assert len(list(_get_shuffled_events(True) | github_resource)) == 0
         # add one more issue
         assert len(list(_new_event("new_node") | github_resource)) == 1
         assert incremental_state["incremental"]["created_at"]["last_value"] > newest_issue["created_at"]
-        assert incremental_state["incremental"]["created_at"]["unique_hashes"] != [digest128(str(newest_issue["id"]))]
+        assert unpack_unique_hashes(incremental_state["incremental"]["created_at"]["unique_hashes"]) != [unique_hash(str(newest_issue["id"]))]
 
     # load to destination
     p = destination_config.setup_pipeline("github_3", full_refresh=True)
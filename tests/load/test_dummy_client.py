@@ -1,12 +1,12 @@
 import shutil
 import os
 from multiprocessing.pool import ThreadPool
-from time import sleep
-from typing import List, Sequence, Tuple
+from time import sleep, time
+from typing import Any, List, Sequence, Tuple
 import pytest
 from unittest.mock import patch
 
-from dlt.common.exceptions import TerminalException, TerminalValueError
+from dlt.common.exceptions import SignalReceivedException, TerminalException, TerminalValueError
 from dlt.common.schema import Schema
 from dlt.common.storages import FileStorage, LoadStorage
 from dlt.common.storages.load_storage import JobWithUnsupportedWriterException
@@ -385,6 +385,73 @@ def test_load_single_thread() -> None:
     assert not load.load_storage.storage.has_folder(load.load_storage.get_package_path(load_id))
 
 
+def test_load_refills_worker_slots() -> None:
+    # with a single worker all jobs must be loaded in a single run, new job is started as soon as previous completes
+    os.environ["LOAD__WORKERS"] = "1"
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    load_id, _ = prepare_load_package(
+        load.load_storage,
+        NORMALIZED_FILES
+    )
+    load.run(None)
+    assert len(load.load_storage.list_new_jobs(load_id)) == 0
+    assert len(load.load_storage.list_started_jobs(load_id)) == 0
+    completed_path = os.path.join(load.load_storage.get_package_path(load_id), LoadStorage.COMPLETED_JOBS_FOLDER)
+    assert len(load.load_storage.storage.list_folder_files(completed_path)) == 2
+
+
+def test_load_wakes_up_on_started_jobs() -> None:
+    # jobs started in the background are collected as soon as they get started, not after the poll interval
+    os.environ["LOAD__WORKERS"] = "1"
+    os.environ["LOAD__MIN_JOB_POLL_INTERVAL"] = "30"
+    os.environ["LOAD__MAX_JOB_POLL_INTERVAL"] = "30"
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    load_id, _ = prepare_load_package(
+        load.load_storage,
+        NORMALIZED_FILES
+    )
+
+    class SlowResultPool(ThreadPool):
+        def apply_async(self, func, args=(), kwds={}, callback=None, error_callback=None):  # type: ignore[no-untyped-def]
+            # result gets ready some time after the callback is called
+            def _callback(result: Any) -> None:
+                callback(result)
+                sleep(0.5)
+            return super().apply_async(func, args, kwds, _callback, error_callback)
+
+    started_at = time()
+    with SlowResultPool() as pool:
+        load.run(pool)
+    assert time() - started_at < 10
+    completed_path = os.path.join(load.load_storage.get_package_path(load_id), LoadStorage.COMPLETED_JOBS_FOLDER)
+    assert len(load.load_storage.storage.list_folder_files(completed_path)) == 2
+
+
+def test_load_waits_for_starting_jobs_on_exception() -> None:
+    # jobs started in the background must not be left behind when the load loop raises
+    os.environ["LOAD__WORKERS"] = "1"
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    load_id, _ = prepare_load_package(
+        load.load_storage,
+        NORMALIZED_FILES
+    )
+
+    class SlowStartPool(ThreadPool):
+        def apply_async(self, func, args=(), kwds={}, callback=None, error_callback=None):  # type: ignore[no-untyped-def]
+            def _slow_func(*f_args: Any) -> Any:
+                sleep(0.5)
+                return func(*f_args)
+            return super().apply_async(_slow_func, args, kwds, callback, error_callback)
+
+    with SlowStartPool() as pool:
+        with patch("dlt.load.load.raise_if_signalled", side_effect=SignalReceivedException(2)):
+            with pytest.raises(SignalReceivedException):
+                load.run(pool)
+        # job started in the background got started before the run returned
+        assert len(load.load_storage.list_new_jobs(load_id)) == 0
+        assert len(load.load_storage.list_started_jobs(load_id)) == 1
+
+
 def test_wrong_writer_type() -> None:
     load = setup_loader()
     load_id, _ = prepare_load_package(
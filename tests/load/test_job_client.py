@@ -330,6 +330,29 @@ def test_get_storage_table_with_all_types(client: SqlJobClientBase) -> None:
         assert c["data_type"] == expected_c["data_type"]
 
 
+@pytest.mark.parametrize("client", destinations_configs(default_sql_configs=True), indirect=True, ids=lambda x: x.name)
+def test_get_storage_tables(client: SqlJobClientBase) -> None:
+    schema = client.schema
+    table_names = ["event_test_table" + uniq_id(), "event_other_table" + uniq_id()]
+    schema.update_table(new_table(table_names[0], columns=TABLE_UPDATE[:2]))
+    schema.update_table(new_table(table_names[1], columns=TABLE_UPDATE[2:5]))
+    schema.bump_version()
+    client.update_stored_schema()
+    requested_names = [table_names[1], "event_missing_table", table_names[0]]
+    # all tables are introspected with a single query
+    with patch.object(client.sql_client, "execute_sql", wraps=client.sql_client.execute_sql) as execute_sql:
+        storage_tables = list(client.get_storage_tables(requested_names))
+    assert execute_sql.call_count == 1
+    # tables are returned in requested order, tables that do not exist have no columns
+    assert [name for name, _ in storage_tables] == requested_names
+    assert list(storage_tables[0][1].keys()) == [c["name"] for c in TABLE_UPDATE[2:5]]
+    assert storage_tables[1][1] == {}
+    assert list(storage_tables[2][1].keys()) == [c["name"] for c in TABLE_UPDATE[:2]]
+    # single table introspection gives the same result
+    assert client.get_storage_table(table_names[0]) == (True, storage_tables[2][1])
+    assert client.get_storage_table("event_missing_table") == (False, {})
+
+
 @pytest.mark.parametrize("client", destinations_configs(default_sql_configs=True), indirect=True, ids=lambda x: x.name)
 def test_preserve_column_order(client: SqlJobClientBase) -> None:
     schema = client.schema
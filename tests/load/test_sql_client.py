@@ -1,6 +1,8 @@
 import pytest
+import sqlite3
 import datetime  # noqa: I251
-from typing import Iterator, Any
+from contextlib import contextmanager
+from typing import Iterator, Any, AnyStr, ClassVar, List
 from threading import Thread, Event
 from time import sleep
 
@@ -11,7 +13,7 @@ from dlt.common.storages import FileStorage
 from dlt.common.utils import derives_from_class_of_name, uniq_id
 from dlt.destinations.exceptions import DatabaseException, DatabaseTerminalException, DatabaseTransientException, DatabaseUndefinedRelation
 
-from dlt.destinations.sql_client import DBApiCursor, SqlClientBase
+from dlt.destinations.sql_client import DBApiCursor, SqlClientBase, SqlConnectionPool
 from dlt.destinations.job_client_impl import SqlJobClientBase
 from dlt.destinations.typing import TNativeConn
 from dlt.common.time import ensure_pendulum_datetime
@@ -452,6 +454,181 @@ def test_recover_on_explicit_tx(client: SqlJobClientBase) -> None:
     assert_load_id(client.sql_client, "HJK")
 
 
+class SqliteSqlClient(SqlClientBase[sqlite3.Connection]):
+    """Minimal sql client used to test connection pooling"""
+    dbapi: ClassVar[Any] = sqlite3
+    supports_connection_pooling: ClassVar[bool] = True
+    opened: ClassVar[List[sqlite3.Connection]] = []
+
+    def __init__(self, dataset_name: str) -> None:
+        super().__init__(None, dataset_name)
+        self._conn: sqlite3.Connection = None
+
+    def open_connection(self) -> sqlite3.Connection:
+        self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self.opened.append(self._conn)
+        # emulates a session setting made for the dataset
+        self._conn.execute("CREATE TEMP TABLE search_path (name TEXT)")
+        self._conn.execute("INSERT INTO search_path VALUES (?)", (self.dataset_name,))
+        return self._conn
+
+    def _prepare_borrowed_connection(self) -> None:
+        self._conn.execute("UPDATE search_path SET name = ?", (self.dataset_name,))
+
+    @property
+    def search_path(self) -> str:
+        return self._conn.execute("SELECT name FROM search_path").fetchone()[0]  # type: ignore[no-any-return]
+
+    def close_connection(self) -> None:
+        if self._conn:
+            self._conn.close()
+            self._conn = None
+
+    @contextmanager
+    def begin_transaction(self) -> Iterator[Any]:
+        yield self
+
+    @property
+    def native_connection(self) -> sqlite3.Connection:
+        return self._conn
+
+    def execute_sql(self, sql: AnyStr, *args: Any, **kwargs: Any) -> Any:
+        return self._conn.execute(sql, args).fetchall()
+
+    @contextmanager
+    def execute_query(self, query: AnyStr, *args: Any, **kwargs: Any) -> Iterator[Any]:
+        yield self._conn.execute(query, args)
+
+    def fully_qualified_dataset_name(self, escape: bool = True) -> str:
+        return self.dataset_name
+
+    @staticmethod
+    def _make_database_exception(ex: Exception) -> Exception:
+        return ex
+
+
+def test_connection_pool_reuse() -> None:
+    SqliteSqlClient.opened = []
+    pool = SqlConnectionPool()
+    client = SqliteSqlClient("dataset")
+    client.connection_pool = pool
+    with client:
+        conn = client.native_connection
+        client.execute_sql("SELECT 1")
+    # connection kept in the pool
+    assert client.native_connection is None
+    assert pool.idle_count == 1
+    with SqliteSqlClient("dataset") as other_client:
+        # no pool set on a client
+        assert other_client.native_connection is not conn
+    other_client = SqliteSqlClient("dataset")
+    other_client.connection_pool = pool
+    with other_client:
+        assert other_client.native_connection is conn
+        # nested client in the same thread opens a new connection
+        with client:
+            assert client.native_connection is not conn
+    assert pool.idle_count == 2
+    # other dataset reuses the connection with settings for its dataset
+    client = SqliteSqlClient("other_dataset")
+    client.connection_pool = pool
+    with client:
+        assert client.native_connection in SqliteSqlClient.opened
+        assert client.search_path == "other_dataset"
+
+    # other thread gets own connection
+    thread_conns: List[sqlite3.Connection] = []
+
+    def _borrow() -> None:
+        t_client = SqliteSqlClient("dataset")
+        t_client.connection_pool = pool
+        with t_client:
+            thread_conns.append(t_client.native_connection)
+
+    t = Thread(target=_borrow)
+    t.start()
+    t.join()
+    assert thread_conns[0] is not conn
+    assert len(SqliteSqlClient.opened) == 4
+
+    # all connections closed with the pool
+    pool.close()
+    assert pool.idle_count == 0
+    for c in SqliteSqlClient.opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            c.execute("SELECT 1")
+    # connections released to closed pool are closed
+    with client:
+        conn = client.native_connection
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+
+
+def test_connection_pool_prepares_borrowed_connection() -> None:
+    SqliteSqlClient.opened = []
+    pool = SqlConnectionPool()
+    client = SqliteSqlClient("dataset")
+    client.connection_pool = pool
+    staging_client = SqliteSqlClient("dataset_staging")
+    staging_client.connection_pool = pool
+    # clients of two datasets share the pool key
+    assert client._connection_pool_key() == staging_client._connection_pool_key()
+    with client:
+        conn = client.native_connection
+        assert client.search_path == "dataset"
+    with staging_client:
+        assert staging_client.native_connection is conn
+        assert staging_client.search_path == "dataset_staging"
+    with client:
+        assert client.native_connection is conn
+        assert client.search_path == "dataset"
+    assert len(SqliteSqlClient.opened) == 1
+
+    # connection that cannot be prepared is closed and a new one is opened
+    def _fail_prepare() -> None:
+        raise sqlite3.OperationalError("connection lost")
+
+    client._prepare_borrowed_connection = _fail_prepare  # type: ignore[method-assign]
+    with client:
+        assert client.native_connection is not conn
+        assert client.search_path == "dataset"
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+    pool.close()
+
+
+def test_connection_pool_discard_and_expire() -> None:
+    SqliteSqlClient.opened = []
+    pool = SqlConnectionPool(idle_timeout=300.0, health_check_interval=0.0)
+    client = SqliteSqlClient("dataset")
+    client.connection_pool = pool
+    # connection is closed on exception
+    with pytest.raises(ValueError):
+        with client:
+            raise ValueError()
+    assert pool.idle_count == 0
+    with pytest.raises(sqlite3.ProgrammingError):
+        SqliteSqlClient.opened[0].execute("SELECT 1")
+    # unhealthy connection is not reused
+    with client:
+        conn = client.native_connection
+    conn.close()
+    with client:
+        assert client.native_connection is not conn
+        conn = client.native_connection
+    # healthy connection is reused
+    with client:
+        assert client.native_connection is conn
+    # idle connections are closed
+    pool.idle_timeout = 0.0
+    sleep(0.01)
+    with client:
+        assert client.native_connection is not conn
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+    pool.close()
+
+
 def assert_load_id(sql_client: SqlClientBase[TNativeConn], load_id: str) -> None:
     # and data is actually committed when connection reopened
     sql_client.close_connection()
@@ -1,23 +1,29 @@
+import os
 import pytest
 from fnmatch import fnmatch
 from typing import Dict, Iterator, List, Sequence, Tuple
+from unittest.mock import patch
 from multiprocessing import get_start_method, Pool
 from multiprocessing.dummy import Pool as ThreadPool
 
 from dlt.common import json
 from dlt.common.schema.schema import Schema
-from dlt.common.utils import uniq_id
+from dlt.common.utils import chunks, uniq_id
 from dlt.common.typing import StrAny
 from dlt.common.data_types import TDataType
-from dlt.common.storages import NormalizeStorage, LoadStorage
-from dlt.common.destination import DestinationCapabilitiesContext
+from dlt.common.exceptions import SignalReceivedException
+from dlt.common.storages import NormalizeStorage, LoadStorage, TExtractedItemsRange
+from dlt.common.destination import DestinationCapabilitiesContext, TLoaderFileFormat
 from dlt.common.configuration.container import Container
+from dlt.common.runtime.collector import DictCollector
 
 from dlt.extract.extract import ExtractorStorage
 from dlt.normalize import Normalize
+from dlt.normalize.normalize import TMapFuncRV
+from dlt.normalize.items_normalizers import ParquetItemsNormalizer
 
 from tests.cases import JSON_TYPED_DICT, JSON_TYPED_DICT_TYPES
-from tests.utils import TEST_DICT_CONFIG_PROVIDER, assert_no_dict_key_starts_with, clean_test_storage, init_test_logging
+from tests.utils import TEST_DICT_CONFIG_PROVIDER, assert_no_dict_key_starts_with, clean_test_storage, init_test_logging, preserve_environ
 from tests.normalize.utils import json_case_path, INSERT_CAPS, JSONL_CAPS, DEFAULT_CAPS, ALL_CAPABILITIES
 
 
@@ -53,10 +59,16 @@ def rasa_normalize() -> Iterator[Normalize]:
     yield from init_normalize("tests/normalize/cases/schemas")
 
 
-def init_normalize(default_schemas_path: str = None) -> Iterator[Normalize]:
+@pytest.fixture
+def arrow_normalize() -> Iterator[Normalize]:
+    # normalizes jsonl items in column batches per table
+    yield from init_normalize(jsonl_items_normalizer="arrow")
+
+
+def init_normalize(default_schemas_path: str = None, jsonl_items_normalizer: str = "row") -> Iterator[Normalize]:
     clean_test_storage()
     # pass schema config fields to schema storage via dict config provider
-    with TEST_DICT_CONFIG_PROVIDER().values({"import_schema_path": default_schemas_path, "external_schema_format": "json"}):
+    with TEST_DICT_CONFIG_PROVIDER().values({"import_schema_path": default_schemas_path, "external_schema_format": "json", "jsonl_items_normalizer": jsonl_items_normalizer}):
         # inject the destination capabilities
         n = Normalize()
         yield n
@@ -215,6 +227,124 @@ def test_multiprocess_row_counting(caps: DestinationCapabilitiesContext, raw_nor
     assert raw_normalize._row_counts["events__payload__pull_request__requested_reviewers"] == 24
 
 
+@pytest.mark.parametrize("caps", ALL_CAPABILITIES, indirect=True)
+def test_multiprocess_file_ranges(caps: DestinationCapabilitiesContext, raw_normalize: Normalize) -> None:
+    # extract uncompressed file with many lines
+    os.environ["DATA_WRITER__DISABLE_COMPRESSION"] = "true"
+    os.environ["DATA_WRITER__BUFFER_MAX_ITEMS"] = "10"
+    with open(json_case_path("github.events.load_page_1_duck"), "rb") as f:
+        items = json.load(f)
+    extractor = ExtractorStorage(raw_normalize.normalize_storage.config)
+    extract_id = extractor.create_extract_id()
+    for chunk in chunks(items, 10):
+        extractor.write_data_item("puae-jsonl", extract_id, "github", "events", chunk, None)
+    extractor.close_writers(extract_id)
+    extractor.commit_extract_files(extract_id)
+    files = raw_normalize.normalize_storage.list_files_to_normalize_sorted()
+    assert len(files) == 1
+    raw_normalize.config.max_file_range_bytes = 4096
+    assert len(raw_normalize.normalize_storage.split_extracted_file(files[0], 4096)) > 4
+    with Pool(processes=4) as p:
+        raw_normalize.run(p)
+
+    assert raw_normalize._row_counts["events"] == 100
+    assert raw_normalize._row_counts["events__payload__pull_request__requested_reviewers"] == 24
+    assert raw_normalize.normalize_storage.list_files_to_normalize_sorted() == []
+
+
+@pytest.mark.parametrize("caps", ALL_CAPABILITIES, indirect=True)
+def test_multiprocess_rotated_compressed_files(caps: DestinationCapabilitiesContext, raw_normalize: Normalize) -> None:
+    # compressed files cannot be split so large resources are rotated at extract
+    os.environ["DATA_WRITER__BUFFER_MAX_ITEMS"] = "10"
+    with open(json_case_path("github.events.load_page_1_duck"), "rb") as f:
+        items = json.load(f)
+    extractor = ExtractorStorage(raw_normalize.normalize_storage.config, file_max_bytes=4096)
+    extract_id = extractor.create_extract_id()
+    for chunk in chunks(items, 10):
+        extractor.write_data_item("puae-jsonl", extract_id, "github", "events", chunk, None)
+    extractor.close_writers(extract_id)
+    extractor.commit_extract_files(extract_id)
+    files = raw_normalize.normalize_storage.list_files_to_normalize_sorted()
+    assert len(files) > 4
+    assert all(len(raw_normalize.normalize_storage.split_extracted_file(file, 4096)) == 1 for file in files)
+    with Pool(processes=4) as p:
+        raw_normalize.run(p)
+
+    assert raw_normalize._row_counts["events"] == 100
+    assert raw_normalize._row_counts["events__payload__pull_request__requested_reviewers"] == 24
+    assert raw_normalize.normalize_storage.list_files_to_normalize_sorted() == []
+
+
+@pytest.mark.parametrize("caps", ALL_CAPABILITIES, indirect=True)
+def test_multiprocess_schema_conflict(caps: DestinationCapabilitiesContext, raw_normalize: Normalize) -> None:
+    # two workers infer different data types for the same new column
+    extract_items(raw_normalize.normalize_storage, [{"id": 1, "value": 1, "children": [{"value": 1}]}], "conflict", "doc")
+    extract_items(raw_normalize.normalize_storage, [{"id": 2, "value": "text", "children": [{"value": 2}]}], "conflict", "doc")
+    with Pool(processes=2) as p:
+        raw_normalize.run(p)
+
+    assert raw_normalize._row_counts == {"doc": 2, "doc__children": 2}
+    schema = raw_normalize.load_or_create_schema(raw_normalize.schema_storage, "conflict")
+    # the worker that lost got its doc table normalized again: text value needs a variant column, int value is coerced to text
+    doc_columns = schema.get_table_columns("doc")
+    if doc_columns["value"]["data_type"] == "bigint":
+        assert "value__v_text" in doc_columns
+    else:
+        assert doc_columns["value"]["data_type"] == "text"
+    load_id = raw_normalize.load_storage.list_packages()[0]
+    _, table_files = expect_load_package(raw_normalize.load_storage, load_id, ["doc", "doc__children"])
+    # child table of the worker that lost was written again together with its parent
+    assert len(table_files["doc__children"]) == 2
+    _, lines = get_line_from_file(raw_normalize.load_storage, table_files["doc"])
+    assert lines in (2, 6)
+    # all child rows link to the parent rows
+    doc_ids = {row["_dlt_id"] for row in read_load_rows(raw_normalize.load_storage, table_files["doc"])}
+    child_rows = read_load_rows(raw_normalize.load_storage, table_files["doc__children"])
+    assert len(child_rows) == 2
+    for row in child_rows:
+        assert row["_dlt_parent_id"] in doc_ids
+
+
+def test_parquet_items_normalizer_table_names(raw_normalize: Normalize) -> None:
+    import pyarrow as pa
+
+    extractor = ExtractorStorage(raw_normalize.normalize_storage.config)
+    extract_id = extractor.create_extract_id()
+    extractor.write_data_item("arrow", extract_id, "parquet_schema", "items", pa.Table.from_pylist([{"id": 1}, {"id": 2}]), None)
+    extractor.close_writers(extract_id)
+    extractor.commit_extract_files(extract_id)
+    extracted_file, = raw_normalize.normalize_storage.list_files_to_normalize_sorted()
+    load_id = uniq_id()
+    raw_normalize.load_storage.create_temp_load_package(load_id)
+    args = (extracted_file, raw_normalize.load_storage, raw_normalize.normalize_storage, Schema("parquet_schema"), load_id, "items")
+    jobs_folder = os.path.join(load_id, LoadStorage.NEW_JOBS_FOLDER)
+    # parquet file of a table that is not normalized again is skipped
+    assert ParquetItemsNormalizer()(*args, table_names={"other_items"}) == ([], 0, {})
+    assert raw_normalize.load_storage.storage.list_folder_files(jobs_folder) == []
+    assert ParquetItemsNormalizer()(*args, table_names={"items"}) == ([], 2, {"items": 2})
+    assert len(raw_normalize.load_storage.storage.list_folder_files(jobs_folder)) == 1
+
+
+def test_multiprocess_task_metrics(raw_normalize: Normalize) -> None:
+    task_messages: List[str] = []
+
+    class TaskCollector(DictCollector):
+        def update(self, name: str, inc: int = 1, total: int = None, message: str = None, label: str = None) -> None:
+            super().update(name, inc, total, message, label)
+            if name == "Tasks":
+                task_messages.append(message)
+
+    raw_normalize.collector = TaskCollector()
+    extract_cases(raw_normalize.normalize_storage, ["github.events.load_page_1_duck", "github.issues.load_page_5_duck"])
+    with Pool(processes=2) as p:
+        raw_normalize.run(p)
+    # each worker reports its timing as soon as it completes
+    assert len(task_messages) == 2
+    for message in task_messages:
+        assert "queued" in message
+        assert "items/s" in message
+
+
 @pytest.mark.parametrize("caps", ALL_CAPABILITIES, indirect=True)
 def test_normalize_many_schemas(caps: DestinationCapabilitiesContext, rasa_normalize: Normalize) -> None:
     extract_cases(
@@ -258,6 +388,26 @@ def test_normalize_typed_json(caps: DestinationCapabilitiesContext, raw_normaliz
         assert table[k]["data_type"] == v
 
 
+@pytest.mark.parametrize("caps", ALL_CAPABILITIES, indirect=True)
+def test_normalize_typed_pickle(caps: DestinationCapabilitiesContext, raw_normalize: Normalize) -> None:
+    # python types are passed to normalize without json encoding
+    doc = dict(JSON_TYPED_DICT, tuple_list=("a", "b"))
+    extract_items(raw_normalize.normalize_storage, [doc], "special", "special", "pickle")
+    files = raw_normalize.normalize_storage.list_files_to_normalize_sorted()
+    assert len(files) == 1
+    assert files[0].endswith(".pickle")
+    with ThreadPool(processes=1) as pool:
+        raw_normalize.run(pool)
+    assert raw_normalize._row_counts == {"special": 1, "special__tuple_list": 2}
+    loads = raw_normalize.load_storage.list_packages()
+    schema = raw_normalize.load_storage.load_package_schema(loads[0])
+    table = schema.get_table_columns("special", include_incomplete=True)
+    for k, v in JSON_TYPED_DICT_TYPES.items():
+        assert table[k]["data_type"] == v
+    # tuples create child tables like lists
+    assert schema.get_table_columns("special__tuple_list")["value"]["data_type"] == "text"
+
+
 @pytest.mark.parametrize("caps", ALL_CAPABILITIES, indirect=True)
 def test_schema_changes(caps: DestinationCapabilitiesContext, raw_normalize: Normalize) -> None:
     doc = {"str": "text", "int": 1}
@@ -331,22 +481,149 @@ def test_normalize_twice_with_flatten(caps: DestinationCapabilitiesContext, raw_
     assert_schema(schema)
 
 
-def test_group_worker_files() -> None:
+@pytest.mark.parametrize("caps", ALL_CAPABILITIES, indirect=True)
+def test_normalize_arrow_items(caps: DestinationCapabilitiesContext, arrow_normalize: Normalize) -> None:
+    assert arrow_normalize.config.jsonl_items_normalizer == "arrow"
+    # jsonl and insert_values files are always normalized row by row, results must match the row normalizer
+    for _ in range(2):
+        load_id = extract_and_normalize_cases(arrow_normalize, ["github.issues.load_page_5_duck"])
+        _, table_files = expect_load_package(arrow_normalize.load_storage, load_id, ["issues", "issues__labels", "issues__assignees"], full_schema_update=False)
+        assert len(table_files["issues"]) == 1
+        _, lines = get_line_from_file(arrow_normalize.load_storage, table_files["issues"], 0)
+        # insert writer adds 2 lines
+        assert lines in (100, 102)
+    schema = arrow_normalize.load_or_create_schema(arrow_normalize.schema_storage, "github")
+    assert "reactions___1" in schema.tables["issues"]["columns"]
+
+    # int values fit into double column
+    doc = {"str": "text", "int": 1, "double": 1.5}
+    extract_items(arrow_normalize.normalize_storage, [doc], "evolution", "doc")
+    normalize_pending(arrow_normalize, "evolution")
+    extract_items(arrow_normalize.normalize_storage, [{"str": "text_2", "double": 2}, doc], "evolution", "doc")
+    load_id = normalize_pending(arrow_normalize, "evolution")
+    _, table_files = expect_load_package(arrow_normalize.load_storage, load_id, ["doc"], full_schema_update=False)
+    assert arrow_normalize.load_storage.begin_schema_update(load_id) == {}
+    _, lines = get_line_from_file(arrow_normalize.load_storage, table_files["doc"], 0)
+    assert lines in (2, 4)
+    # variant requires schema change and is normalized row by row
+    extract_items(arrow_normalize.normalize_storage, [doc, {"int": "hundred"}], "evolution", "doc")
+    load_id = normalize_pending(arrow_normalize, "evolution")
+    schema_update = arrow_normalize.load_storage.begin_schema_update(load_id)
+    assert "int__v_text" in schema_update["doc"]["columns"]
+    s = arrow_normalize.load_or_create_schema(arrow_normalize.schema_storage, "evolution")
+    assert s.get_table_columns("doc")["double"]["data_type"] == "double"
+
+
+def test_normalize_arrow_items_parquet() -> None:
+    from dlt.common.libs.pyarrow import pyarrow
+
+    caps = JSONL_CAPS[1]()
+    caps.preferred_loader_file_format = "parquet"
+    with Container().injectable_context(caps):
+        for normalize in init_normalize(jsonl_items_normalizer="arrow"):
+            tables = []
+            for _ in range(2):
+                load_id = extract_and_normalize_cases(normalize, ["github.issues.load_page_5_duck"])
+                _, table_files = expect_load_package(normalize.load_storage, load_id, ["issues", "issues__labels", "issues__assignees"], full_schema_update=False)
+                assert len(table_files["issues"]) == 1
+                tables.append(pyarrow.parquet.read_table(normalize.load_storage.storage.make_full_path(table_files["issues"][0])))
+            # second pass is written from arrow tables, data must be identical except load id and row keys
+            row_table, arrow_table = [t.drop(["_dlt_load_id", "_dlt_id"]) for t in tables]
+            assert arrow_table.num_rows == 100
+            assert arrow_table.schema == row_table.schema
+            assert arrow_table.equals(row_table)
+
+
+
+def test_normalize_arrow_items_parquet_typed() -> None:
+    from dlt.common.libs.pyarrow import pyarrow
+    from dlt.common.json import custom_pua_encode
+    from dlt.normalize.items_normalizers import ArrowItemsNormalizer
+
+    typed_keys = ("decimal", "datetime", "date", "time", "bytes", "hexbytes")
+    doc = {
+        "str": "text", "int": 1, "double": 1.5, "bool": True,
+        **{k: JSON_TYPED_DICT[k] for k in typed_keys}
+    }
+    docs = [doc, {**doc, "double": 2, "str": None}]
+    caps = JSONL_CAPS[1]()
+    caps.preferred_loader_file_format = "parquet"
+    with Container().injectable_context(caps):
+        for normalize in init_normalize(jsonl_items_normalizer="arrow"):
+            tables = []
+            for _ in range(2):
+                extract_items(normalize.normalize_storage, docs, "typed", "doc")
+                load_id = normalize_pending(normalize, "typed")
+                _, table_files = expect_load_package(normalize.load_storage, load_id, ["doc"], full_schema_update=False)
+                tables.append(pyarrow.parquet.read_table(normalize.load_storage.storage.make_full_path(table_files["doc"][0])))
+            # pua encoded values are parsed by arrow, second pass must be identical to the first one normalized row by row
+            row_table, arrow_table = [t.drop(["_dlt_load_id", "_dlt_id"]) for t in tables]
+            assert arrow_table.equals(row_table)
+
+            # decimals, timestamps and dates are cast from strings, other values are decoded in python
+            schema = normalize.load_or_create_schema(normalize.schema_storage, "typed")
+            rows = [{k: custom_pua_encode(v) if k in typed_keys else v for k, v in d.items()} for d in docs]
+            batch = ArrowItemsNormalizer()._coerce_columns(schema, "doc", rows)
+            assert batch.column("datetime").type == pyarrow.timestamp("us", "UTC")
+            assert batch.column("decimal").to_pylist() == [JSON_TYPED_DICT["decimal"]] * 2
+            assert batch.column("double").to_pylist() == [1.5, 2.0]
+            assert batch.column("bytes").to_pylist() == [JSON_TYPED_DICT["bytes"]] * 2
+            # complex values are stored as json without pua markers
+            schema.tables["doc"]["columns"]["props"] = {"name": "props", "data_type": "complex", "nullable": True}
+            batch = ArrowItemsNormalizer()._coerce_columns(schema, "doc", [{"props": {"decimal": custom_pua_encode(JSON_TYPED_DICT["decimal"])}}])
+            assert json.loads(batch.column("props")[0].as_py()) == {"decimal": str(JSON_TYPED_DICT["decimal"])}
+            # variant requires schema change
+            assert ArrowItemsNormalizer()._coerce_columns(schema, "doc", [*rows, {"int": "one"}]) is None
+
+
+def test_group_worker_ranges() -> None:
+    ranges = [TExtractedItemsRange("f%03d" % idx, 0, None, 10) for idx in range(0, 8)]
+
+    assert Normalize.group_worker_ranges([], 4) == []
+    assert Normalize.group_worker_ranges(ranges[:1], 4) == [ranges[:1]]
+    assert Normalize.group_worker_ranges(ranges[:4], 4) == [[r] for r in ranges[:4]]
+    assert Normalize.group_worker_ranges(list(reversed(ranges)), 4) == [ranges[0:2], ranges[2:4], ranges[4:6], ranges[6:8]]
+    # balanced by bytes not by number of ranges
+    big_file = [TExtractedItemsRange("big", start, start + 10, 10) for start in range(0, 60, 10)]
+    groups = Normalize.group_worker_ranges([TExtractedItemsRange("small", 0, None, 1), *big_file], 3)
+    assert groups == [big_file[0:2], big_file[2:4], [*big_file[4:6], TExtractedItemsRange("small", 0, None, 1)]]
+
+
+def test_combine_files_skips_jobs_without_writer(raw_normalize: Normalize) -> None:
+    raw_normalize.config.combine_files_max_bytes = 1024 * 1024
+    jobs_folder = os.path.join("{load_id}", LoadStorage.NEW_JOBS_FOLDER)
+
+    def _write_jobs(schema: Schema, load_id: str, files: Sequence[str]) -> TMapFuncRV:
+        # reference and sql jobs have no writer, jsonl jobs are combined
+        for file_format in ("jsonl", "jsonl", "reference", "reference", "sql", "sql"):
+            job_name = f"items.{uniq_id()}.0.{file_format}"
+            content = '{"id": 1}\n' if file_format == "jsonl" else "s3://bucket/items.parquet"
+            raw_normalize.load_storage.storage.save(os.path.join(jobs_folder.format(load_id=load_id), job_name), content)
+        return [], {}
 
-    files = ["f%03d" % idx for idx in range(0, 100)]
+    load_id = uniq_id()
+    raw_normalize.load_storage.create_temp_load_package(load_id)
+    raw_normalize.spool_files("event", load_id, _write_jobs, [])
+    new_jobs = raw_normalize.load_storage.storage.list_folder_files(os.path.join(raw_normalize.load_storage.get_package_path(load_id), LoadStorage.NEW_JOBS_FOLDER))
+    assert sorted(LoadStorage.parse_job_file_name(job).file_format for job in new_jobs) == ["jsonl", "reference", "reference", "sql", "sql"]
 
-    assert Normalize.group_worker_files([], 4) == []
-    assert Normalize.group_worker_files(["f001"], 1) == [["f001"]]
-    assert Normalize.group_worker_files(["f001"], 100) == [["f001"]]
-    assert Normalize.group_worker_files(files[:4], 4) == [["f000"], ["f001"], ["f002"], ["f003"]]
-    assert Normalize.group_worker_files(files[:5], 4) == [["f000"], ["f001"], ["f002"], ["f003", "f004"]]
-    assert Normalize.group_worker_files(files[:8], 4) == [["f000", "f001"], ["f002", "f003"], ["f004", "f005"], ["f006", "f007"]]
-    assert Normalize.group_worker_files(files[:8], 3) == [["f000", "f001"], ["f002", "f003", "f006"], ["f004", "f005", "f007"]]
-    assert Normalize.group_worker_files(files[:5], 3) == [["f000"], ["f001", "f003"], ["f002", "f004"]]
 
-    # check if sorted
-    files = ["tab1.1", "chd.3", "tab1.2", "chd.4", "tab1.3"]
-    assert Normalize.group_worker_files(files, 3) == [["chd.3"], ["chd.4", "tab1.2"], ["tab1.1", "tab1.3"]]
+def test_map_parallel_raises_on_signal(raw_normalize: Normalize) -> None:
+    class _StalledPool:
+        _processes = 2
+
+        def apply_async(self, *args, **kwargs) -> None:
+            # workers never complete
+            pass
+
+    extract_items(raw_normalize.normalize_storage, [{"id": 1}], "event", "event")
+    files = raw_normalize.normalize_storage.list_files_to_normalize_sorted()
+    raw_normalize.pool = _StalledPool()  # type: ignore[assignment]
+    raw_normalize.RESULT_POLL_INTERVAL = 0.01
+    schema = raw_normalize.load_or_create_schema(raw_normalize.schema_storage, "event")
+    with patch("dlt.normalize.normalize.signals.raise_if_signalled", side_effect=SignalReceivedException(2)):
+        with pytest.raises(SignalReceivedException):
+            raw_normalize.map_parallel(schema, uniq_id(), files)
 
 
 EXPECTED_ETH_TABLES = ["blocks", "blocks__transactions", "blocks__transactions__logs", "blocks__transactions__logs__topics",
@@ -360,10 +637,10 @@ EXPECTED_USER_TABLES = ["event", "event__parse_data__intent_ranking", "event__pa
          "event__parse_data__response_selector__default__response__responses"]
 
 
-def extract_items(normalize_storage: NormalizeStorage, items: Sequence[StrAny], schema_name: str, table_name: str) -> None:
-    extractor = ExtractorStorage(normalize_storage.config)
+def extract_items(normalize_storage: NormalizeStorage, items: Sequence[StrAny], schema_name: str, table_name: str, items_file_format: TLoaderFileFormat = "puae-jsonl") -> None:
+    extractor = ExtractorStorage(normalize_storage.config, items_file_format)
     extract_id = extractor.create_extract_id()
-    extractor.write_data_item("puae-jsonl", extract_id, schema_name, table_name, items, None)
+    extractor.write_data_item(items_file_format, extract_id, schema_name, table_name, items, None)
     extractor.close_writers(extract_id)
     extractor.commit_extract_files(extract_id)
 
@@ -427,6 +704,23 @@ def expect_load_package(load_storage: LoadStorage, load_id: str, expected_tables
     return expected_tables, ofl
 
 
+def read_load_rows(load_storage: LoadStorage, loaded_files: List[str]) -> List[StrAny]:
+    """Reads rows from jsonl or insert_values load files. Values are parsed only if they do not contain commas"""
+    rows: List[StrAny] = []
+    for file in loaded_files:
+        with load_storage.storage.open_file(file) as f:
+            lines = f.readlines()
+        if file.endswith("jsonl"):
+            rows.extend(json.loads(line) for line in lines)
+            continue
+        # insert_values: header with column names is followed by VALUES and a row per line
+        columns = [c.strip().strip('"`') for c in lines[0][lines[0].index("(") + 1:lines[0].rindex(")")].split(",")]
+        for line in lines[2:]:
+            values = [v.strip().strip("'") for v in line.strip().rstrip(",;")[1:-1].split(",")]
+            rows.append(dict(zip(columns, values)))
+    return rows
+
+
 def get_line_from_file(load_storage: LoadStorage, loaded_files: List[str], return_line: int = 0) -> Tuple[str, int]:
     lines = []
     for file in loaded_files: